@@ -1,17 +1,32 @@
 """Languages API endpoint - lists available languages with metadata."""
 
+from typing import Any, Dict, List, Tuple
+
 from fastapi import APIRouter, Depends
+from pydantic import TypeAdapter
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import Language, TextSegment, TextWork
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
+from app.core.http_cache import conditional_cache
+from app.core.shared_cache import read_through
+from app.db.models import Language, LanguageStats
 from app.db.session import get_db
 from app.lesson.language_config import get_language_config
 
 router = APIRouter(prefix="/languages", tags=["Languages"])
 
+# Merged response keyed on the corpus version, so ingestion (which refreshes
+# language_stats and bumps the version) invalidates it.
+_LANGUAGES_CACHE: AsyncTTLCache[Tuple[Any, ...], Any] = AsyncTTLCache(
+    ttl=settings.LANGUAGES_CACHE_TTL,
+    max_bytes=1024 * 1024,
+)
+_LANGUAGES_ADAPTER = TypeAdapter(List[Dict[str, Any]])
+
 
-@router.get("")
+@router.get("", dependencies=[Depends(conditional_cache(settings.LANGUAGES_CACHE_MAX_AGE))])
 async def list_languages(session: AsyncSession = Depends(get_db)):
     """List all available languages with text content status.
 
@@ -20,19 +35,22 @@ async def list_languages(session: AsyncSession = Depends(get_db)):
     - Whether texts are available for reading
     - Text content statistics
     - Ordered by display_order from LANGUAGE_LIST.md
+
+    Responses carry an ETag; a matching ``If-None-Match`` returns 304.
     """
-    # Query languages with text work counts
-    stmt = (
-        select(
-            Language,
-            func.count(func.distinct(TextWork.id)).label("work_count"),
-            func.count(TextSegment.id).label("segment_count"),
-        )
-        .outerjoin(TextWork, Language.id == TextWork.language_id)
-        .outerjoin(TextSegment, TextWork.id == TextSegment.work_id)
-        .group_by(Language.id)
+    return await read_through(
+        _LANGUAGES_CACHE, "languages", (), lambda: _load_languages(session), _LANGUAGES_ADAPTER
     )
 
+
+async def _load_languages(session: AsyncSession) -> List[Dict[str, Any]]:
+    # One row per language from the precomputed totals (see app.ingestion.structure_index)
+    stmt = select(
+        Language,
+        func.coalesce(LanguageStats.work_count, 0).label("work_count"),
+        func.coalesce(LanguageStats.segment_count, 0).label("segment_count"),
+    ).outerjoin(LanguageStats, LanguageStats.language_id == Language.id)
+
     result = await session.execute(stmt)
     rows = result.all()
 
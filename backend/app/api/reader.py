@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import asyncio
+import base64
 import json
 import logging
+import re
 import unicodedata
-from time import monotonic
-from typing import Any, Dict, Iterable, List, Tuple
-
-from fastapi import APIRouter, Depends, HTTPException, Query
-from pydantic import AliasChoices, BaseModel, Field
-from sqlalchemy import func, select, text
+from typing import Any, AsyncIterator, Awaitable, Dict, Iterable, List, Optional, Tuple, TypeVar
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from pydantic import AliasChoices, BaseModel, Field, TypeAdapter, field_validator
+from sqlalchemy import Integer, String, bindparam, exists, select, text, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.models import Language, SourceDoc, TextSegment, TextWork
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
+from app.core.http_cache import conditional_cache, mark_uncacheable
+from app.core.shared_cache import read_stale, read_through
+from app.db.models import Language, SourceDoc, TextSegment, TextWork, TextWorkStructure, TextWorkSummary
 from app.db.session import SessionLocal, get_db
 from app.ingestion.normalize import accent_fold
+from app.ingestion.structure_index import STRUCTURE_SELECT_SQL, SUMMARY_SELECT_SQL
 from app.ling.morph import analyze_tokens
 from app.models.reader import (
     BookInfo,
@@ -24,38 +34,29 @@ from app.models.reader import (
     TextStructureResponse,
     TextWorkInfo,
 )
+from app.retrieval.fusion import FUSION_STRATEGIES
 from app.retrieval.hybrid import hybrid_search
 
 router = APIRouter(prefix="/reader")
 
 _LOGGER = logging.getLogger("app.api.reader")
 
-_CACHE_TTL_SECONDS = 600
-_MAX_CACHE_SIZE = 64
-
-_TEXT_CACHE: Dict[str, tuple[float, List[TextWorkInfo]]] = {}
-_STRUCTURE_CACHE: Dict[int, tuple[float, TextStructure]] = {}
-_SEGMENT_CACHE: Dict[tuple[int, str, str], tuple[float, Tuple[List[SegmentWithMeta], Dict[str, Any]]]] = {}
+_NDJSON_MEDIA_TYPE = "application/x-ndjson"
+_MAX_BATCH_LINES = 500
+_MAX_SEGMENT_PAGE = 1000
 
+T = TypeVar("T")
 
-def _cache_get(store: Dict[Any, tuple[float, Any]], key: Any) -> Any | None:
-    entry = store.get(key)
-    if not entry:
-        return None
-    timestamp, value = entry
-    age = monotonic() - timestamp
-    if age > _CACHE_TTL_SECONDS:
-        store.pop(key, None)
-        _LOGGER.debug("Evicted stale cache entry for key=%s (age=%.2fs)", key, age)
-        return None
-    return value
-
-
-def _cache_set(store: Dict[Any, tuple[float, Any]], key: Any, value: Any) -> None:
-    store[key] = (monotonic(), value)
-    if len(store) > _MAX_CACHE_SIZE:
-        oldest_key = min(store.items(), key=lambda item: item[1][0])[0]
-        store.pop(oldest_key, None)
+# Read-through cache for text lists, structures and segment ranges, backed by the
+# shared Redis tier. Entries past their TTL are kept (until evicted) as a
+# fallback when the database is down.
+_READER_CACHE: AsyncTTLCache[tuple[Any, ...], Any] = AsyncTTLCache(
+    ttl=settings.READER_CACHE_TTL,
+    max_bytes=settings.READER_CACHE_MAX_BYTES,
+)
+_TEXTS_ADAPTER = TypeAdapter(List[TextWorkInfo])
+_STRUCTURE_ADAPTER = TypeAdapter(TextStructure)
+_SEGMENTS_ADAPTER = TypeAdapter(Tuple[List[SegmentWithMeta], Dict[str, Any], Optional[str]])
 
 
 class AnalyzeRequest(BaseModel):
@@ -68,6 +69,21 @@ class AnalyzeRequest(BaseModel):
     language: str = Field(
         default="grc-cls", description="Language code (default: grc-cls for Classical Greek)"
     )
+    fusion: str | None = Field(
+        default=None,
+        description="Retrieval fusion strategy (rrf, weighted, max, mean); defaults to the server setting",
+    )
+
+    @field_validator("fusion")
+    @classmethod
+    def _validate_fusion(cls, value: str | None) -> str | None:
+        if value is None:
+            return None
+        normalized = value.strip().lower()
+        if normalized not in FUSION_STRATEGIES:
+            allowed = ", ".join(sorted(FUSION_STRATEGIES))
+            raise ValueError(f"Unknown fusion strategy '{value}'. Allowed: {allowed}")
+        return normalized
 
 
 class TokenPayload(BaseModel):
@@ -105,8 +121,37 @@ class AnalyzeResponse(BaseModel):
     grammar: List[GrammarEntry] | None = None
 
 
-@router.post("/analyze", response_model=AnalyzeResponse)
-async def analyze(payload: AnalyzeRequest, include: str | None = Query(None)) -> AnalyzeResponse:
+class AnalyzeBatchRequest(BaseModel):
+    lines: List[str] = Field(
+        ...,
+        min_length=1,
+        max_length=_MAX_BATCH_LINES,
+        description="Lines of a passage to analyze together",
+    )
+    language: str = Field(
+        default="grc-cls", description="Language code (default: grc-cls for Classical Greek)"
+    )
+
+
+class AnalyzeBatchLine(BaseModel):
+    tokens: List[TokenPayload]
+    lexicon: List[LexiconEntry] | None = None
+
+
+class AnalyzeBatchResponse(BaseModel):
+    lines: List[AnalyzeBatchLine]
+
+
+@router.post(
+    "/analyze",
+    response_model=AnalyzeResponse,
+    responses={200: {"content": {_NDJSON_MEDIA_TYPE: {}}}},
+)
+async def analyze(
+    payload: AnalyzeRequest,
+    include: str | None = Query(None),
+    stream: bool = Query(False, description="Stream sections as NDJSON as each one completes"),
+):
     raw = payload.text.strip()
     if not raw:
         raise HTTPException(status_code=400, detail="Text cannot be empty")
@@ -114,61 +159,196 @@ async def analyze(payload: AnalyzeRequest, include: str | None = Query(None)) ->
     language = payload.language
     query_nfc = unicodedata.normalize("NFC", raw)
     token_dicts = list(_tokenize(query_nfc))
+    include_flags = _parse_include(include)
 
-    try:
-        analyses = await analyze_tokens([token["text"] for token in token_dicts], language=language)
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        _LOGGER.warning("Morphological analysis failed; returning bare tokens (lang=%s): %s", language, exc)
-        analyses = [{"lemma": None, "morph": None} for _ in token_dicts]
-    else:
-        if len(analyses) != len(token_dicts):
-            _LOGGER.warning(
-                "Morphology length mismatch (tokens=%d, analyses=%d); normalising output",
-                len(token_dicts),
-                len(analyses),
-            )
-            # Pad or trim analyses to match token length
-            padded = list(analyses)[: len(token_dicts)]
-            while len(padded) < len(token_dicts):
-                padded.append({"lemma": None, "morph": None})
-            analyses = padded
-
-    for token, analysis in zip(token_dicts, analyses):
-        token["lemma"] = (analysis or {}).get("lemma")
-        token["morph"] = (analysis or {}).get("morph")
+    if stream:
+        return StreamingResponse(
+            _stream_analysis(query_nfc, token_dicts, language, payload.fusion, include_flags),
+            media_type=_NDJSON_MEDIA_TYPE,
+        )
 
-    token_models = [TokenPayload(**token) for token in token_dicts]
-    try:
-        hits = await hybrid_search(query_nfc, language=language)
-    except Exception as exc:  # pragma: no cover - defensive fallback
-        _LOGGER.warning("Hybrid search failed; returning empty retrieval (lang=%s): %s", language, exc)
-        hits = []
-    include_flags = _parse_include(include)
+    # Dependency graph: morphology -> LSJ, alongside retrieval and grammar. Each
+    # branch has its own budget, so latency tracks the slowest branch, not the sum.
+    async def _morphology_then_lexicon() -> tuple[List[Dict[str, Any]], List[LexiconEntry] | None]:
+        analyses = await _analyze_morphology(token_dicts, language)
+        lexicon = await _run_lexicon(analyses, language) if include_flags.get("lsj") else None
+        return analyses, lexicon
 
-    lexicon_entries: List[LexiconEntry] | None = None
-    grammar_entries: List[GrammarEntry] | None = None
+    grammar_task: asyncio.Task[List[GrammarEntry] | None] | None = None
+    async with asyncio.TaskGroup() as group:
+        morphology_task = group.create_task(_morphology_then_lexicon())
+        retrieval_task = group.create_task(_run_retrieval(query_nfc, language, payload.fusion))
+        if include_flags.get("smyth"):
+            grammar_task = group.create_task(_run_grammar(query_nfc, language))
 
-    if include_flags.get("lsj"):
-        try:
-            lexicon_entries = await _lookup_lsj(analyses, language=language)
-        except Exception as exc:  # pragma: no cover - defensive fallback
-            _LOGGER.warning("Lexicon lookup failed; skipping entries (lang=%s): %s", language, exc)
-            lexicon_entries = None
-    if include_flags.get("smyth"):
-        try:
-            grammar_entries = await _lookup_smyth(query_nfc, language=language)
-        except Exception as exc:  # pragma: no cover - defensive fallback
-            _LOGGER.warning("Grammar lookup failed; skipping entries (lang=%s): %s", language, exc)
-            grammar_entries = None
+    analyses, lexicon_entries = morphology_task.result()
+    hits = retrieval_task.result()
+    grammar_entries = grammar_task.result() if grammar_task is not None else None
 
     return AnalyzeResponse(
-        tokens=token_models,
+        tokens=_apply_analyses(token_dicts, analyses),
         retrieval=[HybridHit(**hit) for hit in hits],
         lexicon=lexicon_entries,
         grammar=grammar_entries,
     )
 
 
+@router.post("/analyze/batch", response_model=AnalyzeBatchResponse)
+async def analyze_batch(
+    payload: AnalyzeBatchRequest, include: str | None = Query(None)
+) -> AnalyzeBatchResponse:
+    """Analyze many lines with one morphology lookup and one LSJ lookup for their union.
+
+    Retrieval and grammar are per-selection features and are not computed here.
+    """
+
+    language = payload.language
+    line_tokens = [list(_tokenize(unicodedata.normalize("NFC", line.strip()))) for line in payload.lines]
+    all_tokens = [token for tokens in line_tokens for token in tokens]
+
+    # analyze_tokens dedupes folds, so repeated words across lines cost one lookup.
+    analyses = await _analyze_morphology(all_tokens, language)
+
+    lexicon_by_fold: Dict[str, List[LexiconEntry]] | None = None
+    if _parse_include(include).get("lsj"):
+        entries = await _run_lexicon(analyses, language)
+        if entries is not None:
+            lexicon_by_fold = {}
+            for entry in entries:
+                lexicon_by_fold.setdefault(accent_fold(entry.lemma), []).append(entry)
+
+    lines: List[AnalyzeBatchLine] = []
+    offset = 0
+    for tokens in line_tokens:
+        line_analyses = analyses[offset : offset + len(tokens)]
+        offset += len(tokens)
+        lexicon: List[LexiconEntry] | None = None
+        if lexicon_by_fold is not None:
+            lemma_folds = dict.fromkeys(
+                accent_fold(analysis["lemma"]) for analysis in line_analyses if analysis.get("lemma")
+            )
+            lexicon = [entry for fold in lemma_folds for entry in lexicon_by_fold.get(fold, [])]
+        lines.append(AnalyzeBatchLine(tokens=_apply_analyses(tokens, line_analyses), lexicon=lexicon))
+    return AnalyzeBatchResponse(lines=lines)
+
+
+async def _stream_analysis(
+    query_nfc: str,
+    token_dicts: List[Dict[str, Any]],
+    language: str,
+    fusion: str | None,
+    include_flags: Dict[str, bool],
+) -> AsyncIterator[bytes]:
+    """Yield one NDJSON line per section, in completion order, ending with ``done``."""
+
+    yield _ndjson_line("tokens", [TokenPayload(**token) for token in token_dicts])
+
+    tasks: Dict[asyncio.Task[Any], str] = {
+        asyncio.create_task(_analyze_morphology(token_dicts, language)): "morphology",
+        asyncio.create_task(_run_retrieval(query_nfc, language, fusion)): "retrieval",
+    }
+    if include_flags.get("smyth"):
+        tasks[asyncio.create_task(_run_grammar(query_nfc, language))] = "grammar"
+
+    try:
+        while tasks:
+            done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                section = tasks.pop(task)
+                result = task.result()
+                if section == "morphology":
+                    yield _ndjson_line("morphology", _apply_analyses(token_dicts, result))
+                    if include_flags.get("lsj"):
+                        tasks[asyncio.create_task(_run_lexicon(result, language))] = "lexicon"
+                elif section == "retrieval":
+                    yield _ndjson_line(section, [HybridHit(**hit) for hit in result])
+                else:
+                    yield _ndjson_line(section, result)
+    finally:
+        # Client went away mid-stream: don't leave lookups running.
+        for task in tasks:
+            task.cancel()
+
+    yield _ndjson_line("done", None)
+
+
+def _ndjson_line(section: str, data: Any) -> bytes:
+    if isinstance(data, list):
+        data = [item.model_dump() if isinstance(item, BaseModel) else item for item in data]
+    return (json.dumps({"section": section, "data": data}, ensure_ascii=False) + "\n").encode("utf-8")
+
+
+async def _within_budget(
+    branch: str, awaitable: Awaitable[T], budget: float, fallback: T, language: str
+) -> T:
+    """Await one analyze branch, degrading to ``fallback`` on timeout or error."""
+
+    try:
+        async with asyncio.timeout(budget if budget > 0 else None):
+            return await awaitable
+    except TimeoutError:
+        _LOGGER.warning("Reader %s exceeded its %.2fs budget; skipping (lang=%s)", branch, budget, language)
+    except Exception as exc:  # pragma: no cover - defensive fallback
+        _LOGGER.warning("Reader %s failed; skipping (lang=%s): %s", branch, language, exc)
+    return fallback
+
+
+async def _analyze_morphology(token_dicts: List[Dict[str, Any]], language: str) -> List[Dict[str, Any]]:
+    bare = [{"lemma": None, "morph": None} for _ in token_dicts]
+    analyses = await _within_budget(
+        "morphology",
+        analyze_tokens([token["text"] for token in token_dicts], language=language),
+        settings.READER_MORPH_BUDGET,
+        bare,
+        language,
+    )
+    if len(analyses) != len(token_dicts):
+        _LOGGER.warning(
+            "Morphology length mismatch (tokens=%d, analyses=%d); normalising output",
+            len(token_dicts),
+            len(analyses),
+        )
+        # Pad or trim analyses to match token length
+        padded = list(analyses)[: len(token_dicts)]
+        while len(padded) < len(token_dicts):
+            padded.append({"lemma": None, "morph": None})
+        analyses = padded
+    return analyses
+
+
+def _apply_analyses(token_dicts: List[Dict[str, Any]], analyses: List[Dict[str, Any]]) -> List[TokenPayload]:
+    tokens: List[TokenPayload] = []
+    for token, analysis in zip(token_dicts, analyses):
+        tokens.append(
+            TokenPayload(
+                **{**token, "lemma": (analysis or {}).get("lemma"), "morph": (analysis or {}).get("morph")}
+            )
+        )
+    return tokens
+
+
+async def _run_retrieval(query: str, language: str, fusion: str | None) -> List[Dict[str, Any]]:
+    return await _within_budget(
+        "retrieval",
+        hybrid_search(query, language=language, fusion=fusion),
+        settings.READER_RETRIEVAL_BUDGET,
+        [],
+        language,
+    )
+
+
+async def _run_lexicon(analyses: List[Dict[str, Any]], language: str) -> List[LexiconEntry] | None:
+    return await _within_budget(
+        "lexicon", _lookup_lsj(analyses, language=language), settings.READER_LEXICON_BUDGET, None, language
+    )
+
+
+async def _run_grammar(query: str, language: str) -> List[GrammarEntry] | None:
+    return await _within_budget(
+        "grammar", _lookup_smyth(query, language=language), settings.READER_GRAMMAR_BUDGET, None, language
+    )
+
+
 def _tokenize(text: str) -> Iterable[dict[str, Any]]:
     tokens: list[dict[str, Any]] = []
     start: int | None = None
@@ -313,11 +493,14 @@ _SMYTH_FALLBACK_SQL = text(
 # =============================================================================
 
 
-@router.get("/texts", response_model=TextListResponse)
-async def get_texts(language: str = Query("grc-cls"), db: AsyncSession = Depends(get_db)) -> TextListResponse:
+@router.get("/texts", response_model=TextListResponse, dependencies=[Depends(conditional_cache())])
+async def get_texts(
+    response: Response, language: str = Query("grc-cls"), db: AsyncSession = Depends(get_db)
+) -> TextListResponse:
     """Get all available text works for a language.
 
     Args:
+        response: Outgoing response (degraded results are marked uncacheable)
         language: Language code (default: "grc-cls" for Classical Greek)
         db: Database session
 
@@ -327,42 +510,14 @@ async def get_texts(language: str = Query("grc-cls"), db: AsyncSession = Depends
     Raises:
         HTTPException: 503 if database connection fails, 404 if language not found
     """
-    # Query text works with source and segment counts
-    preview_subquery = (
-        select(TextSegment.text_nfc)
-        .where(TextSegment.work_id == TextWork.id)
-        .where(func.length(func.trim(TextSegment.text_nfc)) > 0)
-        .order_by(TextSegment.id)
-        .limit(1)
-        .scalar_subquery()
-    )
-
-    stmt = (
-        select(
-            TextWork.id,
-            TextWork.author,
-            TextWork.title,
-            Language.code.label("language"),
-            TextWork.ref_scheme,
-            func.count(TextSegment.id).label("segment_count"),
-            SourceDoc.title.label("source_title"),
-            SourceDoc.license,
-            preview_subquery.label("preview"),
-        )
-        .join(Language, Language.id == TextWork.language_id)
-        .join(SourceDoc, SourceDoc.id == TextWork.source_id)
-        .outerjoin(TextSegment, TextSegment.work_id == TextWork.id)
-        .where(Language.code == language)
-        .where(TextWork.title.notin_(["Contract Fixture Work", "Common Greek Phrases and Sentences"]))
-        .group_by(TextWork.id, Language.code, SourceDoc.title, SourceDoc.license)
-        .order_by(TextWork.author, TextWork.title)
-    )
-
+    cache_key = (language,)
     try:
-        result = await db.execute(stmt)
-        rows = result.all()
+        texts = await read_through(
+            _READER_CACHE, "reader.texts", cache_key, lambda: _load_texts(db, language), _TEXTS_ADAPTER
+        )
     except Exception as exc:
-        cached_texts = _cache_get(_TEXT_CACHE, language)
+        mark_uncacheable(response)
+        cached_texts = read_stale(_READER_CACHE, "reader.texts", cache_key)
         if cached_texts is not None:
             _LOGGER.warning(
                 "Falling back to cached text list for language=%s after error: %s",
@@ -378,9 +533,43 @@ async def get_texts(language: str = Query("grc-cls"), db: AsyncSession = Depends
         )
         return TextListResponse(texts=[])
 
+    return TextListResponse(texts=texts)
+
+
+async def _load_texts(db: AsyncSession, language: str) -> List[TextWorkInfo]:
+    # One indexed read of the precomputed catalog (rebuilt by ingestion); works
+    # without a summary row are computed live, without writing.
+    stmt = (
+        select(
+            TextWork.id,
+            TextWork.author,
+            TextWork.title,
+            Language.code.label("language"),
+            TextWork.ref_scheme,
+            TextWorkSummary.work_id.label("summary_work_id"),
+            TextWorkSummary.segment_count,
+            TextWorkSummary.source_title,
+            TextWorkSummary.license,
+            TextWorkSummary.preview,
+        )
+        .join(Language, Language.id == TextWork.language_id)
+        .outerjoin(TextWorkSummary, TextWorkSummary.work_id == TextWork.id)
+        .where(Language.code == language)
+        .where(TextWork.title.notin_(["Contract Fixture Work", "Common Greek Phrases and Sentences"]))
+        .order_by(TextWork.author, TextWork.title)
+    )
+
+    rows = (await db.execute(stmt)).all()
+
     texts = []
     for row in rows:
-        license_info = row.license or {}
+        summary: Any = row
+        if row.summary_work_id is None:
+            _LOGGER.info(
+                "Work %s has no catalog summary; computing it live until ingestion rebuilds it", row.id
+            )
+            summary = (await db.execute(text(SUMMARY_SELECT_SQL), {"work_id": row.id})).one()
+        license_info = summary.license or {}
         texts.append(
             TextWorkInfo(
                 id=row.id,
@@ -388,28 +577,29 @@ async def get_texts(language: str = Query("grc-cls"), db: AsyncSession = Depends
                 title=row.title,
                 language=row.language,
                 ref_scheme=row.ref_scheme,
-                segment_count=row.segment_count,
+                segment_count=summary.segment_count,
                 license_name=license_info.get("name", "Unknown"),
                 license_url=license_info.get("url"),
-                source_title=row.source_title,
-                preview=row.preview,
+                source_title=summary.source_title,
+                preview=summary.preview,
             )
         )
-
-    _cache_set(
-        _TEXT_CACHE,
-        language,
-        [text.model_copy(deep=True) for text in texts],
-    )
-    return TextListResponse(texts=texts)
+    return texts
 
 
-@router.get("/texts/{text_id}/structure", response_model=TextStructureResponse)
-async def get_text_structure(text_id: int, db: AsyncSession = Depends(get_db)) -> TextStructureResponse:
+@router.get(
+    "/texts/{text_id}/structure",
+    response_model=TextStructureResponse,
+    dependencies=[Depends(conditional_cache())],
+)
+async def get_text_structure(
+    text_id: int, response: Response, db: AsyncSession = Depends(get_db)
+) -> TextStructureResponse:
     """Get structural metadata for a text work (books/chapters/pages).
 
     Args:
         text_id: Text work ID
+        response: Outgoing response (stale fallbacks are marked uncacheable)
         db: Database session
 
     Returns:
@@ -418,19 +608,26 @@ async def get_text_structure(text_id: int, db: AsyncSession = Depends(get_db)) -
     Raises:
         HTTPException: 404 if text not found, 503 if database connection fails
     """
-    # Get text work
+    cache_key = (text_id,)
     try:
-        stmt = select(TextWork).where(TextWork.id == text_id)
-        result = await db.execute(stmt)
-        work = result.scalar_one_or_none()
-    except Exception as exc:
-        cached = _cache_get(_STRUCTURE_CACHE, text_id)
+        structure = await read_through(
+            _READER_CACHE,
+            "reader.structure",
+            cache_key,
+            lambda: _load_structure(db, text_id),
+            _STRUCTURE_ADAPTER,
+        )
+    except HTTPException:
+        raise
+    except (SQLAlchemyError, OSError) as exc:
+        cached = read_stale(_READER_CACHE, "reader.structure", cache_key)
         if cached is not None:
             _LOGGER.warning(
                 "Falling back to cached structure for text_id=%d after error: %s",
                 text_id,
                 exc,
             )
+            mark_uncacheable(response)
             return TextStructureResponse(structure=cached)
         _LOGGER.error("Database query failed for /reader/texts/%d/structure: %s", text_id, exc, exc_info=True)
         raise HTTPException(
@@ -438,60 +635,55 @@ async def get_text_structure(text_id: int, db: AsyncSession = Depends(get_db)) -
             detail="Database connection failed. Please try again in a moment.",
         ) from exc
 
-    if not work:
+    return TextStructureResponse(structure=structure)
+
+
+async def _load_structure(db: AsyncSession, text_id: int) -> TextStructure:
+    # Get text work with its precomputed structure index
+    stmt = (
+        select(TextWork, TextWorkStructure)
+        .outerjoin(TextWorkStructure, TextWorkStructure.work_id == TextWork.id)
+        .where(TextWork.id == text_id)
+    )
+    result = await db.execute(stmt)
+    row = result.first()
+
+    if not row:
         raise HTTPException(status_code=404, detail=f"Text work {text_id} not found")
 
+    work, index = row
+    if index is not None:
+        payload = index.structure or {}
+    else:
+        # No index row yet (ingestion rebuilds it); compute it live without writing.
+        _LOGGER.info("Work %s has no structure index; computing it live until ingestion rebuilds it", work.id)
+        live = (await db.execute(text(STRUCTURE_SELECT_SQL), {"work_id": work.id})).one()
+        payload = live.structure or {}
+
     structure = TextStructure(
         text_id=work.id, title=work.title, author=work.author, ref_scheme=work.ref_scheme
     )
-
     if work.ref_scheme == "book.line":
-        # For Homer: get book metadata
-        stmt = text(
-            """
-            SELECT
-                (meta->>'book')::int AS book,
-                COUNT(*) AS line_count,
-                MIN((meta->>'line')::int) AS first_line,
-                MAX((meta->>'line')::int) AS last_line
-            FROM text_segment
-            WHERE work_id = :work_id
-            GROUP BY book
-            ORDER BY book
-            """
-        )
-        result = await db.execute(stmt, {"work_id": work.id})
-        rows = result.fetchall()
-
-        structure.books = [
-            BookInfo(
-                book=row.book, line_count=row.line_count, first_line=row.first_line, last_line=row.last_line
-            )
-            for row in rows
-        ]
-
+        structure.books = [BookInfo(**book) for book in payload.get("books", [])]
     elif work.ref_scheme == "stephanus":
-        # For Plato: get list of pages
-        stmt = text(
-            """
-            SELECT DISTINCT meta->>'page' AS page
-            FROM text_segment
-            WHERE work_id = :work_id
-            ORDER BY page
-            """
-        )
-        result = await db.execute(stmt, {"work_id": work.id})
-        rows = result.fetchall()
+        structure.pages = [page for page in payload.get("pages", []) if page]
 
-        structure.pages = [row.page for row in rows if row.page]
+    return structure
 
-    _cache_set(_STRUCTURE_CACHE, text_id, structure.model_copy(deep=True))
-    return TextStructureResponse(structure=structure)
 
-
-@router.get("/texts/{text_id}/segments", response_model=TextSegmentsResponse)
+@router.get(
+    "/texts/{text_id}/segments",
+    response_model=TextSegmentsResponse,
+    dependencies=[Depends(conditional_cache())],
+)
 async def get_text_segments(
-    text_id: int, ref_start: str = Query(...), ref_end: str = Query(...), db: AsyncSession = Depends(get_db)
+    text_id: int,
+    response: Response,
+    ref_start: str = Query(...),
+    ref_end: str = Query(...),
+    limit: int = Query(_MAX_SEGMENT_PAGE, ge=1, le=_MAX_SEGMENT_PAGE),
+    after: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: AsyncSession = Depends(get_db),
 ) -> TextSegmentsResponse:
     """Get text segments within a reference range.
 
@@ -499,27 +691,32 @@ async def get_text_segments(
         text_id: Text work ID
         ref_start: Starting reference (e.g., "Il.1.1", "Apol.17a")
         ref_end: Ending reference (e.g., "Il.1.50", "Apol.20e")
+        response: Outgoing response (stale fallbacks are marked uncacheable)
+        limit: Maximum number of segments per page
+        after: Keyset cursor returned as ``next_cursor`` by the previous page
         db: Database session
 
     Returns:
-        List of text segments with metadata
+        List of text segments with metadata, plus ``next_cursor`` when more remain
 
     Raises:
-        HTTPException: 404 if text not found, 503 if database connection fails
+        HTTPException: 400 for a malformed cursor, 404 if text not found,
+            503 if database connection fails
     """
-    # Get text work and source info
-    cache_key = (text_id, ref_start, ref_end)
+    cursor = _decode_cursor(after) if after else None
+    cache_key = (text_id, ref_start, ref_end, limit, after)
     try:
-        stmt = (
-            select(TextWork, SourceDoc)
-            .join(SourceDoc, SourceDoc.id == TextWork.source_id)
-            .where(TextWork.id == text_id)
+        segments, text_info, next_cursor = await read_through(
+            _READER_CACHE,
+            "reader.segments",
+            cache_key,
+            lambda: _load_segments(db, text_id, ref_start, ref_end, limit, cursor),
+            _SEGMENTS_ADAPTER,
         )
-
-        result = await db.execute(stmt)
-        row = result.first()
-    except Exception as exc:
-        cached = _cache_get(_SEGMENT_CACHE, cache_key)
+    except HTTPException:
+        raise
+    except (SQLAlchemyError, OSError) as exc:
+        cached = read_stale(_READER_CACHE, "reader.segments", cache_key)
         if cached is not None:
             _LOGGER.warning(
                 "Falling back to cached segments for text_id=%d (%s-%s) after error: %s",
@@ -528,8 +725,11 @@ async def get_text_segments(
                 ref_end,
                 exc,
             )
-            segments_cached, info_cached = cached
-            return TextSegmentsResponse(segments=segments_cached, text_info=info_cached)
+            mark_uncacheable(response)
+            segments_cached, info_cached, next_cached = cached
+            return TextSegmentsResponse(
+                segments=segments_cached, text_info=info_cached, next_cursor=next_cached
+            )
         _LOGGER.error(
             "Database query failed for /reader/texts/%d/segments (ref_start=%s, ref_end=%s): %s",
             text_id,
@@ -543,110 +743,201 @@ async def get_text_segments(
             detail="Database connection failed. Please try again in a moment.",
         ) from exc
 
-    if not row:
-        raise HTTPException(status_code=404, detail=f"Text work {text_id} not found")
+    return TextSegmentsResponse(segments=segments, text_info=text_info, next_cursor=next_cursor)
+
+
+async def _load_segments(
+    db: AsyncSession,
+    text_id: int,
+    ref_start: str,
+    ref_end: str,
+    limit: int,
+    cursor: Tuple[List[int] | str | None, int] | None,
+) -> Tuple[List[SegmentWithMeta], Dict[str, Any], str | None]:
+    work, source = await _load_work(db, text_id)
+
+    # Ranges are index range scans on (work_id, sort_key, id). Schemes without a
+    # sort key, and works with segments lacking one (e.g. written before the
+    # trigger existed), fall back to ordering by the ref string. Malformed refs
+    # under a keyed scheme match nothing: string order would put "1.10" before "1.2".
+    by_sort_key = _has_sort_key_scheme(work.ref_scheme)
+    start_key = _ref_sort_key(work.ref_scheme, ref_start)
+    end_key = _ref_sort_key(work.ref_scheme, ref_end, upper=True)
+    if by_sort_key and (start_key is None or end_key is None):
+        return [], _text_info(work, source), None
+    if by_sort_key and await _has_unkeyed_segments(db, text_id):
+        by_sort_key = False
+    if by_sort_key:
+        order_col, position_type = TextSegment.sort_key, ARRAY(Integer)
+        range_start, range_end = start_key, end_key
+    else:
+        order_col, position_type = TextSegment.ref, String()
+        range_start, range_end = ref_start, ref_end
+
+    stmt = select(
+        TextSegment.id, TextSegment.ref, TextSegment.text_raw, TextSegment.meta, order_col.label("position")
+    ).where(
+        TextSegment.work_id == text_id,
+        order_col >= bindparam("range_start", range_start, type_=position_type),
+        order_col <= bindparam("range_end", range_end, type_=position_type),
+    )
+    if cursor is not None:
+        position, last_id = cursor
+        if position is None or isinstance(position, str) == by_sort_key:
+            raise HTTPException(status_code=400, detail="Cursor does not match this range")
+        stmt = stmt.where(
+            tuple_(order_col, TextSegment.id)
+            > tuple_(
+                bindparam("after_position", position, type_=position_type), bindparam("after_id", last_id)
+            )
+        )
+    stmt = stmt.order_by(order_col, TextSegment.id).limit(limit + 1)
+    rows = (await db.execute(stmt)).all()
 
-    work, source = row
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].position, rows[-1].id)
 
-    # Query segments within range - parse refs and filter by meta fields
-    if work.ref_scheme == "book.line":
-        # For Homer: parse "Il.1.1" -> book=1, line=1
-        # ref_start = "Il.1.1", ref_end = "Il.1.50"
-        start_parts = ref_start.split(".")
-        end_parts = ref_end.split(".")
-        if len(start_parts) >= 3 and len(end_parts) >= 3:
-            start_book = int(start_parts[1])
-            start_line = int(start_parts[2])
-            end_book = int(end_parts[1])
-            end_line = int(end_parts[2])
-
-            # Query with proper book/line filtering
-            if start_book == end_book:
-                # Same book - filter by line range
-                stmt = text(
-                    """
-                    SELECT id, ref, text_raw, meta
-                    FROM text_segment
-                    WHERE work_id = :work_id
-                      AND (meta->>'book')::int = :book
-                      AND (meta->>'line')::int >= :start_line
-                      AND (meta->>'line')::int <= :end_line
-                    ORDER BY (meta->>'line')::int
-                    LIMIT 1000
-                    """
-                )
-                result = await db.execute(
-                    stmt,
-                    {"work_id": text_id, "book": start_book, "start_line": start_line, "end_line": end_line},
-                )
-            else:
-                # Multiple books
-                stmt = text(
-                    """
-                    SELECT id, ref, text_raw, meta
-                    FROM text_segment
-                    WHERE work_id = :work_id
-                      AND (
-                        ((meta->>'book')::int = :start_book AND (meta->>'line')::int >= :start_line)
-                        OR ((meta->>'book')::int > :start_book AND (meta->>'book')::int < :end_book)
-                        OR ((meta->>'book')::int = :end_book AND (meta->>'line')::int <= :end_line)
-                      )
-                    ORDER BY (meta->>'book')::int, (meta->>'line')::int
-                    LIMIT 1000
-                    """
-                )
-                result = await db.execute(
-                    stmt,
-                    {
-                        "work_id": text_id,
-                        "start_book": start_book,
-                        "start_line": start_line,
-                        "end_book": end_book,
-                        "end_line": end_line,
-                    },
-                )
-            rows = result.fetchall()
-            segments_db = [
-                type("Segment", (), {"ref": r.ref, "text_raw": r.text_raw, "meta": r.meta})() for r in rows
-            ]
-        else:
-            # Malformed refs - return empty
-            segments_db = []
-    elif work.ref_scheme == "stephanus":
-        # For Plato: alphabetic page ordering works
-        stmt = text(
-            """
-            SELECT id, ref, text_raw, meta
-            FROM text_segment
-            WHERE work_id = :work_id
-              AND ref >= :ref_start
-              AND ref <= :ref_end
-            ORDER BY meta->>'page'
-            LIMIT 1000
-            """
+    segments = [SegmentWithMeta(ref=r.ref, text=r.text_raw, meta=r.meta or {}) for r in rows]
+    return segments, _text_info(work, source), next_cursor
+
+
+async def _has_unkeyed_segments(db: AsyncSession, text_id: int) -> bool:
+    stmt = select(exists().where(TextSegment.work_id == text_id, TextSegment.sort_key.is_(None)))
+    return bool((await db.execute(stmt)).scalar())
+
+
+@router.get(
+    "/texts/{text_id}/segments/all",
+    response_model=TextSegmentsResponse,
+    dependencies=[Depends(conditional_cache())],
+)
+async def get_work_segments(
+    text_id: int,
+    response: Response,
+    limit: int = Query(_MAX_SEGMENT_PAGE, ge=1, le=_MAX_SEGMENT_PAGE),
+    after: str | None = Query(None, description="Cursor from a previous page's next_cursor"),
+    db: AsyncSession = Depends(get_db),
+) -> TextSegmentsResponse:
+    """Walk a whole work in reading order, one keyset page at a time.
+
+    Pages follow the segment sort key (segments without one come last, in id
+    order), so each page is a single index scan that resumes where the previous
+    page stopped. Every page carries an ETag; a matching ``If-None-Match``
+    returns 304 so clients can cheaply re-validate a downloaded text.
+
+    Args:
+        text_id: Text work ID
+        response: Outgoing response (stale fallbacks are marked uncacheable)
+        limit: Maximum number of segments per page
+        after: Keyset cursor returned as ``next_cursor`` by the previous page
+        db: Database session
+
+    Returns:
+        One page of segments with ``next_cursor`` (null on the last page)
+
+    Raises:
+        HTTPException: 400 for a malformed cursor, 404 if text not found,
+            503 if database connection fails
+    """
+    cursor = _decode_cursor(after) if after else None
+    cache_key = (text_id, limit, after)
+    try:
+        page = await read_through(
+            _READER_CACHE,
+            "reader.work_pages",
+            cache_key,
+            lambda: _load_work_page(db, text_id, limit, cursor),
+            _SEGMENTS_ADAPTER,
         )
-        result = await db.execute(stmt, {"work_id": text_id, "ref_start": ref_start, "ref_end": ref_end})
-        rows = result.fetchall()
-        segments_db = [
-            type("Segment", (), {"ref": r.ref, "text_raw": r.text_raw, "meta": r.meta})() for r in rows
-        ]
-    else:
-        # Fallback: alphabetic ordering
+    except HTTPException:
+        raise
+    except (SQLAlchemyError, OSError) as exc:
+        page = read_stale(_READER_CACHE, "reader.work_pages", cache_key)
+        if page is None:
+            _LOGGER.error(
+                "Database query failed for /reader/texts/%d/segments/all (after=%s): %s",
+                text_id,
+                after,
+                exc,
+                exc_info=True,
+            )
+            raise HTTPException(
+                status_code=503,
+                detail="Database connection failed. Please try again in a moment.",
+            ) from exc
+        _LOGGER.warning("Falling back to cached page for text_id=%d (after=%s): %s", text_id, after, exc)
+        mark_uncacheable(response)
+
+    segments, text_info, next_cursor = page
+    return TextSegmentsResponse(segments=segments, text_info=text_info, next_cursor=next_cursor)
+
+
+async def _load_work_page(
+    db: AsyncSession, text_id: int, limit: int, cursor: Tuple[List[int] | str | None, int] | None
+) -> Tuple[List[SegmentWithMeta], Dict[str, Any], str | None]:
+    work, source = await _load_work(db, text_id)
+    position, last_id = cursor if cursor is not None else ([], 0)
+    if isinstance(position, str):
+        raise HTTPException(status_code=400, detail="Cursor does not match this endpoint")
+
+    columns = (
+        TextSegment.id,
+        TextSegment.ref,
+        TextSegment.text_raw,
+        TextSegment.meta,
+        TextSegment.sort_key.label("position"),
+    )
+    rows: List[Any] = []
+    if position is not None:
+        # Keyed segments first: one index range scan on (work_id, sort_key, id)
+        stmt = select(*columns).where(TextSegment.work_id == text_id, TextSegment.sort_key.is_not(None))
+        if cursor is not None:
+            stmt = stmt.where(
+                tuple_(TextSegment.sort_key, TextSegment.id)
+                > tuple_(
+                    bindparam("after_position", position, type_=ARRAY(Integer)),
+                    bindparam("after_id", last_id),
+                )
+            )
+        stmt = stmt.order_by(TextSegment.sort_key, TextSegment.id).limit(limit + 1)
+        rows = list((await db.execute(stmt)).all())
+        last_id = 0
+    if len(rows) <= limit:
+        # Then segments whose meta yields no sort key, in insertion order
         stmt = (
-            select(TextSegment)
-            .where(TextSegment.work_id == text_id)
-            .where(TextSegment.ref >= ref_start)
-            .where(TextSegment.ref <= ref_end)
-            .order_by(TextSegment.ref)
-            .limit(1000)
+            select(*columns)
+            .where(TextSegment.work_id == text_id, TextSegment.sort_key.is_(None), TextSegment.id > last_id)
+            .order_by(TextSegment.id)
+            .limit(limit + 1 - len(rows))
         )
-        result = await db.execute(stmt)
-        segments_db = result.scalars().all()
+        rows.extend((await db.execute(stmt)).all())
 
-    segments = [SegmentWithMeta(ref=seg.ref, text=seg.text_raw, meta=seg.meta or {}) for seg in segments_db]
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = _encode_cursor(rows[-1].position, rows[-1].id)
 
+    segments = [SegmentWithMeta(ref=r.ref, text=r.text_raw, meta=r.meta or {}) for r in rows]
+    return segments, _text_info(work, source), next_cursor
+
+
+async def _load_work(db: AsyncSession, text_id: int) -> Tuple[TextWork, SourceDoc]:
+    stmt = (
+        select(TextWork, SourceDoc)
+        .join(SourceDoc, SourceDoc.id == TextWork.source_id)
+        .where(TextWork.id == text_id)
+    )
+    row = (await db.execute(stmt)).first()
+    if not row:
+        raise HTTPException(status_code=404, detail=f"Text work {text_id} not found")
+    return row[0], row[1]
+
+
+def _text_info(work: TextWork, source: SourceDoc) -> Dict[str, Any]:
     license_info = source.license or {}
-    text_info = {
+    return {
         "author": work.author,
         "title": work.title,
         "source": source.title,
@@ -654,12 +945,65 @@ async def get_text_segments(
         "license_url": license_info.get("url"),
     }
 
-    _cache_set(
-        _SEGMENT_CACHE,
-        cache_key,
-        (
-            [segment.model_copy(deep=True) for segment in segments],
-            dict(text_info),
-        ),
+
+# Numeric meta fields in sort-key order; mirrors text_segment_sort_key() in the
+# 20251102_add_text_segment_sort_key migration.
+_SORT_KEY_FIELDS = ("book", "chapter", "verse", "line")
+_STEPHANUS_RE = re.compile(r"^(\d{1,9})([a-z]?)$")
+# Upper bound for a Stephanus page given without a section letter ("20" covers 20a-20e).
+_MAX_SECTION = 26
+
+
+def _has_sort_key_scheme(ref_scheme: str) -> bool:
+    """Whether segments of ``ref_scheme`` get a ``sort_key`` (see app.db.triggers)."""
+
+    if ref_scheme == "stephanus":
+        return True
+    fields = ref_scheme.split(".")
+    return fields == [f for f in _SORT_KEY_FIELDS if f in fields]
+
+
+def _ref_sort_key(ref_scheme: str, ref: str, *, upper: bool = False) -> List[int] | None:
+    """Sort key for ``ref`` under ``ref_scheme``, or ``None`` if it cannot be parsed.
+
+    ``"Il.1.5"`` (book.line) -> ``[1, 5]``; ``"Apol.17a"`` (stephanus) -> ``[17, 1]``.
+    """
+
+    parts = ref.strip().split(".")
+    if ref_scheme == "stephanus":
+        match = _STEPHANUS_RE.match(parts[-1])
+        if not match:
+            return None
+        page, section = match.groups()
+        if section:
+            return [int(page), ord(section) - 96]
+        return [int(page), _MAX_SECTION if upper else 0]
+
+    fields = ref_scheme.split(".")
+    if not _has_sort_key_scheme(ref_scheme) or len(parts) < len(fields):
+        return None
+    values = parts[-len(fields) :]
+    if not all(v.isdigit() and len(v) <= 9 for v in values):
+        return None
+    return [int(v) for v in values]
+
+
+def _encode_cursor(position: List[int] | str | None, segment_id: int) -> str:
+    raw = json.dumps([position, segment_id], separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> Tuple[List[int] | str | None, int]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        position, segment_id = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from exc
+    valid_position = (
+        position is None
+        or isinstance(position, str)
+        or (isinstance(position, list) and all(isinstance(v, int) for v in position))
     )
-    return TextSegmentsResponse(segments=segments, text_info=text_info)
+    if not valid_position or not isinstance(segment_id, int):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return position, segment_id
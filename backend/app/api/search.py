@@ -1,19 +1,31 @@
 from __future__ import annotations
 
+import asyncio
+import base64
+import json
+import logging
 import re
-from typing import Any, List, Sequence
+from functools import lru_cache
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from pydantic import BaseModel, Field
-from sqlalchemy import select, text
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel, Field, TypeAdapter
+from sqlalchemy import TextClause, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
+from app.core.http_cache import conditional_cache, mark_uncacheable
+from app.core.shared_cache import read_through
 from app.db.models import Language, TextWork
-from app.db.session import get_session
+from app.db.session import SessionLocal, get_session
 from app.ingestion.normalize import accent_fold
+from app.retrieval.suggest import get_lemma_index
 
 router = APIRouter()
 
+_LOGGER = logging.getLogger("app.api.search")
+
 DEFAULT_TYPES: Sequence[str] = ("lexicon", "grammar", "text")
 
 
@@ -58,6 +70,26 @@ class SearchResponse(BaseModel):
     lexicon_results: List[LexiconResult] = Field(default_factory=list)
     grammar_results: List[GrammarResult] = Field(default_factory=list)
     text_results: List[TextResult] = Field(default_factory=list)
+    timed_out: bool = Field(default=False, description="True when some result types missed the time budget")
+    next_cursors: Dict[str, str] = Field(
+        default_factory=dict,
+        description="Cursor per result type that has more results; pass it back as <type>_after",
+    )
+    estimated_totals: Dict[str, int] = Field(
+        default_factory=dict,
+        description="Matches per result type, reported on first pages and capped at SEARCH_COUNT_CAP",
+    )
+
+
+class SuggestResult(BaseModel):
+    lemma: str
+    language: str
+    lexeme_id: int
+
+
+class SuggestResponse(BaseModel):
+    query: str
+    suggestions: List[SuggestResult] = Field(default_factory=list)
 
 
 class WorkResult(BaseModel):
@@ -67,47 +99,86 @@ class WorkResult(BaseModel):
     language: str
 
 
-_LEXICON_SQL = text(
-    """
+_SEARCH_CACHE: AsyncTTLCache[tuple[Any, ...], SearchResponse] = AsyncTTLCache(
+    ttl=settings.SEARCH_CACHE_TTL,
+    max_bytes=settings.SEARCH_CACHE_MAX_BYTES,
+)
+_SEARCH_ADAPTER = TypeAdapter(SearchResponse)
+
+# (score, tie-break key, id) of the last row on a page
+_Cursor = Tuple[float, str, int]
+# One result type's page, the cursor for the next page (if more remain) and its
+# capped count (first pages only)
+_SearchPage = Tuple[list[Any], _Cursor | None, int | None]
+
+
+class _PartialSearch(Exception):
+    """Raised by the search loader when the time budget ran out, so the partial
+    response reaches the caller without being cached."""
+
+    def __init__(self, response: SearchResponse) -> None:
+        super().__init__("search time budget exceeded")
+        self.response = response
+
+
+# pg_trgm's % operator reads its threshold from a GUC; setting it transaction-locally
+# keeps index use without leaking the value into the pooled connection.
+_SET_THRESHOLD_SQL = text("SELECT set_config('pg_trgm.similarity_threshold', CAST(:threshold AS TEXT), true)")
+
+
+# Search SQL is specialized per filter combination (see _lexicon_sql and
+# friends) instead of ``CAST(:param AS ...) IS NULL OR ...`` guards, so each
+# variant gets its own prepared statement and a plan that can use the language
+# and trigram indexes. Language filters compare the denormalized language_id.
+#
+# Pages are keyed on (score DESC, key, id): ties on score keep their established
+# order by lemma / title / ref, and id makes the key unique. A cursor resumes
+# strictly after the last row returned, so later pages only rank what is left.
+_LEXICON_SCORE = "similarity(lex.lemma_fold, :query_fold)"
+_GRAMMAR_SCORE = (
+    "GREATEST(similarity(topic.body_fold, :query_fold), similarity(lower(topic.title), lower(:query_plain)))"
+)
+_TEXT_SCORE = "similarity(seg.text_fold, :query_fold)"
+
+_AFTER_FILTER_TEMPLATE = """
+      AND (
+        {score} < CAST(:after_score AS double precision)
+        OR ({score} = CAST(:after_score AS double precision)
+            AND ({key_column}, {id_column}) > (CAST(:after_key AS TEXT), CAST(:after_id AS integer)))
+      )"""
+
+_LEXICON_SQL_TEMPLATE = """
     SELECT
         lex.id,
         lex.lemma,
-        lang.code AS language,
+        {language_column} AS language,
         lex.pos,
         lex.data,
-        similarity(lex.lemma_fold, :query_fold) AS score
-    FROM lexeme AS lex
-    JOIN language AS lang ON lang.id = lex.language_id
-    WHERE (CAST(:language AS TEXT) IS NULL OR lang.code = CAST(:language AS TEXT))
-      AND lex.lemma_fold % :query_fold
-    ORDER BY score DESC, lex.lemma
+        {score} AS score
+    FROM lexeme AS lex{language_join}
+    WHERE lex.lemma_fold % :query_fold{filters}
+    ORDER BY score DESC, lex.lemma, lex.id
     LIMIT :limit
-    """
-)
+"""
 
-_GRAMMAR_SQL = text(
-    """
+_GRAMMAR_SQL_TEMPLATE = """
     SELECT
         topic.id,
         topic.title,
         topic.body,
         topic.body_fold,
         source.meta AS source_meta,
-        similarity(topic.body_fold, :query_fold) AS body_score,
-        similarity(lower(topic.title), lower(:query_plain)) AS title_score
+        {score} AS score
     FROM grammar_topic AS topic
     JOIN source_doc AS source ON source.id = topic.source_id
-    WHERE (CAST(:language AS TEXT) IS NULL OR source.meta ->> 'language' = CAST(:language AS TEXT))
-      AND (
-          topic.body_fold % :query_fold OR similarity(lower(topic.title), lower(:query_plain)) >= :threshold
-      )
-    ORDER BY GREATEST(body_score, title_score) DESC, topic.title
+    WHERE (
+        topic.body_fold % :query_fold OR similarity(lower(topic.title), lower(:query_plain)) >= :threshold
+    ){filters}
+    ORDER BY score DESC, topic.title, topic.id
     LIMIT :limit
-    """
-)
+"""
 
-_TEXT_SQL = text(
-    """
+_TEXT_SQL_TEMPLATE = """
     SELECT
         seg.id,
         seg.work_id,
@@ -115,26 +186,131 @@ _TEXT_SQL = text(
         seg.text_nfc,
         work.title AS work_title,
         work.author AS author,
-        lang.code AS language,
         seg.meta ->> 'translation' AS translation,
         seg.meta ->> 'book' AS book_meta,
         seg.meta ->> 'chapter' AS chapter_meta,
         seg.meta ->> 'line' AS line_meta,
-        similarity(seg.text_fold, :query_fold) AS score
+        {score} AS score
     FROM text_segment AS seg
     JOIN text_work AS work ON work.id = seg.work_id
-    JOIN language AS lang ON lang.id = work.language_id
-    WHERE (CAST(:language AS TEXT) IS NULL OR lang.code = CAST(:language AS TEXT))
-      AND seg.text_fold % :query_fold
-      AND (CAST(:work_id AS INTEGER) IS NULL OR seg.work_id = CAST(:work_id AS INTEGER))
-    ORDER BY score DESC, seg.ref
+    WHERE seg.text_fold % :query_fold{filters}
+    ORDER BY score DESC, seg.ref, seg.id
     LIMIT :limit
-    """
-)
+"""
+
+# estimated_totals: counting stops at :cap rows, so a common word costs at most
+# SEARCH_COUNT_CAP index hits instead of a full count over every match.
+_COUNT_SQL_TEMPLATE = """
+    SELECT count(*) FROM (
+        SELECT 1
+        FROM {source}
+        WHERE {match}{filters}
+        LIMIT :cap
+    ) AS capped
+"""
+
+_LANGUAGE_ID_SQL = text("SELECT id FROM language WHERE code = :code")
+
+# Language codes resolve to ids once per process; languages are never renumbered.
+_LANGUAGE_IDS: dict[str, int] = {}
+
+
+def _after_filter(score: str, key_column: str, id_column: str, after: bool) -> str:
+    if not after:
+        return ""
+    return _AFTER_FILTER_TEMPLATE.format(score=score, key_column=key_column, id_column=id_column)
+
+
+def _lexicon_filters(by_language: bool) -> str:
+    return "\n      AND lex.language_id = :language_id" if by_language else ""
+
+
+def _grammar_filters(by_language: bool) -> str:
+    return "\n      AND source.meta ->> 'language' = :language" if by_language else ""
+
+
+def _text_filters(by_language: bool, by_work: bool) -> str:
+    filters = ""
+    if by_language:
+        filters += "\n      AND seg.language_id = :language_id"
+    if by_work:
+        filters += "\n      AND seg.work_id = :work_id"
+    return filters
+
 
+@lru_cache(maxsize=None)
+def _lexicon_sql(by_language: bool, after: bool = False) -> TextClause:
+    filters = _lexicon_filters(by_language) + _after_filter(_LEXICON_SCORE, "lex.lemma", "lex.id", after)
+    if by_language:
+        return text(
+            _LEXICON_SQL_TEMPLATE.format(
+                language_column="CAST(:language AS TEXT)",
+                language_join="",
+                score=_LEXICON_SCORE,
+                filters=filters,
+            )
+        )
+    return text(
+        _LEXICON_SQL_TEMPLATE.format(
+            language_column="lang.code",
+            language_join="\n    JOIN language AS lang ON lang.id = lex.language_id",
+            score=_LEXICON_SCORE,
+            filters=filters,
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def _grammar_sql(by_language: bool, after: bool = False) -> TextClause:
+    filters = _grammar_filters(by_language) + _after_filter(_GRAMMAR_SCORE, "topic.title", "topic.id", after)
+    return text(_GRAMMAR_SQL_TEMPLATE.format(score=_GRAMMAR_SCORE, filters=filters))
+
+
+@lru_cache(maxsize=None)
+def _text_sql(by_language: bool, by_work: bool, after: bool = False) -> TextClause:
+    filters = _text_filters(by_language, by_work) + _after_filter(_TEXT_SCORE, "seg.ref", "seg.id", after)
+    return text(_TEXT_SQL_TEMPLATE.format(score=_TEXT_SCORE, filters=filters))
 
-@router.get("/search", response_model=SearchResponse)
+
+@lru_cache(maxsize=None)
+def _lexicon_count_sql(by_language: bool) -> TextClause:
+    return text(
+        _COUNT_SQL_TEMPLATE.format(
+            source="lexeme AS lex",
+            match="lex.lemma_fold % :query_fold",
+            filters=_lexicon_filters(by_language),
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def _grammar_count_sql(by_language: bool) -> TextClause:
+    return text(
+        _COUNT_SQL_TEMPLATE.format(
+            source="grammar_topic AS topic\n        JOIN source_doc AS source ON source.id = topic.source_id",
+            match=(
+                "(topic.body_fold % :query_fold"
+                " OR similarity(lower(topic.title), lower(:query_plain)) >= :threshold)"
+            ),
+            filters=_grammar_filters(by_language),
+        )
+    )
+
+
+@lru_cache(maxsize=None)
+def _text_count_sql(by_language: bool, by_work: bool) -> TextClause:
+    return text(
+        _COUNT_SQL_TEMPLATE.format(
+            source="text_segment AS seg",
+            match="seg.text_fold % :query_fold",
+            filters=_text_filters(by_language, by_work),
+        )
+    )
+
+
+@router.get("/search", response_model=SearchResponse, dependencies=[Depends(conditional_cache())])
 async def search_endpoint(
+    response: Response,
     q: str = Query(..., min_length=1, description="Search query"),
     language: str | None = Query(None, min_length=2, max_length=8, description="Language code"),
     types: str | None = Query(None, description="Comma-separated list of result types"),
@@ -144,7 +320,9 @@ async def search_endpoint(
     legacy_limit: int | None = Query(None, alias="k", description="Legacy limit parameter"),
     legacy_threshold: float | None = Query(None, alias="t", description="Legacy threshold parameter"),
     work_id: int | None = Query(None, ge=1, description="Filter text results to a specific work ID"),
-    session: AsyncSession = Depends(get_session),
+    lexicon_after: str | None = Query(None, description="next_cursors['lexicon'] from the previous page"),
+    grammar_after: str | None = Query(None, description="next_cursors['grammar'] from the previous page"),
+    text_after: str | None = Query(None, description="next_cursors['text'] from the previous page"),
 ) -> SearchResponse:
     query = q.strip()
     if not query:
@@ -156,51 +334,195 @@ async def search_endpoint(
     resolved_limit = legacy_limit or limit
     resolved_threshold = legacy_threshold if legacy_threshold is not None else threshold
     result_types = _parse_types(types)
-
-    folded_query = accent_fold(query)
-    await session.execute(
-        text("SELECT set_limit(:threshold)"), {"threshold": _clamp_threshold(resolved_threshold)}
+    raw_cursors = {"lexicon": lexicon_after, "grammar": grammar_after, "text": text_after}
+    cursors = {name: _decode_cursor(raw) for name, raw in raw_cursors.items() if raw and name in result_types}
+
+    cache_key = (
+        query,
+        resolved_language,
+        tuple(result_types),
+        resolved_limit,
+        resolved_threshold,
+        work_id,
+        tuple(sorted(cursors.items())),
     )
+    try:
+        return await read_through(
+            _SEARCH_CACHE,
+            "search",
+            cache_key,
+            lambda: _run_search(
+                query=query,
+                language=resolved_language,
+                result_types=result_types,
+                limit=resolved_limit,
+                threshold=resolved_threshold,
+                work_id=work_id,
+                cursors=cursors,
+            ),
+            _SEARCH_ADAPTER,
+        )
+    except _PartialSearch as partial:
+        mark_uncacheable(response)
+        return partial.response
+
+
+async def _run_search(
+    *,
+    query: str,
+    language: str | None,
+    result_types: Sequence[str],
+    limit: int,
+    threshold: float,
+    work_id: int | None,
+    cursors: Dict[str, _Cursor] | None = None,
+) -> SearchResponse:
+    """Run each requested type concurrently on its own pooled connection.
 
-    lexicon_results: list[LexiconResult] = []
-    grammar_results: list[GrammarResult] = []
-    text_results: list[TextResult] = []
+    Types still running after SEARCH_TIME_BUDGET seconds are cancelled and the
+    rest are returned with ``timed_out`` set (via ``_PartialSearch``). Each type
+    pages independently: ``cursors`` resumes a type after its previous page, and
+    types without a cursor also report a capped match count.
+    """
 
-    if "lexicon" in result_types:
-        lexicon_results = await _search_lexicon(
+    folded_query = accent_fold(query)
+    threshold = _clamp_threshold(threshold)
+    language_id = await _resolve_language_id(language) if language else None
+    # Lexemes and segments only exist for languages in the language table
+    known_language = language is None or language_id is not None
+    cursors = cursors or {}
+
+    searches: Dict[str, Callable[[AsyncSession], Awaitable[_SearchPage]]] = {}
+    if "lexicon" in result_types and known_language:
+        searches["lexicon"] = lambda session: _search_lexicon(
             session,
             query_fold=folded_query,
-            language=resolved_language,
-            limit=resolved_limit,
+            language=language,
+            language_id=language_id,
+            limit=limit,
+            after=cursors.get("lexicon"),
         )
-
     if "grammar" in result_types:
-        grammar_results = await _search_grammar(
+        searches["grammar"] = lambda session: _search_grammar(
             session,
             query=query,
             query_fold=folded_query,
-            language=resolved_language,
-            limit=resolved_limit,
-            threshold=_clamp_threshold(resolved_threshold),
+            language=language,
+            limit=limit,
+            threshold=threshold,
+            after=cursors.get("grammar"),
         )
-
-    if "text" in result_types:
-        text_results = await _search_text_segments(
+    if "text" in result_types and known_language:
+        searches["text"] = lambda session: _search_text_segments(
             session,
             query_fold=folded_query,
-            language=resolved_language,
-            limit=resolved_limit,
+            language_id=language_id,
+            limit=limit,
             work_id=work_id,
+            after=cursors.get("text"),
+        )
+
+    tasks = {name: asyncio.create_task(_run_isolated(search, threshold)) for name, search in searches.items()}
+    budget = settings.SEARCH_TIME_BUDGET
+    try:
+        done, pending = await asyncio.wait(tasks.values(), timeout=budget if budget > 0 else None)
+    finally:
+        for task in tasks.values():
+            task.cancel()
+    if pending:
+        await asyncio.gather(*pending, return_exceptions=True)
+        timed_out = [name for name, task in tasks.items() if task in pending]
+        _LOGGER.warning(
+            "Search for %r exceeded %.1fs budget; dropped %s", query, budget, ", ".join(timed_out)
         )
 
+    results: Dict[str, list[Any]] = {}
+    next_cursors: Dict[str, str] = {}
+    estimated_totals: Dict[str, int] = {}
+    for name, task in tasks.items():
+        if task not in done:
+            continue
+        entries, next_cursor, estimate = task.result()
+        if next_cursor is not None:
+            next_cursors[name] = _encode_cursor(*next_cursor)
+        results[name] = entries
+        if estimate is not None:
+            estimated_totals[name] = estimate
+    lexicon_results: list[LexiconResult] = results.get("lexicon", [])
+    grammar_results: list[GrammarResult] = results.get("grammar", [])
+    text_results: list[TextResult] = results.get("text", [])
+
     total = len(lexicon_results) + len(grammar_results) + len(text_results)
-    return SearchResponse(
+    response = SearchResponse(
         query=query,
         total_results=total,
         lexicon_results=lexicon_results,
         grammar_results=grammar_results,
         text_results=text_results,
+        timed_out=bool(pending),
+        next_cursors=next_cursors,
+        estimated_totals=estimated_totals,
     )
+    if pending:
+        raise _PartialSearch(response)
+    return response
+
+
+async def _resolve_language_id(code: str) -> int | None:
+    cached = _LANGUAGE_IDS.get(code)
+    if cached is not None:
+        return cached
+    async with SessionLocal() as session:
+        language_id = (await session.execute(_LANGUAGE_ID_SQL, {"code": code})).scalar_one_or_none()
+    if language_id is not None:
+        _LANGUAGE_IDS[code] = language_id
+    return language_id
+
+
+async def _run_isolated(
+    search: Callable[[AsyncSession], Awaitable[_SearchPage]], threshold: float
+) -> _SearchPage:
+    async with SessionLocal() as session:
+        async with session.begin():
+            await session.execute(_SET_THRESHOLD_SQL, {"threshold": threshold})
+            return await search(session)
+
+
+async def _estimate_total(session: AsyncSession, statement: TextClause, params: dict[str, Any]) -> int:
+    count_params = {key: value for key, value in params.items() if key != "limit"}
+    count_params["cap"] = max(1, settings.SEARCH_COUNT_CAP)
+    return int((await session.execute(statement, count_params)).scalar_one())
+
+
+def _encode_cursor(score: float, key: str, row_id: int) -> str:
+    raw = json.dumps([score, key, row_id], separators=(",", ":"), ensure_ascii=False)
+    return base64.urlsafe_b64encode(raw.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> _Cursor:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        score, key, row_id = json.loads(raw)
+    except (ValueError, TypeError) as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor") from exc
+    if (
+        isinstance(score, bool)
+        or not isinstance(score, (int, float))
+        or not isinstance(key, str)
+        or type(row_id) is not int
+    ):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+    return float(score), key, row_id
+
+
+def _split_page(rows: Sequence[Any], limit: int, key_column: str) -> Tuple[Sequence[Any], _Cursor | None]:
+    """Trim a ``limit + 1`` fetch to one page; the extra row only signals that more remain."""
+
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    last = rows[-1]
+    return rows, (float(last.get("score") or 0.0), last[key_column], last["id"])
 
 
 def _resolve_language_param(language: str | None, legacy: str | None) -> str | None:
@@ -243,15 +565,22 @@ async def _search_lexicon(
     *,
     query_fold: str,
     language: str | None,
+    language_id: int | None,
     limit: int,
-) -> list[LexiconResult]:
-    params: dict[str, Any] = {
-        "query_fold": query_fold,
-        "language": language,
-        "limit": limit,
-    }
-    result = await session.execute(_LEXICON_SQL, params)
-    rows = result.mappings().all()
+    after: _Cursor | None = None,
+) -> _SearchPage:
+    params: dict[str, Any] = {"query_fold": query_fold, "limit": limit + 1}
+    if language_id is not None:
+        params["language_id"] = language_id
+    estimate = None
+    if after is None:
+        estimate = await _estimate_total(session, _lexicon_count_sql(language_id is not None), params)
+    if language_id is not None:
+        params["language"] = language
+    if after is not None:
+        params.update(after_score=after[0], after_key=after[1], after_id=after[2])
+    result = await session.execute(_lexicon_sql(language_id is not None, after is not None), params)
+    rows, next_cursor = _split_page(result.mappings().all(), limit, "lemma")
     entries: list[LexiconResult] = []
     for row in rows:
         data = row.get("data") or {}
@@ -267,7 +596,7 @@ async def _search_lexicon(
                 relevance_score=float(row.get("score") or 0.0),
             )
         )
-    return entries
+    return entries, next_cursor, estimate
 
 
 async def _search_grammar(
@@ -278,22 +607,27 @@ async def _search_grammar(
     language: str | None,
     limit: int,
     threshold: float,
-) -> list[GrammarResult]:
+    after: _Cursor | None = None,
+) -> _SearchPage:
     params: dict[str, Any] = {
         "query_plain": query,
         "query_fold": query_fold,
-        "language": language,
-        "limit": limit,
+        "limit": limit + 1,
         "threshold": threshold,
     }
-    result = await session.execute(_GRAMMAR_SQL, params)
-    rows = result.mappings().all()
+    if language is not None:
+        params["language"] = language
+    estimate = None
+    if after is None:
+        estimate = await _estimate_total(session, _grammar_count_sql(language is not None), params)
+    else:
+        params.update(after_score=after[0], after_key=after[1], after_id=after[2])
+    result = await session.execute(_grammar_sql(language is not None, after is not None), params)
+    rows, next_cursor = _split_page(result.mappings().all(), limit, "title")
     entries: list[GrammarResult] = []
     for row in rows:
         meta = row.get("source_meta") or {}
         body = row.get("body") or ""
-        score_body = float(row.get("body_score") or 0.0)
-        score_title = float(row.get("title_score") or 0.0)
         entries.append(
             GrammarResult(
                 id=row["id"],
@@ -303,28 +637,34 @@ async def _search_grammar(
                 summary=_summarize(body),
                 content=body,
                 tags=_coerce_str_list(meta.get("tags")),
-                relevance_score=max(score_body, score_title),
+                relevance_score=float(row.get("score") or 0.0),
             )
         )
-    return entries
+    return entries, next_cursor, estimate
 
 
 async def _search_text_segments(
     session: AsyncSession,
     *,
     query_fold: str,
-    language: str | None,
+    language_id: int | None,
     limit: int,
     work_id: int | None,
-) -> list[TextResult]:
-    params: dict[str, Any] = {
-        "query_fold": query_fold,
-        "language": language,
-        "limit": limit,
-        "work_id": work_id,
-    }
-    result = await session.execute(_TEXT_SQL, params)
-    rows = result.mappings().all()
+    after: _Cursor | None = None,
+) -> _SearchPage:
+    params: dict[str, Any] = {"query_fold": query_fold, "limit": limit + 1}
+    if language_id is not None:
+        params["language_id"] = language_id
+    if work_id is not None:
+        params["work_id"] = work_id
+    by_language, by_work = language_id is not None, work_id is not None
+    estimate = None
+    if after is None:
+        estimate = await _estimate_total(session, _text_count_sql(by_language, by_work), params)
+    else:
+        params.update(after_score=after[0], after_key=after[1], after_id=after[2])
+    result = await session.execute(_text_sql(by_language, by_work, after is not None), params)
+    rows, next_cursor = _split_page(result.mappings().all(), limit, "ref")
     entries: list[TextResult] = []
     for row in rows:
         book, chapter, line_no = _parse_text_reference(
@@ -345,10 +685,33 @@ async def _search_text_segments(
                 relevance_score=float(row.get("score") or 0.0),
             )
         )
-    return entries
+    return entries, next_cursor, estimate
+
+
+@router.get("/search/suggest", response_model=SuggestResponse, dependencies=[Depends(conditional_cache())])
+async def suggest_endpoint(
+    q: str = Query(..., min_length=1, description="Prefix typed so far"),
+    language: str | None = Query(None, min_length=2, max_length=8, description="Language code"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum suggestions to return"),
+) -> SuggestResponse:
+    """Lemmas starting with ``q`` (accent- and case-insensitive), served from memory."""
+
+    query = q.strip()
+    prefix = accent_fold(query)
+    if not prefix:
+        return SuggestResponse(query=query)
+    index = await get_lemma_index()
+    matches = index.lookup(prefix, language=_resolve_language_param(language, None), limit=limit)
+    return SuggestResponse(
+        query=query,
+        suggestions=[
+            SuggestResult(lemma=match.lemma, language=match.language, lexeme_id=match.lexeme_id)
+            for match in matches
+        ],
+    )
 
 
-@router.get("/search/works", response_model=List[WorkResult])
+@router.get("/search/works", response_model=List[WorkResult], dependencies=[Depends(conditional_cache())])
 async def search_works(
     language: str | None = Query(None, min_length=2, max_length=8, description="Language code to filter by"),
     limit: int = Query(50, ge=1, le=500, description="Maximum works to return"),
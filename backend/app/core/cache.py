@@ -0,0 +1,125 @@
+"""In-process async read-through cache with LRU eviction, TTL and a byte budget."""
+
+from __future__ import annotations
+
+import asyncio
+import sys
+from collections import OrderedDict
+from time import monotonic
+from typing import Any, Awaitable, Callable, Generic, Hashable, TypeVar
+
+from pydantic import BaseModel
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+def estimate_size(value: Any) -> int:
+    """Approximate payload size in bytes (serialized size for pydantic models)."""
+
+    if isinstance(value, BaseModel):
+        return len(value.model_dump_json())
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return sum(estimate_size(item) for item in value) + 8 * len(value)
+    if isinstance(value, dict):
+        return sum(estimate_size(k) + estimate_size(v) for k, v in value.items()) + 16 * len(value)
+    return sys.getsizeof(value)
+
+
+class AsyncTTLCache(Generic[K, V]):
+    """LRU cache bounded by total bytes, with per-entry TTL and single-flight loads.
+
+    Expired entries are kept (until evicted) so callers can fall back to stale
+    data when the source is unavailable; see ``get(..., allow_stale=True)``.
+    Concurrent ``get_or_load`` calls for the same key share one loader call.
+    """
+
+    def __init__(
+        self,
+        *,
+        ttl: float,
+        max_bytes: int,
+        sizeof: Callable[[Any], int] = estimate_size,
+    ) -> None:
+        self.ttl = ttl
+        self.max_bytes = max(0, max_bytes)
+        self._sizeof = sizeof
+        self._entries: OrderedDict[K, tuple[float, int, V]] = OrderedDict()
+        self._inflight: dict[K, asyncio.Future[V]] = {}
+        self.total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: K, *, allow_stale: bool = False) -> V | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        stored_at, _, value = entry
+        if not allow_stale and monotonic() - stored_at > self.ttl:
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        size = self._sizeof(value)
+        self._discard(key)
+        if size > self.max_bytes:
+            return
+        self._entries[key] = (monotonic(), size, value)
+        self.total_bytes += size
+        while self.total_bytes > self.max_bytes and self._entries:
+            _, (_, evicted, _) = self._entries.popitem(last=False)
+            self.total_bytes -= evicted
+
+    def invalidate(self, key: K | None = None) -> None:
+        if key is None:
+            self._entries.clear()
+            self.total_bytes = 0
+        else:
+            self._discard(key)
+
+    async def get_or_load(self, key: K, loader: Callable[[], Awaitable[V]]) -> V:
+        """Return a fresh cached value or run ``loader`` once for all concurrent callers."""
+
+        while True:
+            cached = self.get(key)
+            if cached is not None:
+                return cached
+            pending = self._inflight.get(key)
+            if pending is None:
+                break
+            try:
+                return await asyncio.shield(pending)
+            except asyncio.CancelledError:
+                if pending.cancelled():
+                    continue  # the loading caller was cancelled; try again ourselves
+                raise
+
+        future: asyncio.Future[V] = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            value = await loader()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # mark retrieved when nobody else was waiting
+            raise
+        else:
+            self.set(key, value)
+            future.set_result(value)
+            return value
+        finally:
+            self._inflight.pop(key, None)
+
+    def _discard(self, key: K) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+
+__all__ = ["AsyncTTLCache", "estimate_size"]
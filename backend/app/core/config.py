@@ -67,6 +67,49 @@ class Settings(BaseSettings):
     TTS_DEFAULT_MODEL: str = Field(default="tts-1")  # OpenAI TTS: tts-1 or tts-1-hd
     TTS_GOOGLE_DEFAULT_MODEL: str = Field(default="gemini-2.5-flash-tts")  # Gemini TTS
 
+    # Retrieval (reader hybrid search)
+    HYBRID_FUSED_QUERY: bool = Field(default=True)  # Lexical + vector candidates in one CTE round-trip
+    HYBRID_VECTOR_PROBE_TTL: int = Field(default=300)  # Seconds to trust the pgvector readiness probe
+    HYBRID_FUSION: str = Field(default="mean")  # mean (min-max average, 0..1 scores) | rrf | weighted | max
+    HYBRID_CANDIDATE_POOL: int = Field(default=20)  # Candidates fetched per leg, independent of k
+    EMBEDDER_BACKEND: str = Field(default="hashed")  # "hashed" (char n-gram projection) or "none"
+    EMBED_BATCH_MAX: int = Field(default=32)  # Max concurrent queries folded into one inference call
+    EMBED_BATCH_WAIT_MS: float = Field(default=2.0)  # Micro-batching window
+    EMBED_QUERY_CACHE_SIZE: int = Field(default=4096)  # LRU entries keyed on the folded query
+
+    # Morphology (reader word analysis)
+    MORPH_CACHE_SIZE: int = Field(default=50000)  # Surface folds cached per language (0 disables)
+    MORPH_CACHE_TTL: int = Field(default=3600)  # Seconds; backstop for ingestion in other processes
+    MORPH_DICT_ENABLED: bool = Field(default=True)  # Use mmap dictionaries when built
+    MORPH_DICT_DIR: str | None = Field(default=None)  # Defaults to DATA_DERIVED_ROOT/morph
+    MORPH_CLTK_WARMUP: str = Field(default="grc,lat")  # Lemmatizers loaded at startup ("" disables)
+    MORPH_CLTK_WORKERS: int = Field(default=2)  # Dedicated CLTK thread pool size
+    MORPH_CLTK_BATCH_WAIT_MS: float = Field(default=2.0)  # Coalescing window for fallback lemmatization
+    MORPH_CLTK_CACHE_SIZE: int = Field(default=20000)  # Memoized CLTK lemmas per language
+
+    # Reader analyze per-branch budgets in seconds (0 disables the timeout)
+    READER_MORPH_BUDGET: float = Field(default=3.0)
+    READER_RETRIEVAL_BUDGET: float = Field(default=2.0)
+    READER_LEXICON_BUDGET: float = Field(default=1.0)
+    READER_GRAMMAR_BUDGET: float = Field(default=1.0)
+    READER_CACHE_TTL: int = Field(default=600)  # Seconds before text/structure/segment entries refresh
+    READER_CACHE_MAX_BYTES: int = Field(default=64 * 1024 * 1024)  # Approximate in-process budget
+    SEARCH_CACHE_TTL: int = Field(default=300)  # Seconds /search responses stay in-process
+    SEARCH_CACHE_MAX_BYTES: int = Field(default=16 * 1024 * 1024)
+    SEARCH_TIME_BUDGET: float = Field(default=2.0)  # /search total budget in seconds (0 disables)
+    SEARCH_COUNT_CAP: int = Field(default=1000)  # /search estimated_totals stop counting here
+    LANGUAGES_CACHE_TTL: int = Field(default=300)  # Seconds the merged /languages response is memoized
+    LANGUAGES_CACHE_MAX_AGE: int = Field(default=60)  # Cache-Control max-age for /languages
+
+    # Shared response cache (Redis tier behind the in-process caches)
+    RESPONSE_CACHE_REDIS: bool = Field(default=True)  # Uses REDIS_URL when set
+    RESPONSE_CACHE_REDIS_TTL: int = Field(default=3600)  # Seconds; ingestion also bumps key versions
+    RESPONSE_CACHE_VERSION_TTL: float = Field(default=5.0)  # How long workers memoize the corpus version
+
+    # HTTP conditional caching for read-only corpus endpoints
+    HTTP_CACHE_MAX_AGE: int = Field(default=60)  # Cache-Control max-age in seconds
+    HTTP_CACHE_RELEASE: str = Field(default="")  # Mixed into ETags; defaults to git SHA / package version
+
     # Health check models (for testing vendor API connectivity) - October 2025
     HEALTH_OPENAI_MODEL: str = Field(default="gpt-5-mini-2025-08-07")
     HEALTH_ANTHROPIC_MODEL: str = Field(default="claude-sonnet-4-5-20250929")
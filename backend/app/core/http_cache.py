@@ -0,0 +1,113 @@
+"""HTTP validators (ETag / If-None-Match / Cache-Control) for read-only corpus endpoints.
+
+``conditional_cache()`` is a route dependency that derives a strong ETag from
+the corpus version (bumped by ingestion, see ``app.core.shared_cache``), the
+release and the request URL. A matching ``If-None-Match`` is answered with 304
+before the endpoint runs, so revalidations never reach the database.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import time
+from importlib import metadata
+from pathlib import Path
+from typing import Awaitable, Callable
+
+from fastapi import HTTPException, Request, Response
+
+from app.core.config import settings
+from app.core.shared_cache import corpus_version, get_shared_cache
+
+
+def _detect_release(start: Path = Path(__file__)) -> str:
+    """Git commit of the checkout, else the installed package version.
+
+    Identical for every worker of a deploy, so ETags survive restarts and load
+    balancing while a new deploy still changes them.
+    """
+
+    for parent in start.resolve().parents:
+        git_dir = parent / ".git"
+        if not git_dir.is_dir():
+            continue
+        try:
+            head = (git_dir / "HEAD").read_text(encoding="utf-8").strip()
+            if not head.startswith("ref: "):
+                return head
+            ref = head.removeprefix("ref: ")
+            ref_path = git_dir / ref
+            if ref_path.is_file():
+                return ref_path.read_text(encoding="utf-8").strip()
+            packed = git_dir / "packed-refs"
+            if packed.is_file():
+                for line in packed.read_text(encoding="utf-8").splitlines():
+                    sha, _, name = line.partition(" ")
+                    if name == ref:
+                        return sha
+        except OSError:
+            pass
+        break
+    try:
+        return metadata.version("praviel")
+    except metadata.PackageNotFoundError:
+        return "dev"
+
+
+# Used when HTTP_CACHE_RELEASE is unset.
+_DEFAULT_RELEASE = _detect_release()
+
+
+def content_etag(payload: bytes) -> str:
+    """Strong ETag derived from ``payload``."""
+
+    return '"' + hashlib.blake2b(payload, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """True when an ``If-None-Match`` header matches ``etag`` (weak comparison, RFC 9110)."""
+
+    if not if_none_match:
+        return False
+    candidates = [candidate.strip() for candidate in if_none_match.split(",")]
+    return "*" in candidates or any(c.removeprefix("W/") == etag.removeprefix("W/") for c in candidates)
+
+
+async def corpus_etag(request: Request) -> str:
+    """ETag for ``request`` at the current corpus version."""
+
+    parts = [settings.HTTP_CACHE_RELEASE or _DEFAULT_RELEASE, str(await corpus_version())]
+    shared = get_shared_cache()
+    if shared is None or not shared.available:
+        # Bumps from other processes are invisible without Redis, so roll the
+        # validator over on the same schedule as the shared cache entries.
+        parts.append(str(int(time.time() // max(1, settings.RESPONSE_CACHE_REDIS_TTL))))
+    parts.append(request.url.path)
+    parts.extend(f"{key}={value}" for key, value in sorted(request.query_params.multi_items()))
+    return content_etag("\x1f".join(parts).encode("utf-8"))
+
+
+def conditional_cache(max_age: int | None = None) -> Callable[[Request, Response], Awaitable[str]]:
+    """Route dependency adding ETag/Cache-Control and answering matching revalidations with 304."""
+
+    async def _validate(request: Request, response: Response) -> str:
+        etag = await corpus_etag(request)
+        age = settings.HTTP_CACHE_MAX_AGE if max_age is None else max_age
+        headers = {"ETag": etag, "Cache-Control": f"public, max-age={age}"}
+        if etag_matches(request.headers.get("if-none-match"), etag):
+            raise HTTPException(status_code=304, headers=headers)
+        response.headers.update(headers)
+        return etag
+
+    return _validate
+
+
+def mark_uncacheable(response: Response) -> None:
+    """Drop validators from a degraded (empty or stale) response so clients do not keep it."""
+
+    if "etag" in response.headers:
+        del response.headers["etag"]
+    response.headers["Cache-Control"] = "no-store"
+
+
+__all__ = ["conditional_cache", "content_etag", "corpus_etag", "etag_matches", "mark_uncacheable"]
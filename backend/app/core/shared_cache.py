@@ -0,0 +1,207 @@
+"""Redis second-tier cache for corpus-derived API responses.
+
+Responses are stored as zlib-compressed JSON under keys that embed the current
+*corpus version*. Ingestion calls ``bump_corpus_version()`` after committing,
+which moves every worker to fresh keys at once; stale entries simply expire.
+Without Redis the version is tracked per process and only the in-process
+tier is used.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import time
+import zlib
+from typing import Any, Awaitable, Callable, Hashable, Sequence, TypeVar
+
+from pydantic import TypeAdapter
+from redis import asyncio as aioredis
+from redis.exceptions import RedisError
+
+from app.core.cache import AsyncTTLCache
+from app.core.config import settings
+
+_LOGGER = logging.getLogger("app.core.shared_cache")
+
+V = TypeVar("V")
+
+_KEY_PREFIX = "respcache"
+_VERSION_KEY = f"{_KEY_PREFIX}:corpus_version"
+
+
+class SharedCache:
+    """Thin Redis wrapper that backs off for a minute after a connection error."""
+
+    def __init__(self, redis_url: str, *, ttl: int) -> None:
+        self.redis = aioredis.from_url(redis_url)
+        self.ttl = ttl
+        self._disabled_until = 0.0
+        self._last_error_logged = 0.0
+
+    @property
+    def available(self) -> bool:
+        return not self._disabled_until or time.time() >= self._disabled_until
+
+    async def get(self, key: str) -> bytes | None:
+        if not self.available:
+            return None
+        try:
+            blob = await self.redis.get(key)
+        except RedisError as exc:
+            self._handle_redis_error(exc)
+            return None
+        self._disabled_until = 0.0
+        if not blob:
+            return None
+        try:
+            return zlib.decompress(blob)
+        except zlib.error:
+            return None
+
+    async def set(self, key: str, payload: bytes) -> None:
+        if not self.available:
+            return
+        try:
+            await self.redis.set(key, zlib.compress(payload, 6), ex=self.ttl)
+        except RedisError as exc:
+            self._handle_redis_error(exc)
+
+    async def version(self) -> int | None:
+        if not self.available:
+            return None
+        try:
+            raw = await self.redis.get(_VERSION_KEY)
+        except RedisError as exc:
+            self._handle_redis_error(exc)
+            return None
+        return int(raw) if raw else 0
+
+    async def bump_version(self) -> int | None:
+        if not self.available:
+            return None
+        try:
+            return int(await self.redis.incr(_VERSION_KEY))
+        except RedisError as exc:
+            self._handle_redis_error(exc)
+            return None
+
+    async def close(self) -> None:
+        await self.redis.aclose()
+
+    def _handle_redis_error(self, exc: Exception) -> None:
+        now = time.time()
+        self._disabled_until = now + 60.0
+        if now - self._last_error_logged >= 60.0:
+            _LOGGER.warning("Redis unavailable for response cache; using in-process tier for 60s: %s", exc)
+            self._last_error_logged = now
+
+
+_shared_cache: SharedCache | None = None
+
+# Last known corpus version and when it was read; the local counter covers
+# deployments without Redis and makes a bump visible in-process immediately.
+_version_memo: tuple[float, int] = (0.0, 0)
+_local_version = 0
+
+
+def get_shared_cache() -> SharedCache | None:
+    """Return the Redis tier, or ``None`` when disabled or REDIS_URL is unset."""
+
+    global _shared_cache
+    if _shared_cache is None and settings.RESPONSE_CACHE_REDIS and settings.REDIS_URL:
+        _shared_cache = SharedCache(settings.REDIS_URL, ttl=settings.RESPONSE_CACHE_REDIS_TTL)
+    return _shared_cache
+
+
+async def corpus_version() -> int:
+    """Current corpus version, re-read from Redis at most every RESPONSE_CACHE_VERSION_TTL seconds."""
+
+    global _version_memo
+    checked_at, version = _version_memo
+    now = time.monotonic()
+    if checked_at and now - checked_at < settings.RESPONSE_CACHE_VERSION_TTL:
+        return version
+    shared = get_shared_cache()
+    remote = await shared.version() if shared is not None else None
+    version = (remote or 0) + _local_version
+    _version_memo = (now, version)
+    return version
+
+
+def cached_corpus_version() -> int:
+    """Last corpus version seen by this process (no I/O)."""
+
+    return _version_memo[1]
+
+
+async def bump_corpus_version() -> int:
+    """Invalidate corpus-derived caches in every worker; call after ingestion commits."""
+
+    global _local_version, _version_memo
+    shared = get_shared_cache()
+    remote = await shared.bump_version() if shared is not None else None
+    if remote is None:
+        _local_version += 1
+    version = (remote or 0) + _local_version
+    _version_memo = (time.monotonic(), version)
+    return version
+
+
+def _redis_key(namespace: str, version: int, key: Sequence[Hashable]) -> str:
+    digest = hashlib.blake2b(
+        json.dumps(list(key), ensure_ascii=False, default=str).encode("utf-8"), digest_size=16
+    ).hexdigest()
+    return f"{_KEY_PREFIX}:{namespace}:v{version}:{digest}"
+
+
+async def read_through(
+    local: AsyncTTLCache[tuple[Any, ...], Any],
+    namespace: str,
+    key: tuple[Hashable, ...],
+    loader: Callable[[], Awaitable[V]],
+    adapter: TypeAdapter[V],
+) -> V:
+    """Serve ``key`` from the in-process tier, then Redis, then ``loader``.
+
+    Both tiers are keyed on the corpus version, so a bump misses everywhere.
+    """
+
+    version = await corpus_version()
+
+    async def _load() -> V:
+        shared = get_shared_cache()
+        redis_key = _redis_key(namespace, version, key)
+        if shared is not None:
+            payload = await shared.get(redis_key)
+            if payload is not None:
+                try:
+                    return adapter.validate_json(payload)
+                except ValueError:
+                    _LOGGER.warning("Discarding undecodable %s cache entry %s", namespace, redis_key)
+        value = await loader()
+        if shared is not None:
+            await shared.set(redis_key, adapter.dump_json(value))
+        return value
+
+    return await local.get_or_load((namespace, version, *key), _load)
+
+
+def read_stale(
+    local: AsyncTTLCache[tuple[Any, ...], Any], namespace: str, key: tuple[Hashable, ...]
+) -> Any | None:
+    """Expired in-process entry for ``key`` at the last known version, if any."""
+
+    return local.get((namespace, cached_corpus_version(), *key), allow_stale=True)
+
+
+__all__ = [
+    "SharedCache",
+    "bump_corpus_version",
+    "cached_corpus_version",
+    "corpus_version",
+    "get_shared_cache",
+    "read_stale",
+    "read_through",
+]
@@ -5,6 +5,7 @@ from typing import TYPE_CHECKING
 
 from pgvector.sqlalchemy import Vector
 from sqlalchemy import (
+    DDL,
     DateTime,
     ForeignKey,
     Index,
@@ -12,11 +13,14 @@ from sqlalchemy import (
     String,
     Text,
     UniqueConstraint,
+    event,
 )
-from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.sql import func
 
+from app.db.triggers import TEXT_SEGMENT_TRIGGERS
+
 if TYPE_CHECKING:
     from backend.app.db.user_models import User
 
@@ -117,8 +121,19 @@ class TextSegment(TimestampMixin, Base):
     # Additional metadata in JSONB format
     meta: Mapped[dict | None] = mapped_column(JSONB)
 
+    # Copy of text_work.language_id kept by a database trigger (app.db.triggers) so search can
+    # filter segments without joining text_work/language
+    language_id: Mapped[int | None] = mapped_column(ForeignKey("language.id"), index=True, default=None)
+
+    # Typed ordering key derived from meta by a database trigger (app.db.triggers), e.g. [book, line]
+    # or [page, section] for Stephanus pages; NULL when meta has no numeric fields
+    sort_key: Mapped[list[int] | None] = mapped_column(ARRAY(Integer), default=None)
+
     # Unique constraint matching the migration: uq_segment_ref
-    __table_args__ = (UniqueConstraint("work_id", "ref", name="uq_segment_ref"),)
+    __table_args__ = (
+        UniqueConstraint("work_id", "ref", name="uq_segment_ref"),
+        Index("ix_text_segment_work_sort_key", "work_id", "sort_key", "id"),
+    )
 
     work: Mapped["TextWork"] = relationship("TextWork")
 
@@ -126,6 +141,64 @@ class TextSegment(TimestampMixin, Base):
         return f"<TextSegment work_id={self.work_id} ref={self.ref!r}>"
 
 
+# create_all() builds no triggers; install the migration ones so derived columns
+# are filled for every writer on databases built that way too.
+for _statement in TEXT_SEGMENT_TRIGGERS:
+    event.listen(TextSegment.__table__, "after_create", DDL(_statement).execute_if(dialect="postgresql"))
+
+
+class TextWorkStructure(Base):
+    """Precomputed books/pages index per work (see app.ingestion.structure_index)."""
+
+    __tablename__ = "text_work_structure"
+
+    work_id: Mapped[int] = mapped_column(ForeignKey("text_work.id", ondelete="CASCADE"), primary_key=True)
+    ref_scheme: Mapped[str] = mapped_column(String(64))
+    segment_count: Mapped[int] = mapped_column(Integer, default=0)
+    structure: Mapped[dict] = mapped_column(JSONB, default=dict)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<TextWorkStructure work_id={self.work_id} segments={self.segment_count}>"
+
+
+class TextWorkSummary(Base):
+    """Denormalized catalog row per work for /reader/texts (see app.ingestion.structure_index)."""
+
+    __tablename__ = "text_work_summary"
+
+    work_id: Mapped[int] = mapped_column(ForeignKey("text_work.id", ondelete="CASCADE"), primary_key=True)
+    language_id: Mapped[int] = mapped_column(ForeignKey("language.id"), index=True)
+    segment_count: Mapped[int] = mapped_column(Integer, default=0)
+    preview: Mapped[str | None] = mapped_column(Text, default=None)
+    source_title: Mapped[str] = mapped_column(String(256))
+    license: Mapped[dict] = mapped_column(JSONB, default=dict)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<TextWorkSummary work_id={self.work_id} segments={self.segment_count}>"
+
+
+class LanguageStats(Base):
+    """Per-language work/segment totals for /languages (see app.ingestion.structure_index)."""
+
+    __tablename__ = "language_stats"
+
+    language_id: Mapped[int] = mapped_column(ForeignKey("language.id", ondelete="CASCADE"), primary_key=True)
+    work_count: Mapped[int] = mapped_column(Integer, default=0)
+    segment_count: Mapped[int] = mapped_column(Integer, default=0)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), nullable=False
+    )
+
+    def __repr__(self) -> str:  # pragma: no cover
+        return f"<LanguageStats language_id={self.language_id} works={self.work_count}>"
+
+
 class Token(TimestampMixin, Base):
     __tablename__ = "token"
 
@@ -172,6 +245,12 @@ class Lexeme(TimestampMixin, Base):
         Index("ix_lexeme_language_id", "language_id"),
         Index("ix_lexeme_lemma", "lemma"),
         Index("ix_lexeme_lemma_fold", "lemma_fold"),
+        Index(
+            "ix_lexeme_lemma_fold_trgm",
+            "lemma_fold",
+            postgresql_using="gin",
+            postgresql_ops={"lemma_fold": "gin_trgm_ops"},
+        ),
     )
 
     def __repr__(self) -> str:  # pragma: no cover
@@ -344,6 +423,9 @@ __all__ = [
     "SourceDoc",
     "TextWork",
     "TextSegment",
+    "TextWorkStructure",
+    "TextWorkSummary",
+    "LanguageStats",
     "Token",
     "Lexeme",
     "GrammarTopic",
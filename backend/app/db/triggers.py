@@ -0,0 +1,74 @@
+"""Database triggers that keep derived text_segment columns current.
+
+Migrations install these; ``Base.metadata.create_all()`` (seed scripts, tests)
+does not run migrations, so app.db.models also attaches the same DDL to the
+table's ``after_create`` event. Keep the SQL in sync with the migrations named
+below.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+# 20251102_add_text_segment_sort_key. Stephanus pages ("17a") become [17, 1];
+# otherwise the numeric book/chapter/verse/line fields present in meta, in that
+# order. Must stay in sync with app.api.reader._ref_sort_key.
+SORT_KEY_FUNCTION_SQL = r"""
+CREATE OR REPLACE FUNCTION text_segment_sort_key(meta jsonb) RETURNS integer[]
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE
+        WHEN meta->>'page' ~ '^\d{1,9}[a-z]?$' THEN ARRAY[
+            substring(meta->>'page' from '^\d+')::int,
+            COALESCE(ascii(substring(meta->>'page' from '[a-z]$')) - 96, 0)
+        ]
+        ELSE (
+            SELECT array_agg((meta->>u.field)::int ORDER BY u.ord)
+            FROM unnest(ARRAY['book', 'chapter', 'verse', 'line']) WITH ORDINALITY AS u(field, ord)
+            WHERE meta->>u.field ~ '^\d{1,9}$'
+        )
+    END
+$$
+"""
+
+SORT_KEY_TRIGGER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION text_segment_set_sort_key() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.sort_key := text_segment_sort_key(NEW.meta);
+    RETURN NEW;
+END
+$$
+"""
+
+SORT_KEY_TRIGGER_SQL = (
+    "CREATE TRIGGER trg_text_segment_sort_key "
+    "BEFORE INSERT OR UPDATE OF meta ON text_segment "
+    "FOR EACH ROW EXECUTE FUNCTION text_segment_set_sort_key()"
+)
+
+# 20251105_add_search_language_columns. Copies the work's language so search can
+# filter segments without joining text_work and language.
+LANGUAGE_TRIGGER_FUNCTION_SQL = """
+CREATE OR REPLACE FUNCTION text_segment_set_language_id() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.language_id := (SELECT language_id FROM text_work WHERE id = NEW.work_id);
+    RETURN NEW;
+END
+$$
+"""
+
+LANGUAGE_TRIGGER_SQL = (
+    "CREATE TRIGGER trg_text_segment_language_id "
+    "BEFORE INSERT OR UPDATE OF work_id ON text_segment "
+    "FOR EACH ROW EXECUTE FUNCTION text_segment_set_language_id()"
+)
+
+# Statements run, in order, right after text_segment is created.
+TEXT_SEGMENT_TRIGGERS: Tuple[str, ...] = (
+    SORT_KEY_FUNCTION_SQL,
+    SORT_KEY_TRIGGER_FUNCTION_SQL,
+    SORT_KEY_TRIGGER_SQL,
+    LANGUAGE_TRIGGER_FUNCTION_SQL,
+    LANGUAGE_TRIGGER_SQL,
+)
@@ -6,9 +6,12 @@ from typing import Any, Dict
 from sqlalchemy import func, select, text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.shared_cache import bump_corpus_version
 from app.db.util import text_with_json
 from app.ingestion.normalize import accent_fold, nfc
 from app.ingestion.sources.perseus import iter_lines_book1, iter_tokens, read_tei
+from app.ingestion.structure_index import rebuild_work_indexes
+from app.ling.morph import refresh_morph_lexicon
 
 ILIAD_AUTHOR = "Homer"
 ILIAD_TITLE = "Iliad"
@@ -216,6 +219,9 @@ async def ingest_iliad_sample(
                 idx += 1
 
     await db.commit()
+    await rebuild_work_indexes(db, work_id)
+    await refresh_morph_lexicon(db)
+    await bump_corpus_version()
 
     end_total = (
         await db.execute(
@@ -1,9 +1,32 @@
+"""Unicode normalization and accent folding for corpus text and queries."""
+
 from __future__ import annotations
 
+import re
 import unicodedata
+from functools import lru_cache
 
 __all__ = ["nfc", "accent_fold"]
 
+# Code-point ranges served by the corpus (Latin, combining marks, Greek/Coptic,
+# Hebrew, Latin/Greek Extended, punctuation, Coptic, Hebrew presentation forms).
+# Characters here fold through a precomputed translation table; anything else
+# takes the generic NFD/strip/casefold/NFC path.
+_FAST_RANGES: tuple[tuple[int, int], ...] = (
+    (0x0000, 0x024F),
+    (0x0300, 0x036F),
+    (0x0370, 0x03FF),
+    (0x0590, 0x05FF),
+    (0x1E00, 0x1FFF),
+    (0x2000, 0x206F),
+    (0x2C80, 0x2CFF),
+    (0xFB1D, 0xFB4F),
+)
+
+# Strings up to this length are memoized (tokens, queries, lemmas).
+_CACHE_MAX_LEN = 48
+_CACHE_SIZE = 65536
+
 
 def nfc(value: str) -> str:
     """Return NFC-normalized text."""
@@ -14,7 +37,56 @@ def nfc(value: str) -> str:
 def accent_fold(value: str) -> str:
     """Fold Greek text: remove accents, lowercase, keep NFC for search."""
 
+    if len(value) <= _CACHE_MAX_LEN:
+        return _accent_fold_cached(value)
+    return _accent_fold(value)
+
+
+def _fold_generic(value: str) -> str:
     decomposed = unicodedata.normalize("NFD", value)
     stripped = "".join(ch for ch in decomposed if unicodedata.category(ch) != "Mn")
     folded = stripped.casefold()
     return unicodedata.normalize("NFC", folded)
+
+
+def _build_fold_table() -> tuple[dict[int, str], re.Pattern[str]]:
+    """Fold each served code point once; keep those whose fold is context-free.
+
+    A character qualifies when its folded form contains no combining marks, so
+    folding a string character-by-character matches folding it as a whole.
+    """
+
+    table: dict[int, str] = {}
+    covered: list[int] = []
+    for lo, hi in _FAST_RANGES:
+        for cp in range(lo, hi + 1):
+            ch = chr(cp)
+            folded = _fold_generic(ch)
+            if any(unicodedata.combining(part) for part in folded):
+                continue
+            covered.append(cp)
+            if folded != ch:
+                table[cp] = folded
+
+    runs: list[tuple[int, int]] = []
+    for cp in covered:
+        if runs and cp == runs[-1][1] + 1:
+            runs[-1] = (runs[-1][0], cp)
+        else:
+            runs.append((cp, cp))
+    char_class = "".join(f"\\U{lo:08x}-\\U{hi:08x}" for lo, hi in runs)
+    return table, re.compile(f"[^{char_class}]")
+
+
+_FOLD_TABLE, _UNSEEN_CHAR = _build_fold_table()
+
+
+def _accent_fold(value: str) -> str:
+    if _UNSEEN_CHAR.search(value) is None:
+        return value.translate(_FOLD_TABLE)
+    return _fold_generic(value)
+
+
+@lru_cache(maxsize=_CACHE_SIZE)
+def _accent_fold_cached(value: str) -> str:
+    return _accent_fold(value)
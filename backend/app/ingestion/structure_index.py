@@ -0,0 +1,177 @@
+"""Per-work indexes behind the reader catalog and structure endpoints.
+
+``text_work_structure`` holds one row per work with its segment count and a
+JSONB document of ordered books (``book.line`` works) or Stephanus pages,
+including first/last refs and segment id ranges. ``text_work_summary`` holds
+the segment count, preview line and license snapshot listed by
+``GET /reader/texts``, and ``language_stats`` the per-language totals listed
+by ``GET /languages``. Ingestion rebuilds them so the endpoints read single
+rows instead of grouping every segment of a work or language.
+
+Rebuilding also backfills ``text_segment.language_id`` for segments written
+where the copy trigger was missing (see app.db.triggers), so language-filtered
+search finds them.
+"""
+
+from __future__ import annotations
+
+from typing import Tuple
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Copies text_work.language_id onto segments of ``:work_id`` (every work when NULL)
+# that lack it or carry a stale value.
+BACKFILL_SEGMENT_LANGUAGE_SQL = r"""
+UPDATE text_segment AS s
+SET language_id = w.language_id
+FROM text_work AS w
+WHERE w.id = s.work_id
+  AND (CAST(:work_id AS INTEGER) IS NULL OR s.work_id = :work_id)
+  AND s.language_id IS DISTINCT FROM w.language_id
+"""
+
+# Structure index values for one work (``:work_id``) or every work when NULL.
+# Read-only, so the structure endpoint can fill in works whose row is missing.
+STRUCTURE_SELECT_SQL = r"""
+SELECT
+    w.id AS work_id,
+    w.ref_scheme,
+    (SELECT COUNT(*) FROM text_segment AS s WHERE s.work_id = w.id) AS segment_count,
+    jsonb_strip_nulls(jsonb_build_object(
+        'books', CASE WHEN w.ref_scheme = 'book.line' THEN (
+            SELECT COALESCE(jsonb_agg(b.entry ORDER BY b.book), '[]'::jsonb)
+            FROM (
+                SELECT
+                    s.book,
+                    jsonb_build_object(
+                        'book', s.book,
+                        'line_count', COUNT(*),
+                        'first_line', MIN(s.line),
+                        'last_line', MAX(s.line),
+                        'first_ref', (array_agg(s.ref ORDER BY s.line, s.id))[1],
+                        'last_ref', (array_agg(s.ref ORDER BY s.line DESC, s.id DESC))[1],
+                        'first_segment_id', MIN(s.id),
+                        'last_segment_id', MAX(s.id)
+                    ) AS entry
+                FROM (
+                    SELECT id, ref, (meta->>'book')::int AS book, (meta->>'line')::int AS line
+                    FROM text_segment
+                    WHERE work_id = w.id
+                      AND meta->>'book' ~ '^\d+$'
+                      AND meta->>'line' ~ '^\d+$'
+                ) AS s
+                GROUP BY s.book
+            ) AS b
+        ) END,
+        'pages', CASE WHEN w.ref_scheme = 'stephanus' THEN (
+            SELECT COALESCE(jsonb_agg(p.page ORDER BY p.page), '[]'::jsonb)
+            FROM (
+                SELECT DISTINCT meta->>'page' AS page
+                FROM text_segment
+                WHERE work_id = w.id AND COALESCE(meta->>'page', '') <> ''
+            ) AS p
+        ) END
+    )) AS structure
+FROM text_work AS w
+WHERE CAST(:work_id AS INTEGER) IS NULL OR w.id = :work_id
+"""
+
+# Rebuilds the index for one work (``:work_id``) or for every work when NULL.
+REBUILD_STRUCTURE_SQL = f"""
+INSERT INTO text_work_structure (work_id, ref_scheme, segment_count, structure, updated_at)
+SELECT work_id, ref_scheme, segment_count, structure, now()
+FROM ({STRUCTURE_SELECT_SQL}) AS structure_index
+ON CONFLICT (work_id) DO UPDATE SET
+    ref_scheme = EXCLUDED.ref_scheme,
+    segment_count = EXCLUDED.segment_count,
+    structure = EXCLUDED.structure,
+    updated_at = EXCLUDED.updated_at
+"""
+
+# Catalog summary values for one work (``:work_id``) or every work when NULL.
+# Read-only, so the catalog can fill in works whose row is missing.
+SUMMARY_SELECT_SQL = r"""
+SELECT
+    w.id AS work_id,
+    w.language_id,
+    (SELECT COUNT(*) FROM text_segment AS s WHERE s.work_id = w.id) AS segment_count,
+    (
+        SELECT s.text_nfc
+        FROM text_segment AS s
+        WHERE s.work_id = w.id AND length(trim(s.text_nfc)) > 0
+        ORDER BY s.id
+        LIMIT 1
+    ) AS preview,
+    d.title AS source_title,
+    COALESCE(d.license, '{}'::jsonb) AS license
+FROM text_work AS w
+JOIN source_doc AS d ON d.id = w.source_id
+WHERE CAST(:work_id AS INTEGER) IS NULL OR w.id = :work_id
+"""
+
+# Rebuilds the catalog summary for one work (``:work_id``) or for every work when NULL.
+REBUILD_SUMMARY_SQL = f"""
+INSERT INTO text_work_summary
+    (work_id, language_id, segment_count, preview, source_title, license, updated_at)
+SELECT work_id, language_id, segment_count, preview, source_title, license, now()
+FROM ({SUMMARY_SELECT_SQL}) AS summary
+ON CONFLICT (work_id) DO UPDATE SET
+    language_id = EXCLUDED.language_id,
+    segment_count = EXCLUDED.segment_count,
+    preview = EXCLUDED.preview,
+    source_title = EXCLUDED.source_title,
+    license = EXCLUDED.license,
+    updated_at = EXCLUDED.updated_at
+"""
+
+# Recomputes totals for the language of ``:work_id``, or for every language when NULL.
+REBUILD_LANGUAGE_STATS_SQL = r"""
+INSERT INTO language_stats (language_id, work_count, segment_count, updated_at)
+SELECT
+    l.id,
+    (SELECT COUNT(*) FROM text_work AS w WHERE w.language_id = l.id),
+    (
+        SELECT COUNT(*)
+        FROM text_segment AS s
+        JOIN text_work AS w ON w.id = s.work_id
+        WHERE w.language_id = l.id
+    ),
+    now()
+FROM language AS l
+WHERE CAST(:work_id AS INTEGER) IS NULL
+   OR l.id = (SELECT language_id FROM text_work WHERE id = :work_id)
+ON CONFLICT (language_id) DO UPDATE SET
+    work_count = EXCLUDED.work_count,
+    segment_count = EXCLUDED.segment_count,
+    updated_at = EXCLUDED.updated_at
+"""
+
+
+# Everything rebuild_work_indexes runs, in order; each takes ``:work_id``.
+WORK_INDEX_SQL: Tuple[str, ...] = (
+    BACKFILL_SEGMENT_LANGUAGE_SQL,
+    REBUILD_STRUCTURE_SQL,
+    REBUILD_SUMMARY_SQL,
+    REBUILD_LANGUAGE_STATS_SQL,
+)
+
+
+async def rebuild_work_indexes(db: AsyncSession, work_id: int | None = None) -> None:
+    """Rebuild the structure index, catalog summary and language totals; call after ingesting a work."""
+
+    for statement in WORK_INDEX_SQL:
+        await db.execute(text(statement), {"work_id": work_id})
+    await db.commit()
+
+
+__all__ = [
+    "BACKFILL_SEGMENT_LANGUAGE_SQL",
+    "REBUILD_LANGUAGE_STATS_SQL",
+    "REBUILD_STRUCTURE_SQL",
+    "REBUILD_SUMMARY_SQL",
+    "STRUCTURE_SELECT_SQL",
+    "SUMMARY_SELECT_SQL",
+    "WORK_INDEX_SQL",
+    "rebuild_work_indexes",
+]
@@ -11,6 +11,7 @@ from pydantic import BaseModel, Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import Settings, get_settings
+from app.core.http_cache import conditional_cache
 from app.db.session import get_db
 from app.lesson.vocabulary_engine import (
     VocabularyEngine,
@@ -150,7 +151,11 @@ def _search_vocabulary(query: str, language_code: str | None = None, limit: int
 # ============================================================================
 
 
-@router.get("/search", response_model=VocabularySearchResponse)
+@router.get(
+    "/search",
+    response_model=VocabularySearchResponse,
+    dependencies=[Depends(conditional_cache())],
+)
 async def search_vocabulary(
     q: str = Query(..., min_length=1, description="Search query"),
     language_code: str | None = Query(None, description="Language code filter (e.g., 'lat', 'grc-cls')"),
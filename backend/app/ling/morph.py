@@ -2,13 +2,20 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any, Dict, Iterable, List
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from time import monotonic
+from typing import Any, Dict, Iterable, List, Set
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.core.config import settings
+from app.core.shared_cache import corpus_version
 from app.db.session import SessionLocal
 from app.ingestion.normalize import accent_fold, nfc
+from app.ling.morph_dict import get_morph_dict
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -36,14 +43,141 @@ _PERSEUS_SQL = text(
     """
 )
 
+
+# Indexed probe into the ``morph_lexicon`` materialized view (one row per
+# language/surface fold, refreshed after token ingestion).
+_LEXICON_SQL = text(
+    """
+    SELECT surface_fold, lemma, lemma_fold, msd, freq, total
+    FROM morph_lexicon
+    WHERE language = :language
+      AND surface_fold = ANY(:folds)
+    """
+)
+
+_LEXICON_EXISTS_SQL = text("SELECT to_regclass('morph_lexicon') IS NOT NULL")
+
+# None until probed; databases built without migrations (tests) fall back to the aggregate.
+_LEXICON_READY: bool | None = None
+
+
+class _AnalysisCache:
+    """Bounded per-language LRU of surface fold -> Perseus analysis.
+
+    ``None`` values are negative entries: the fold is known to be absent from the
+    token table, so repeat lookups skip Postgres and go straight to the fallback.
+    Entries belong to one corpus version; ``sync_version`` drops them all when
+    ingestion has bumped it.
+    """
+
+    def __init__(self, max_entries: int, ttl_seconds: float) -> None:
+        self.max_entries = max(0, max_entries)
+        self.ttl_seconds = ttl_seconds
+        self._stores: Dict[str, OrderedDict[str, tuple[float, Dict[str, Any] | None]]] = {}
+        self._version: int | None = None
+
+    def sync_version(self, version: int) -> None:
+        if version != self._version:
+            self._stores.clear()
+            self._version = version
+
+    def get_many(
+        self, language: str, folds: Iterable[str]
+    ) -> tuple[Dict[str, Dict[str, Any] | None], List[str]]:
+        store = self._stores.get(language)
+        found: Dict[str, Dict[str, Any] | None] = {}
+        missing: List[str] = []
+        now = monotonic()
+        for fold in folds:
+            entry = store.get(fold) if store is not None else None
+            if entry is None or now - entry[0] > self.ttl_seconds:
+                missing.append(fold)
+                continue
+            store.move_to_end(fold)
+            found[fold] = dict(entry[1]) if entry[1] is not None else None
+        return found, missing
+
+    def put_many(self, language: str, entries: Dict[str, Dict[str, Any] | None]) -> None:
+        if not self.max_entries or not entries:
+            return
+        store = self._stores.setdefault(language, OrderedDict())
+        now = monotonic()
+        for fold, analysis in entries.items():
+            store[fold] = (now, dict(analysis) if analysis is not None else None)
+            store.move_to_end(fold)
+        while len(store) > self.max_entries:
+            store.popitem(last=False)
+
+    def invalidate(self, language: str | None = None) -> None:
+        if language is None:
+            self._stores.clear()
+        else:
+            self._stores.pop(language, None)
+
+
+_ANALYSIS_CACHE = _AnalysisCache(settings.MORPH_CACHE_SIZE, settings.MORPH_CACHE_TTL)
+
+
+def invalidate_morph_cache(language: str | None = None) -> None:
+    """Drop this process's cached Perseus analyses (all languages by default).
+
+    Other workers notice new tokens through ``bump_corpus_version()``.
+    """
+
+    _ANALYSIS_CACHE.invalidate(language)
+
+
+async def refresh_morph_lexicon(session: AsyncSession) -> bool:
+    """Rebuild ``morph_lexicon`` from the token table and drop cached analyses.
+
+    Returns ``False`` when the view does not exist (migrations not applied).
+    """
+
+    global _LEXICON_READY
+    _LEXICON_READY = bool((await session.execute(_LEXICON_EXISTS_SQL)).scalar())
+    if _LEXICON_READY:
+        await session.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY morph_lexicon"))
+        await session.commit()
+    invalidate_morph_cache()
+    return _LEXICON_READY
+
+
 _CLTK_LEMMATIZERS: dict[str, Any] = {}
 _CLTK_INIT_ERRORS: dict[str, Exception] = {}
 
 
+_CLTK_INIT_LOCK = threading.Lock()
+_CLTK_EXECUTOR: ThreadPoolExecutor | None = None
+
+
+def _cltk_executor() -> ThreadPoolExecutor:
+    """Bounded pool reserved for CLTK so model loads never starve the default executor."""
+
+    global _CLTK_EXECUTOR
+    if _CLTK_EXECUTOR is None:
+        _CLTK_EXECUTOR = ThreadPoolExecutor(
+            max_workers=max(1, settings.MORPH_CLTK_WORKERS), thread_name_prefix="cltk"
+        )
+    return _CLTK_EXECUTOR
+
+
+def _cltk_family(language: str) -> str:
+    """CLTK models are per language family, so "grc-cls" and "grc" share one lemmatizer."""
+
+    return (language or "").strip().lower().split("-")[0]
+
+
 def _get_cltk_lemmatizer(language: str) -> Any | None:
-    lang = (language or "").lower()
+    lang = _cltk_family(language)
     if lang in _CLTK_LEMMATIZERS or lang in _CLTK_INIT_ERRORS:
         return _CLTK_LEMMATIZERS.get(lang)
+    with _CLTK_INIT_LOCK:
+        if lang in _CLTK_LEMMATIZERS or lang in _CLTK_INIT_ERRORS:
+            return _CLTK_LEMMATIZERS.get(lang)
+        return _load_cltk_lemmatizer(lang, language)
+
+
+def _load_cltk_lemmatizer(lang: str, language: str) -> Any | None:
     try:
         if lang.startswith("grc"):
             from cltk.lemmatize.grc import GreekBackoffLemmatizer
@@ -78,8 +212,7 @@ async def analyze_tokens(tokens: List[str], language: str = "grc") -> List[Dict[
 
     perseus_map: Dict[str, Dict[str, Any]] = {}
     if unique_folds:
-        async with SessionLocal() as session:
-            perseus_map = await _perseus_lookup(session, unique_folds, language)
+        perseus_map = await _cached_perseus_lookup(unique_folds, language)
 
     missing_folds = [fold for fold in folds if fold and fold not in perseus_map]
     fallback_map: Dict[str, Dict[str, Any]] = {}
@@ -98,24 +231,48 @@ async def analyze_tokens(tokens: List[str], language: str = "grc") -> List[Dict[
     return analyses
 
 
-async def _perseus_lookup(
+async def _cached_perseus_lookup(folds: List[str], language: str) -> Dict[str, Dict[str, Any]]:
+    _ANALYSIS_CACHE.sync_version(await corpus_version())
+    cached, missing = _ANALYSIS_CACHE.get_many(language, folds)
+    mapping = {fold: analysis for fold, analysis in cached.items() if analysis is not None}
+    morph_dict = get_morph_dict(language) if missing else None
+    if morph_dict is not None:
+        mapping.update(morph_dict.get_many(missing))
+        missing = [fold for fold in missing if fold not in mapping]
+    if not missing:
+        return mapping
+
+    async with SessionLocal() as session:
+        try:
+            fetched = await _perseus_query(session, missing, language)
+        except Exception as exc:  # pragma: no cover - defensive
+            _LOGGER.warning(
+                "Perseus lookup failed for language=%s, folds_count=%d: %s",
+                language,
+                len(missing),
+                exc,
+                exc_info=True,
+            )
+            return mapping
+
+    # Cache misses as negative entries only after a successful query.
+    _ANALYSIS_CACHE.put_many(language, {fold: fetched.get(fold) for fold in missing})
+    mapping.update(fetched)
+    return mapping
+
+
+async def _perseus_query(
     session: AsyncSession, folds: Iterable[str], language: str
 ) -> Dict[str, Dict[str, Any]]:
     folds_list = list(folds)
     if not folds_list:
         return {}
 
-    try:
-        result = await session.execute(_PERSEUS_SQL, {"folds": folds_list, "language": language})
-    except Exception as exc:  # pragma: no cover - defensive
-        _LOGGER.warning(
-            "Perseus lookup failed for language=%s, folds_count=%d: %s",
-            language,
-            len(folds_list),
-            exc,
-            exc_info=True,
-        )
-        return {}
+    global _LEXICON_READY
+    if _LEXICON_READY is None:
+        _LEXICON_READY = bool((await session.execute(_LEXICON_EXISTS_SQL)).scalar())
+    statement = _LEXICON_SQL if _LEXICON_READY else _PERSEUS_SQL
+    result = await session.execute(statement, {"folds": folds_list, "language": language})
 
     mapping: Dict[str, Dict[str, Any]] = {}
     row_count = 0
@@ -148,28 +305,131 @@ async def _perseus_lookup(
     return mapping
 
 
+async def warm_cltk_lemmatizers(languages: Iterable[str]) -> None:
+    """Load CLTK lemmatizers up front so the first reader request does not pay for it."""
+
+    loop = asyncio.get_running_loop()
+    for language in languages:
+        lang = _cltk_family(language)
+        if not lang:
+            continue
+        lemmatizer = await loop.run_in_executor(_cltk_executor(), _get_cltk_lemmatizer, lang)
+        _LOGGER.info("CLTK lemmatizer %s for %s", "ready" if lemmatizer else "unavailable", lang)
+
+
+class _CltkBatcher:
+    """Coalesce concurrent requests' folds into one ``lemmatize`` call per language.
+
+    Folds requested within ``max_wait`` seconds share a single executor job;
+    results are memoized per fold and identical in-flight folds share a future.
+    """
+
+    def __init__(self, language: str, *, max_wait: float, cache_size: int) -> None:
+        self.language = language
+        self.max_wait = max(0.0, max_wait)
+        self.cache_size = max(0, cache_size)
+        self._cache: OrderedDict[str, str | None] = OrderedDict()
+        self._pending: Dict[str, tuple[str, asyncio.Future[str | None]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # The loop only holds weak references to tasks; keep in-flight flushes alive.
+        self._flush_tasks: Set[asyncio.Task[None]] = set()
+
+    async def lemmatize(self, samples: Dict[str, str]) -> Dict[str, str | None]:
+        result: Dict[str, str | None] = {}
+        waiting: Dict[str, asyncio.Future[str | None]] = {}
+        loop = asyncio.get_running_loop()
+        for fold, sample in samples.items():
+            if fold in self._cache:
+                self._cache.move_to_end(fold)
+                result[fold] = self._cache[fold]
+                continue
+            pending = self._pending.get(fold)
+            if pending is None:
+                pending = (sample, loop.create_future())
+                self._pending[fold] = pending
+            waiting[fold] = pending[1]
+
+        if waiting:
+            if self._flush_handle is None:
+                self._flush_handle = loop.call_later(self.max_wait, self._start_flush)
+            lemmas = await asyncio.gather(*(asyncio.shield(future) for future in waiting.values()))
+            result.update(zip(waiting, lemmas))
+        return result
+
+    def _start_flush(self) -> None:
+        task = asyncio.get_running_loop().create_task(self._flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self) -> None:
+        self._flush_handle = None
+        batch = self._pending
+        if not batch:
+            return
+        self._pending = {}
+        folds = list(batch)
+        values = [batch[fold][0] for fold in folds]
+        loop = asyncio.get_running_loop()
+        try:
+            lemmas = await loop.run_in_executor(_cltk_executor(), self._lemmatize, values)
+        except Exception as exc:
+            _LOGGER.warning("CLTK batch of %d forms failed for %s: %s", len(folds), self.language, exc)
+            for _, future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        memoize = self.cache_size and self.language not in _CLTK_INIT_ERRORS
+        for fold, lemma in zip(folds, lemmas):
+            if memoize:
+                self._cache[fold] = lemma
+                self._cache.move_to_end(fold)
+            future = batch[fold][1]
+            if not future.done():
+                future.set_result(lemma)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+    def _lemmatize(self, values: List[str]) -> List[str | None]:
+        lemmatizer = _get_cltk_lemmatizer(self.language)
+        if lemmatizer is None:
+            return [None] * len(values)
+        return [lemma or None for _, lemma in lemmatizer.lemmatize(values)]
+
+
+_CLTK_BATCHERS: Dict[str, _CltkBatcher] = {}
+
+
+def _cltk_batcher(lang: str) -> _CltkBatcher:
+    batcher = _CLTK_BATCHERS.get(lang)
+    if batcher is None:
+        batcher = _CltkBatcher(
+            lang,
+            max_wait=settings.MORPH_CLTK_BATCH_WAIT_MS / 1000.0,
+            cache_size=settings.MORPH_CLTK_CACHE_SIZE,
+        )
+        _CLTK_BATCHERS[lang] = batcher
+    return batcher
+
+
 async def _cltk_lookup(samples: Dict[str, str], language: str) -> Dict[str, Dict[str, Any]]:
     if not samples:
         return {}
-    lemmatizer = _get_cltk_lemmatizer(language)
-    if lemmatizer is None:
+    lang = _cltk_family(language)
+    if lang in _CLTK_INIT_ERRORS:
         return {}
 
-    lang = (language or "").lower()
-
-    loop = asyncio.get_running_loop()
-
-    def _lemmatize(values: List[str]) -> List[tuple[str, str]]:
-        return lemmatizer.lemmatize(values)
-
-    folds = list(samples.keys())
-    values = [samples[fold] for fold in folds]
-    pairs = await loop.run_in_executor(None, _lemmatize, values)
+    try:
+        lemmas = await _cltk_batcher(lang).lemmatize(samples)
+    except Exception:  # pragma: no cover - defensive; logged by the batcher
+        return {}
+    if lang in _CLTK_INIT_ERRORS:
+        return {}
 
     result: Dict[str, Dict[str, Any]] = {}
-    for fold, (_, lemma) in zip(folds, pairs):
+    for fold, lemma in lemmas.items():
         result[fold] = {
-            "lemma": lemma or None,
+            "lemma": lemma,
             "morph": None,
             "confidence": 0.2 if lang.startswith("grc") else 0.15,
         }
@@ -0,0 +1,199 @@
+"""Read-only, memory-mapped morphology dictionary for zero-DB word lookups.
+
+One file per language, built from the ``token`` table by
+``pipeline.build_morph_dict``. Layout (little-endian)::
+
+    header   magic(8s) count(u32) keys_len(u32) records_len(u32)
+    key_offs (count + 1) x u32   offsets into the key block
+    rec_offs (count + 1) x u32   offsets into the record block
+    keys     UTF-8 surface folds, sorted bytewise, concatenated
+    records  confidence(f64) lemma_len(u16) tag_len(u16) lemma tag
+
+Lookups binary-search the key block directly in the mapping, so worker
+processes share pages through the OS cache and nothing is parsed up front.
+"""
+
+from __future__ import annotations
+
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Any, Dict, Iterable, Tuple
+
+from app.core.config import settings
+
+_LOGGER = logging.getLogger(__name__)
+
+MAGIC = b"MORPHD01"
+SUFFIX = ".mdict"
+
+_HEADER = struct.Struct("<8sIII")
+_OFFSET = struct.Struct("<I")
+_RECORD = struct.Struct("<dHH")
+
+# (surface_fold, lemma, perseus_tag, confidence)
+Entry = Tuple[str, str, str | None, float]
+
+
+class MorphDict:
+    """Binary-searchable view over one dictionary file."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        with open(path, "rb") as handle:
+            self._mm = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, keys_len, records_len = _HEADER.unpack_from(self._mm, 0)
+        if magic != MAGIC:
+            self._mm.close()
+            raise ValueError(f"{path} is not a morphology dictionary")
+        self._key_offs = _HEADER.size
+        self._rec_offs = self._key_offs + (self.count + 1) * _OFFSET.size
+        self._keys = self._rec_offs + (self.count + 1) * _OFFSET.size
+        self._records = self._keys + keys_len
+        if self._records + records_len > len(self._mm):
+            self._mm.close()
+            raise ValueError(f"{path} is truncated")
+
+    def close(self) -> None:
+        self._mm.close()
+
+    def _key(self, index: int) -> bytes:
+        base = self._key_offs + index * _OFFSET.size
+        start = _OFFSET.unpack_from(self._mm, base)[0]
+        end = _OFFSET.unpack_from(self._mm, base + _OFFSET.size)[0]
+        return self._mm[self._keys + start : self._keys + end]
+
+    def _record(self, index: int) -> Dict[str, Any]:
+        start = _OFFSET.unpack_from(self._mm, self._rec_offs + index * _OFFSET.size)[0]
+        pos = self._records + start
+        confidence, lemma_len, tag_len = _RECORD.unpack_from(self._mm, pos)
+        pos += _RECORD.size
+        lemma = self._mm[pos : pos + lemma_len].decode("utf-8")
+        pos += lemma_len
+        tag = self._mm[pos : pos + tag_len].decode("utf-8") if tag_len else None
+        return {"lemma": lemma, "morph": tag, "confidence": confidence}
+
+    def lookup(self, fold: str) -> Dict[str, Any] | None:
+        target = fold.encode("utf-8")
+        lo, hi = 0, self.count
+        while lo < hi:
+            mid = (lo + hi) // 2
+            key = self._key(mid)
+            if key < target:
+                lo = mid + 1
+            elif key > target:
+                hi = mid
+            else:
+                return self._record(mid)
+        return None
+
+    def get_many(self, folds: Iterable[str]) -> Dict[str, Dict[str, Any]]:
+        found: Dict[str, Dict[str, Any]] = {}
+        for fold in folds:
+            entry = self.lookup(fold)
+            if entry is not None:
+                found[fold] = entry
+        return found
+
+
+def write_morph_dict(entries: Iterable[Entry], path: Path) -> int:
+    """Write ``entries`` to ``path`` atomically; returns the number of keys written."""
+
+    by_key: Dict[bytes, Entry] = {}
+    for entry in entries:
+        key = entry[0].encode("utf-8")
+        if key and key not in by_key:
+            by_key[key] = entry
+
+    keys = bytearray()
+    records = bytearray()
+    key_offs = [0]
+    rec_offs = [0]
+    for key in sorted(by_key):
+        _, lemma, tag, confidence = by_key[key]
+        lemma_bytes = (lemma or "").encode("utf-8")[:0xFFFF]
+        tag_bytes = (tag or "").encode("utf-8")[:0xFFFF]
+        keys += key
+        records += _RECORD.pack(float(confidence or 0.0), len(lemma_bytes), len(tag_bytes))
+        records += lemma_bytes + tag_bytes
+        key_offs.append(len(keys))
+        rec_offs.append(len(records))
+
+    count = len(by_key)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    with open(tmp, "wb") as handle:
+        handle.write(_HEADER.pack(MAGIC, count, len(keys), len(records)))
+        handle.write(struct.pack(f"<{count + 1}I", *key_offs))
+        handle.write(struct.pack(f"<{count + 1}I", *rec_offs))
+        handle.write(keys)
+        handle.write(records)
+    # Replacing the file keeps readers of the old mapping valid until they reload.
+    os.replace(tmp, path)
+    return count
+
+
+def morph_dict_dir() -> Path:
+    return Path(settings.MORPH_DICT_DIR or Path(settings.DATA_DERIVED_ROOT) / "morph")
+
+
+def morph_dict_path(language: str) -> Path:
+    return morph_dict_dir() / f"{language}{SUFFIX}"
+
+
+# language -> (file signature, mapping); the signature is None when no file exists.
+_LOADED: Dict[str, Tuple[Tuple[int, int, int] | None, MorphDict | None]] = {}
+
+
+def _signature(path: Path) -> Tuple[int, int, int] | None:
+    try:
+        stat = path.stat()
+    except OSError:
+        return None
+    return stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+
+def get_morph_dict(language: str) -> MorphDict | None:
+    """Return the mapped dictionary for ``language``.
+
+    The file is stat'ed on every call and remapped when ``write_morph_dict``
+    has replaced it, so long-running workers pick up rebuilt dictionaries.
+    """
+
+    if not settings.MORPH_DICT_ENABLED:
+        return None
+    path = morph_dict_path(language)
+    signature = _signature(path)
+    cached = _LOADED.get(language)
+    if cached is not None and cached[0] == signature:
+        return cached[1]
+    if cached is not None and cached[1] is not None:
+        cached[1].close()
+    morph_dict: MorphDict | None = None
+    if signature is not None:
+        try:
+            morph_dict = MorphDict(path)
+        except (OSError, ValueError) as exc:
+            _LOGGER.warning("Morphology dictionary unavailable for %s: %s", language, exc)
+    _LOADED[language] = (signature, morph_dict)
+    return morph_dict
+
+
+def reset_morph_dicts() -> None:
+    """Forget loaded dictionaries so the next lookup maps the current files."""
+
+    for _, morph_dict in _LOADED.values():
+        if morph_dict is not None:
+            morph_dict.close()
+    _LOADED.clear()
+
+
+__all__ = [
+    "MorphDict",
+    "get_morph_dict",
+    "morph_dict_path",
+    "reset_morph_dicts",
+    "write_morph_dict",
+]
@@ -54,6 +54,7 @@ from app.db.init_db import initialize_database
 from app.db.session import SessionLocal
 from app.lesson.router import router as lesson_router
 from app.lesson.vocabulary_router import router as vocabulary_router
+from app.ling.morph import warm_cltk_lemmatizers
 from app.middleware.csrf import csrf_middleware
 from app.middleware.rate_limit import rate_limit_middleware
 from app.middleware.security_headers import security_headers_middleware
@@ -137,6 +138,14 @@ async def lifespan(app: FastAPI):
             exc_info=True,
         )
 
+    # Load CLTK lemmatizers before serving so the first word tap doesn't stall
+    warm_languages = [code for code in settings.MORPH_CLTK_WARMUP.split(",") if code.strip()]
+    if warm_languages and not is_testing:
+        try:
+            await warm_cltk_lemmatizers(warm_languages)
+        except Exception as exc:
+            startup_logger.warning("CLTK warm-up failed: %s", exc)
+
     # Start scheduled tasks only outside of test mode
     if not is_testing:
         startup_logger.info("Starting scheduled tasks...")
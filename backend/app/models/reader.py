@@ -29,6 +29,10 @@ class BookInfo(BaseModel):
     line_count: int = Field(..., description="Number of lines in this book")
     first_line: int = Field(..., description="First line number")
     last_line: int = Field(..., description="Last line number")
+    first_ref: str | None = Field(None, description="Reference of the first line (e.g., 'Il.1.1')")
+    last_ref: str | None = Field(None, description="Reference of the last line")
+    first_segment_id: int | None = Field(None, description="Lowest segment id in this book")
+    last_segment_id: int | None = Field(None, description="Highest segment id in this book")
 
 
 class TextStructure(BaseModel):
@@ -83,3 +87,6 @@ class TextSegmentsResponse(BaseModel):
 
     segments: list[SegmentWithMeta] = Field(..., description="List of text segments in the range")
     text_info: dict = Field(..., description="Metadata about the text (author, title, license)")
+    next_cursor: str | None = Field(
+        None, description="Pass as `after` to fetch the next page; null on the last page"
+    )
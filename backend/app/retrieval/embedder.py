@@ -0,0 +1,228 @@
+"""Text embedders for vector retrieval.
+
+Queries and stored segments must be embedded by the same backend so their
+vectors share a space. The default backend is a dependency-free hashed
+character n-gram projection sized to ``settings.EMBED_DIM``; heavier models can
+be plugged in through :func:`register_embedder`.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import math
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Callable, Dict, List, Sequence, Set
+
+from app.core.config import settings
+from app.ingestion.normalize import accent_fold, nfc
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class Embedder(ABC):
+    """Synchronous, CPU-bound embedding backend."""
+
+    name: str = "base"
+
+    def __init__(self, dim: int) -> None:
+        self.dim = max(1, dim)
+
+    @abstractmethod
+    def embed_many(self, texts: Sequence[str]) -> List[List[float]]:
+        """Return one unit-length vector per input text."""
+
+
+class HashedNgramEmbedder(Embedder):
+    """Signed feature hashing of character n-grams over accent-folded text.
+
+    Cheap enough to run inline (tens of microseconds per short query) and stable
+    across processes, which keeps query vectors comparable with backfilled
+    segment vectors.
+    """
+
+    name = "hashed"
+
+    def __init__(self, dim: int, *, min_n: int = 2, max_n: int = 4) -> None:
+        super().__init__(dim)
+        self.min_n = max(1, min_n)
+        self.max_n = max(self.min_n, max_n)
+
+    def embed_many(self, texts: Sequence[str]) -> List[List[float]]:
+        return [self._embed_one(value) for value in texts]
+
+    def _embed_one(self, value: str) -> List[float]:
+        folded = accent_fold(nfc(value or "")).strip()
+        vector = [0.0] * self.dim
+        if not folded:
+            return vector
+        padded = f" {' '.join(folded.split())} "
+        for n in range(self.min_n, self.max_n + 1):
+            for start in range(len(padded) - n + 1):
+                digest = hashlib.blake2b(padded[start : start + n].encode("utf-8"), digest_size=8).digest()
+                bucket = int.from_bytes(digest, "little")
+                sign = 1.0 if bucket >> 63 else -1.0
+                vector[bucket % self.dim] += sign
+        norm = math.sqrt(sum(x * x for x in vector))
+        if norm:
+            vector = [x / norm for x in vector]
+        return vector
+
+
+_BACKENDS: Dict[str, Callable[[int], Embedder]] = {
+    "hashed": HashedNgramEmbedder,
+}
+
+
+def register_embedder(name: str, factory: Callable[[int], Embedder]) -> None:
+    """Register an embedding backend selectable via ``settings.EMBEDDER_BACKEND``."""
+
+    _BACKENDS[name.strip().lower()] = factory
+
+
+def create_embedder(name: str | None = None, dim: int | None = None) -> Embedder | None:
+    """Instantiate the configured backend, or ``None`` when embeddings are disabled."""
+
+    backend = (name or settings.EMBEDDER_BACKEND or "").strip().lower()
+    if backend in {"", "none", "off"}:
+        return None
+    factory = _BACKENDS.get(backend)
+    if factory is None:
+        _LOGGER.warning("Unknown embedder backend %r; vector retrieval disabled", backend)
+        return None
+    return factory(dim or settings.EMBED_DIM)
+
+
+def to_pgvector(vector: Sequence[float]) -> str:
+    """Format a vector as a pgvector text literal."""
+
+    return "[" + ",".join(f"{x:.6g}" for x in vector) + "]"
+
+
+class BatchingEmbedder:
+    """Async front-end that coalesces concurrent queries into one inference call.
+
+    Requests arriving within ``max_wait`` seconds of each other (or until
+    ``max_batch`` are pending) are embedded together. Results are memoized in an
+    LRU keyed on the folded query, and identical in-flight queries share a future.
+    """
+
+    def __init__(
+        self,
+        embedder: Embedder,
+        *,
+        max_batch: int = 32,
+        max_wait: float = 0.002,
+        cache_size: int = 4096,
+    ) -> None:
+        self.embedder = embedder
+        self.max_batch = max(1, max_batch)
+        self.max_wait = max(0.0, max_wait)
+        self.cache_size = max(0, cache_size)
+        self._cache: OrderedDict[str, List[float]] = OrderedDict()
+        self._pending: Dict[str, asyncio.Future[List[float]]] = {}
+        self._flush_handle: asyncio.TimerHandle | None = None
+        # The loop only holds weak references to tasks; keep in-flight flushes alive.
+        self._flush_tasks: Set[asyncio.Task[None]] = set()
+
+    async def embed(self, query: str) -> List[float] | None:
+        key = accent_fold(nfc(query or "")).strip()
+        if not key:
+            return None
+
+        cached = self._cache.get(key)
+        if cached is not None:
+            self._cache.move_to_end(key)
+            return cached
+
+        future = self._pending.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.create_future()
+            self._pending[key] = future
+            if len(self._pending) >= self.max_batch:
+                self._schedule_flush(loop, immediate=True)
+            else:
+                self._schedule_flush(loop)
+        return await asyncio.shield(future)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def _schedule_flush(self, loop: asyncio.AbstractEventLoop, *, immediate: bool = False) -> None:
+        if immediate:
+            if self._flush_handle is not None:
+                self._flush_handle.cancel()
+                self._flush_handle = None
+            self._start_flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._start_flush)
+
+    def _start_flush(self) -> None:
+        task = asyncio.get_running_loop().create_task(self._flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _flush(self) -> None:
+        self._flush_handle = None
+        batch = self._pending
+        if not batch:
+            return
+        self._pending = {}
+        keys = list(batch)
+        try:
+            vectors = await asyncio.to_thread(self.embedder.embed_many, keys)
+        except Exception as exc:
+            _LOGGER.warning("Embedding batch of %d queries failed: %s", len(keys), exc)
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for key, vector in zip(keys, vectors):
+            self._remember(key, vector)
+            future = batch[key]
+            if not future.done():
+                future.set_result(vector)
+
+    def _remember(self, key: str, vector: List[float]) -> None:
+        if not self.cache_size:
+            return
+        self._cache[key] = vector
+        self._cache.move_to_end(key)
+        while len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+
+
+_QUERY_EMBEDDER: BatchingEmbedder | None = None
+_QUERY_EMBEDDER_READY = False
+
+
+def get_query_embedder() -> BatchingEmbedder | None:
+    """Return the process-wide batching query embedder (``None`` if disabled)."""
+
+    global _QUERY_EMBEDDER, _QUERY_EMBEDDER_READY
+    if not _QUERY_EMBEDDER_READY:
+        backend = create_embedder()
+        if backend is not None:
+            _QUERY_EMBEDDER = BatchingEmbedder(
+                backend,
+                max_batch=settings.EMBED_BATCH_MAX,
+                max_wait=settings.EMBED_BATCH_WAIT_MS / 1000.0,
+                cache_size=settings.EMBED_QUERY_CACHE_SIZE,
+            )
+        _QUERY_EMBEDDER_READY = True
+    return _QUERY_EMBEDDER
+
+
+__all__ = [
+    "BatchingEmbedder",
+    "Embedder",
+    "HashedNgramEmbedder",
+    "create_embedder",
+    "get_query_embedder",
+    "register_embedder",
+    "to_pgvector",
+]
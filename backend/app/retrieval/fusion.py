@@ -0,0 +1,119 @@
+"""Rank-fusion strategies for blending lexical and vector candidate lists.
+
+Each strategy receives the two candidate lists (each ordered best-first, with
+raw ``score`` values) and returns a fused score per ``segment_id``. Strategies
+are registered by name so callers can pick one per request.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Mapping, Sequence
+
+Hit = Mapping[str, Any]
+FusionStrategy = Callable[[Sequence[Hit], Sequence[Hit]], Dict[int, float]]
+
+RRF_K = 60
+DEFAULT_VECTOR_WEIGHT = 0.5
+
+
+def reciprocal_rank_fusion(
+    lexical: Sequence[Hit], vector: Sequence[Hit], *, k: int = RRF_K
+) -> Dict[int, float]:
+    """Sum of ``1 / (k + rank)`` over the lists a candidate appears in.
+
+    Rank-based, so it is insensitive to how scores are distributed and stays
+    meaningful when a list has only one or two hits.
+    """
+
+    fused: Dict[int, float] = {}
+    for hits in (lexical, vector):
+        for rank, hit in enumerate(hits, start=1):
+            seg_id = hit["segment_id"]
+            fused[seg_id] = fused.get(seg_id, 0.0) + 1.0 / (k + rank)
+    return fused
+
+
+def weighted_linear(
+    lexical: Sequence[Hit],
+    vector: Sequence[Hit],
+    *,
+    vector_weight: float = DEFAULT_VECTOR_WEIGHT,
+) -> Dict[int, float]:
+    """Weighted sum of raw similarities (both legs already score in ``[0, 1]``)."""
+
+    weight = min(max(vector_weight, 0.0), 1.0)
+    fused: Dict[int, float] = {}
+    for hits, factor in ((lexical, 1.0 - weight), (vector, weight)):
+        for hit in hits:
+            seg_id = hit["segment_id"]
+            fused[seg_id] = fused.get(seg_id, 0.0) + factor * float(hit.get("score") or 0.0)
+    return fused
+
+
+def max_score(lexical: Sequence[Hit], vector: Sequence[Hit]) -> Dict[int, float]:
+    """Best raw similarity a candidate reached on either leg."""
+
+    fused: Dict[int, float] = {}
+    for hits in (lexical, vector):
+        for hit in hits:
+            seg_id = hit["segment_id"]
+            fused[seg_id] = max(fused.get(seg_id, 0.0), float(hit.get("score") or 0.0))
+    return fused
+
+
+def min_max_mean(lexical: Sequence[Hit], vector: Sequence[Hit]) -> Dict[int, float]:
+    """Legacy blend: min-max normalize each list, then average the legs a hit appears in."""
+
+    lex_norm = _normalize_scores({hit["segment_id"]: float(hit.get("score") or 0.0) for hit in lexical})
+    vec_norm = _normalize_scores({hit["segment_id"]: float(hit.get("score") or 0.0) for hit in vector})
+    fused: Dict[int, float] = {}
+    for seg_id in lex_norm.keys() | vec_norm.keys():
+        parts = [norm[seg_id] for norm in (lex_norm, vec_norm) if seg_id in norm]
+        fused[seg_id] = sum(parts) / len(parts)
+    return fused
+
+
+def _normalize_scores(raw: Dict[int, float]) -> Dict[int, float]:
+    if not raw:
+        return {}
+    values = list(raw.values())
+    lo = min(values)
+    hi = max(values)
+    if hi == lo:
+        return {k: 1.0 for k in raw}
+    scale = hi - lo
+    return {k: (v - lo) / scale for k, v in raw.items()}
+
+
+FUSION_STRATEGIES: Dict[str, FusionStrategy] = {
+    "rrf": reciprocal_rank_fusion,
+    "weighted": weighted_linear,
+    "max": max_score,
+    "mean": min_max_mean,
+}
+
+
+def register_fusion(name: str, strategy: FusionStrategy) -> None:
+    """Make a custom fusion strategy selectable by name."""
+
+    FUSION_STRATEGIES[name.strip().lower()] = strategy
+
+
+def get_fusion(name: str) -> FusionStrategy:
+    try:
+        return FUSION_STRATEGIES[name.strip().lower()]
+    except KeyError:
+        allowed = ", ".join(sorted(FUSION_STRATEGIES))
+        raise ValueError(f"Unknown fusion strategy '{name}'. Allowed: {allowed}") from None
+
+
+__all__ = [
+    "FUSION_STRATEGIES",
+    "FusionStrategy",
+    "get_fusion",
+    "max_score",
+    "min_max_mean",
+    "reciprocal_rank_fusion",
+    "register_fusion",
+    "weighted_linear",
+]
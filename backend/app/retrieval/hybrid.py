@@ -2,13 +2,16 @@ from __future__ import annotations
 
 import logging
 import unicodedata
-from typing import Any, Dict, Iterable, List
+from time import monotonic
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
 
 from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
 from app.db.session import SessionLocal
+from app.retrieval.embedder import get_query_embedder, to_pgvector
+from app.retrieval.fusion import get_fusion
 
 try:  # Prefer trigram helper used by the CLI for consistent folding
     from pipeline.search_trgm import accent_fold
@@ -82,6 +85,91 @@ _COLUMN_CHECK_SQL = text(
 )
 _ANY_EMBED_SQL = text("SELECT 1 FROM text_segment WHERE emb IS NOT NULL LIMIT 1")
 
+# pg_trgm's % operator reads its threshold from a GUC. The fused lexical leg
+# compares against this scalar subquery, which sets the threshold
+# transaction-locally (nothing leaks into the pooled connection) and returns the
+# folded query. Postgres runs it once as an InitPlan before the trigram index
+# scan starts, and its result is a plan parameter, so the index stays usable and
+# the whole search is one round-trip.
+_THRESHOLD_QUERY_SQL = """(
+            SELECT CAST(:query_fold AS TEXT)
+            FROM (
+                SELECT set_config('pg_trgm.similarity_threshold', CAST(:threshold AS TEXT), true)
+            ) AS trgm_threshold
+        )"""
+
+# Fused execution: both candidate legs run as CTEs of a single statement.
+_FUSED_LEXICAL_CTE = f"""
+    lexical AS (
+        SELECT seg.id AS segment_id, similarity(seg.text_fold, :query_fold) AS score
+        FROM text_segment AS seg
+        JOIN text_work AS work ON work.id = seg.work_id
+        JOIN language AS lang ON lang.id = work.language_id
+        WHERE lang.code = :language
+          AND seg.text_fold % {_THRESHOLD_QUERY_SQL}
+        ORDER BY score DESC, seg.ref
+        LIMIT :limit
+    )
+"""
+
+_FUSED_VECTOR_CTE = """
+    vector AS (
+        SELECT seg.id AS segment_id, 1 - (seg.emb <=> CAST(:query_vector AS vector)) AS score
+        FROM text_segment AS seg
+        JOIN text_work AS work ON work.id = seg.work_id
+        JOIN language AS lang ON lang.id = work.language_id
+        WHERE lang.code = :language
+          AND seg.emb IS NOT NULL
+        ORDER BY seg.emb <=> CAST(:query_vector AS vector) ASC
+        LIMIT :limit
+    )
+"""
+
+_FUSED_SELECT = """
+SELECT
+    cand.source AS source,
+    seg.id AS segment_id,
+    seg.ref AS segment_ref,
+    seg.text_nfc AS text_nfc,
+    seg.text_raw AS text_raw,
+    work.author AS work_author,
+    work.title AS work_title,
+    cand.score AS score
+FROM candidates AS cand
+JOIN text_segment AS seg ON seg.id = cand.segment_id
+JOIN text_work AS work ON work.id = seg.work_id
+ORDER BY cand.source, cand.score DESC, seg.ref
+"""
+
+_FUSED_LEXICAL_SQL = text(
+    "WITH"
+    + _FUSED_LEXICAL_CTE
+    + """,
+    candidates AS (
+        SELECT segment_id, score, 'lexical' AS source FROM lexical
+    )
+"""
+    + _FUSED_SELECT
+)
+
+_FUSED_HYBRID_SQL = text(
+    "WITH"
+    + _FUSED_LEXICAL_CTE
+    + ","
+    + _FUSED_VECTOR_CTE
+    + """,
+    candidates AS (
+        SELECT segment_id, score, 'lexical' AS source FROM lexical
+        UNION ALL
+        SELECT segment_id, score, 'vector' AS source FROM vector
+    )
+"""
+    + _FUSED_SELECT
+)
+
+# (probed_at, ready) for the pgvector readiness check, shared by every request in the process.
+_VECTOR_PROBE: tuple[float, bool] | None = None
+
 
 async def hybrid_search(
     q: str,
@@ -90,34 +178,107 @@ async def hybrid_search(
     k: int = 5,
     t: float = 0.05,
     use_vector: bool | None = None,
+    fused: bool | None = None,
+    fusion: str | None = None,
+    candidates: int | None = None,
 ) -> List[Dict[str, Any]]:
-    """Return lexical (always) + optional vector hits blended via mean-normalized score."""
+    """Return lexical (always) + optional vector hits blended by a rank-fusion strategy.
+
+    Each leg fetches a fixed candidate pool (``candidates``, default
+    ``settings.HYBRID_CANDIDATE_POOL``, never below ``k``) once; ``fusion`` (default
+    ``settings.HYBRID_FUSION``) re-ranks that pool in memory and the top ``k`` are
+    returned. With ``fused`` (default: ``settings.HYBRID_FUSED_QUERY``) both legs
+    are fetched in a single round-trip; otherwise each leg issues its own queries.
+    """
 
     if not q or not q.strip():
         return []
 
     language = _normalize_language(language)
     limit = max(1, k)
+    pool = max(limit, candidates if candidates is not None else settings.HYBRID_CANDIDATE_POOL)
+    strategy = fusion or settings.HYBRID_FUSION
+    get_fusion(strategy)  # fail fast on unknown names before touching the database
     query_nfc = unicodedata.normalize("NFC", q)
     folded = accent_fold(query_nfc)
+    if fused is None:
+        fused = settings.HYBRID_FUSED_QUERY
 
     async with SessionLocal() as session:
-        lexical_hits = await _lexical_hits(
-            session,
-            folded,
-            language=language,
-            limit=limit,
-            threshold=t,
-        )
-
-        vector_hits: List[Dict[str, Any]] = []
-        if use_vector is not False:
-            vector_hits = await _vector_hits(session, query_nfc, language=language, limit=limit)
-
-    blended = _blend_hits(lexical_hits, vector_hits, limit)
+        if fused:
+            lexical_hits, vector_hits = await _fused_hits(
+                session,
+                folded,
+                query_nfc,
+                language=language,
+                limit=pool,
+                threshold=t,
+                use_vector=use_vector is not False,
+            )
+        else:
+            lexical_hits = await _lexical_hits(
+                session,
+                folded,
+                language=language,
+                limit=pool,
+                threshold=t,
+            )
+
+            vector_hits = []
+            if use_vector is not False:
+                vector_hits = await _vector_hits(session, query_nfc, language=language, limit=pool)
+
+    blended = _blend_hits(lexical_hits, vector_hits, limit, fusion=strategy)
     return blended
 
 
+async def _fused_hits(
+    session: AsyncSession,
+    folded_query: str,
+    query: str,
+    *,
+    language: str,
+    limit: int,
+    threshold: float,
+    use_vector: bool,
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    query_vector = None
+    if use_vector and await _vector_support_ready(session):
+        query_vector = await _embed_query(query)
+
+    params: Dict[str, Any] = {
+        "query_fold": folded_query,
+        "language": language,
+        "limit": limit,
+        "threshold": min(max(threshold, 0.0), 1.0),
+    }
+    if query_vector is None:
+        stmt = _FUSED_LEXICAL_SQL
+    else:
+        stmt = _FUSED_HYBRID_SQL
+        params["query_vector"] = query_vector
+
+    result = await session.execute(stmt, params)
+    lexical_hits: List[Dict[str, Any]] = []
+    vector_hits: List[Dict[str, Any]] = []
+    for row in result.mappings():
+        if row["source"] == "vector":
+            vector_hits.append(_row_to_hit(row, "vector"))
+        else:
+            lexical_hits.append(_row_to_hit(row, "lexical"))
+    return lexical_hits, vector_hits
+
+
+def _row_to_hit(row: Mapping[str, Any], reason: str) -> Dict[str, Any]:
+    return {
+        "segment_id": row["segment_id"],
+        "work_ref": _format_work_ref(row["work_author"], row["work_title"], row["segment_ref"]),
+        "text_nfc": row["text_nfc"],
+        "score": float(row["score"] or 0.0),
+        "reasons": [reason],
+    }
+
+
 async def _lexical_hits(
     session: AsyncSession,
     folded_query: str,
@@ -138,19 +299,7 @@ async def _lexical_hits(
             "limit": limit,
         },
     )
-    rows = result.mappings().all()
-    hits: List[Dict[str, Any]] = []
-    for row in rows:
-        hits.append(
-            {
-                "segment_id": row["segment_id"],
-                "work_ref": _format_work_ref(row["work_author"], row["work_title"], row["segment_ref"]),
-                "text_nfc": row["text_nfc"],
-                "score": float(row["score"] or 0.0),
-                "reasons": ["lexical"],
-            }
-        )
-    return hits
+    return [_row_to_hit(row, "lexical") for row in result.mappings().all()]
 
 
 async def _vector_hits(
@@ -176,22 +325,23 @@ async def _vector_hits(
             "limit": limit,
         },
     )
-    rows = result.mappings().all()
-    hits: List[Dict[str, Any]] = []
-    for row in rows:
-        hits.append(
-            {
-                "segment_id": row["segment_id"],
-                "work_ref": _format_work_ref(row["work_author"], row["work_title"], row["segment_ref"]),
-                "text_nfc": row["text_nfc"],
-                "score": float(row["score"] or 0.0),
-                "reasons": ["vector"],
-            }
-        )
-    return hits
+    return [_row_to_hit(row, "vector") for row in result.mappings().all()]
 
 
 async def _vector_support_ready(session: AsyncSession) -> bool:
+    """Return whether vector search is usable, re-probing the catalog at most once per TTL."""
+
+    global _VECTOR_PROBE
+    now = monotonic()
+    cached = _VECTOR_PROBE
+    if cached is not None and now - cached[0] < settings.HYBRID_VECTOR_PROBE_TTL:
+        return cached[1]
+    ready = await _probe_vector_support(session)
+    _VECTOR_PROBE = (now, ready)
+    return ready
+
+
+async def _probe_vector_support(session: AsyncSession) -> bool:
     ext = await session.execute(_EXTENSION_CHECK_SQL, {"name": "vector"})
     if not ext.first():
         return False
@@ -202,71 +352,50 @@ async def _vector_support_ready(session: AsyncSession) -> bool:
     return bool(has_rows.first())
 
 
-async def _embed_query(query: str) -> List[float] | None:
-    """Placeholder embedding that returns a deterministic unit vector."""
+async def _embed_query(query: str) -> str | None:
+    """Embed the query with the configured backend and return a pgvector literal."""
 
     if not query.strip():
         return None
 
-    dim = max(1, settings.EMBED_DIM)
-    coords = ["1" if i == 0 else "0" for i in range(dim)]
-    return "[" + ",".join(coords) + "]"
+    embedder = get_query_embedder()
+    if embedder is None:
+        return None
+    vector = await embedder.embed(query)
+    if vector is None:
+        return None
+    return to_pgvector(vector)
 
 
 def _blend_hits(
-    lexical_hits: Iterable[Dict[str, Any]],
-    vector_hits: Iterable[Dict[str, Any]],
+    lexical_hits: Sequence[Dict[str, Any]],
+    vector_hits: Sequence[Dict[str, Any]],
     limit: int,
+    fusion: str = "mean",
 ) -> List[Dict[str, Any]]:
-    lexical_map = {hit["segment_id"]: dict(hit) for hit in lexical_hits}
-    vector_map = {hit["segment_id"]: dict(hit) for hit in vector_hits}
-
-    lex_norm = _normalize_scores({k: v["score"] for k, v in lexical_map.items()})
-    vec_norm = _normalize_scores({k: v["score"] for k, v in vector_map.items()})
-
-    merged: List[Dict[str, Any]] = []
-    for seg_id in lexical_map.keys() | vector_map.keys():
-        base = lexical_map.get(seg_id) or vector_map.get(seg_id)
-        if base is None:
-            continue
-        reasons = set(base.get("reasons", []))
-        total = 0.0
-        weight = 0
-        if seg_id in lexical_map:
-            reasons.update(lexical_map[seg_id].get("reasons", []))
-            total += lex_norm.get(seg_id, 0.0)
-            weight += 1
-        if seg_id in vector_map:
-            reasons.update(vector_map[seg_id].get("reasons", []))
-            total += vec_norm.get(seg_id, 0.0)
-            weight += 1
-        score = total / weight if weight else 0.0
-        merged.append(
-            {
-                "segment_id": base["segment_id"],
-                "work_ref": base["work_ref"],
-                "text_nfc": base["text_nfc"],
-                "score": score,
-                "reasons": sorted(reasons),
+    strategy = get_fusion(fusion)
+    fused_scores = strategy(lexical_hits, vector_hits)
+
+    merged_map: Dict[int, Dict[str, Any]] = {}
+    for hit in [*lexical_hits, *vector_hits]:
+        seg_id = hit["segment_id"]
+        entry = merged_map.get(seg_id)
+        if entry is None:
+            merged_map[seg_id] = {
+                "segment_id": seg_id,
+                "work_ref": hit["work_ref"],
+                "text_nfc": hit["text_nfc"],
+                "score": fused_scores.get(seg_id, 0.0),
+                "reasons": set(hit.get("reasons", [])),
             }
-        )
+        else:
+            entry["reasons"].update(hit.get("reasons", []))
 
+    merged = [{**entry, "reasons": sorted(entry["reasons"])} for entry in merged_map.values()]
     merged.sort(key=lambda item: item["score"], reverse=True)
     return merged[:limit]
 
 
-def _normalize_scores(raw: Dict[int, float]) -> Dict[int, float]:
-    if not raw:
-        return {}
-    values = list(raw.values())
-    lo = min(values)
-    hi = max(values)
-    if hi == lo:
-        return {k: 1.0 for k in raw}
-    scale = hi - lo
-    return {k: (v - lo) / scale for k, v in raw.items()}
-
-
 def _format_work_ref(author: str | None, title: str | None, ref: str | None) -> str:
     label = _abbreviate(title) or _abbreviate(author) or "segment"
     return f"{label}.{ref}" if ref else label
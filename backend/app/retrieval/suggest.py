@@ -0,0 +1,121 @@
+"""In-memory lemma prefix index for search type-ahead.
+
+Every lexeme's folded lemma is kept in a sorted array per language, so a
+prefix lookup is a ``bisect`` plus a short scan and never touches Postgres.
+The index is rebuilt when the corpus version changes (ingestion calls
+``bump_corpus_version()``); until the rebuild finishes the previous index
+keeps answering.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import logging
+from bisect import bisect_left
+from itertools import islice
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Tuple
+
+from sqlalchemy import text
+
+from app.core.shared_cache import corpus_version
+from app.db.session import SessionLocal
+
+_LOGGER = logging.getLogger("app.retrieval.suggest")
+
+_LEMMAS_SQL = text(
+    """
+    SELECT lang.code AS language, lex.lemma_fold, lex.lemma, lex.id
+    FROM lexeme AS lex
+    JOIN language AS lang ON lang.id = lex.language_id
+    WHERE lex.lemma_fold <> ''
+    """
+)
+
+
+class Suggestion(NamedTuple):
+    fold: str
+    lemma: str
+    language: str
+    lexeme_id: int
+
+
+class LemmaPrefixIndex:
+    """Sorted folded lemmas per language; lookups return matches in folded order."""
+
+    def __init__(self, rows: Iterable[Tuple[str, str, str, int]]) -> None:
+        by_language: Dict[str, List[Suggestion]] = {}
+        for language, fold, lemma, lexeme_id in rows:
+            by_language.setdefault(language, []).append(Suggestion(fold, lemma, language, lexeme_id))
+        self._entries: Dict[str, List[Suggestion]] = {}
+        self._keys: Dict[str, List[str]] = {}
+        for language, entries in by_language.items():
+            entries.sort()
+            self._entries[language] = entries
+            self._keys[language] = [entry.fold for entry in entries]
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def lookup(self, prefix: str, *, language: str | None = None, limit: int = 10) -> List[Suggestion]:
+        """Up to ``limit`` entries whose folded lemma starts with the folded ``prefix``."""
+
+        if not prefix or limit <= 0:
+            return []
+        languages = [language] if language is not None else sorted(self._entries)
+        streams = [self._scan(code, prefix) for code in languages if code in self._entries]
+        if len(streams) == 1:
+            return list(islice(streams[0], limit))
+        return list(islice(heapq.merge(*streams), limit))
+
+    def _scan(self, language: str, prefix: str) -> Iterator[Suggestion]:
+        entries = self._entries[language]
+        for index in range(bisect_left(self._keys[language], prefix), len(entries)):
+            entry = entries[index]
+            if not entry.fold.startswith(prefix):
+                return
+            yield entry
+
+
+_INDEX: LemmaPrefixIndex | None = None
+_INDEX_VERSION: int | None = None
+_BUILD_LOCK = asyncio.Lock()
+_REFRESH_TASK: asyncio.Task[None] | None = None
+
+
+async def get_lemma_index() -> LemmaPrefixIndex:
+    """Current index; only the first call (or a call after a failed first build) waits on Postgres."""
+
+    global _REFRESH_TASK
+    version = await corpus_version()
+    if _INDEX is None:
+        await _rebuild(version)
+    elif version != _INDEX_VERSION and (_REFRESH_TASK is None or _REFRESH_TASK.done()):
+        _REFRESH_TASK = asyncio.create_task(_refresh_in_background(version))
+    assert _INDEX is not None
+    return _INDEX
+
+
+def invalidate_lemma_index() -> None:
+    global _INDEX, _INDEX_VERSION
+    _INDEX = None
+    _INDEX_VERSION = None
+
+
+async def _rebuild(version: int) -> None:
+    global _INDEX, _INDEX_VERSION
+    async with _BUILD_LOCK:
+        if _INDEX is not None and _INDEX_VERSION == version:
+            return
+        async with SessionLocal() as session:
+            rows = (await session.execute(_LEMMAS_SQL)).all()
+        _INDEX = LemmaPrefixIndex((row[0], row[1], row[2], row[3]) for row in rows)
+        _INDEX_VERSION = version
+        _LOGGER.info("Loaded %d lemmas into the suggest index (corpus v%d)", len(_INDEX), version)
+
+
+async def _refresh_in_background(version: int) -> None:
+    try:
+        await _rebuild(version)
+    except Exception:  # keep serving the previous index
+        _LOGGER.exception("Suggest index refresh failed; serving the previous index")
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from app.core.cache import AsyncTTLCache
+
+
+def test_cache_evicts_least_recently_used_by_bytes():
+    cache: AsyncTTLCache[str, str] = AsyncTTLCache(ttl=60, max_bytes=10)
+    cache.set("a", "aaaa")
+    cache.set("b", "bbbb")
+    assert cache.get("a") == "aaaa"  # touch "a" so "b" is the eviction candidate
+
+    cache.set("c", "cccc")
+
+    assert cache.get("b") is None
+    assert cache.get("a") == "aaaa"
+    assert cache.total_bytes == 8
+
+
+def test_expired_entries_are_only_served_as_stale():
+    cache: AsyncTTLCache[str, str] = AsyncTTLCache(ttl=-1, max_bytes=100)
+    cache.set("k", "value")
+
+    assert cache.get("k") is None
+    assert cache.get("k", allow_stale=True) == "value"
+
+
+async def test_get_or_load_is_single_flight():
+    cache: AsyncTTLCache[str, int] = AsyncTTLCache(ttl=60, max_bytes=1024)
+    calls = 0
+
+    async def loader() -> int:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return 42
+
+    results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(5)))
+
+    assert results == [42] * 5
+    assert calls == 1
+    assert await cache.get_or_load("k", loader) == 42
+    assert calls == 1
+
+
+async def test_get_or_load_errors_reach_every_waiter_and_are_not_cached():
+    cache: AsyncTTLCache[str, int] = AsyncTTLCache(ttl=60, max_bytes=1024)
+
+    async def failing() -> int:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(
+        cache.get_or_load("k", failing), cache.get_or_load("k", failing), return_exceptions=True
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert len(cache) == 0
+    with pytest.raises(RuntimeError):
+        await cache.get_or_load("k", failing)
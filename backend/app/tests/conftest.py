@@ -6,6 +6,8 @@ from pathlib import Path
 
 import pytest
 import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
 from sqlalchemy import text
 
 if os.name == "nt":  # psycopg async requires selector loop on Windows
@@ -40,6 +42,8 @@ else:
 os.environ.setdefault("REDIS_URL", "redis://localhost:6379/0")
 os.environ.setdefault("TESTING", "1")
 
+from app.core import shared_cache as _shared_cache  # noqa: E402
+from app.db.session import get_db as _get_db  # noqa: E402
 from app.db.util import engine as _engine  # noqa: E402
 
 if RUN_DB_TESTS:
@@ -62,10 +66,14 @@ if RUN_DB_TESTS:
     except Exception:
         pass
 
+    import app.api.search as _search  # noqa: E402
     import app.ling.morph as _morph  # noqa: E402
     import app.main as _main  # noqa: E402
     import app.retrieval.hybrid as _hybrid  # noqa: E402
+    import app.retrieval.suggest as _suggest  # noqa: E402
 
+    _search.SessionLocal = _session.SessionLocal
+    _suggest.SessionLocal = _session.SessionLocal
     _morph.SessionLocal = _session.SessionLocal
     _hybrid.SessionLocal = _session.SessionLocal
     _main.SessionLocal = _session.SessionLocal
@@ -90,9 +98,28 @@ def run_async(coro):
     return loop.run_until_complete(coro)
 
 
-if RUN_DB_TESTS:
-    from httpx import ASGITransport, AsyncClient
+@pytest.fixture
+def asgi_client(monkeypatch):
+    """Factory for an in-process HTTP client with the Redis response tier disabled.
+
+    ``asgi_client(router, ...)`` mounts the routers on a bare app whose ``get_db``
+    yields ``None`` (tests monkeypatch the loaders); ``asgi_client(app=...)``
+    wraps an app the test built itself.
+    """
+    monkeypatch.setattr(_shared_cache, "get_shared_cache", lambda: None)
+
+    def _build(*routers, app: FastAPI | None = None) -> AsyncClient:
+        if app is None:
+            app = FastAPI()
+            for router in routers:
+                app.include_router(router)
+            app.dependency_overrides[_get_db] = lambda: None
+        return AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
 
+    return _build
+
+
+if RUN_DB_TESTS:
     from app.core.config import settings
     from app.db.init_db import initialize_database
     from app.db.util import SessionLocal, text_with_json
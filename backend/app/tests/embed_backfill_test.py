@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+from concurrent.futures import Future
+
+import pytest
+from pipeline import embed_backfill
+
+TARGET = embed_backfill.TARGETS["text_segment"]
+ROWS = [(row_id, f"στιχος {row_id}") for row_id in range(1, 11)]
+
+
+class _InlinePool:
+    """Synchronous stand-in for ProcessPoolExecutor (runs the initializer in-process)."""
+
+    def __init__(self, max_workers, initializer, initargs):
+        initializer(*initargs)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def submit(self, fn, *args):
+        future: Future = Future()
+        future.set_result(fn(*args))
+        return future
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    state = {"afters": [], "written": [], "fail_on": None}
+
+    def fake_stream(engine, target, *, after, batch_size):
+        state["afters"].append(after)
+        pending = [row for row in ROWS if row[0] > after]
+        for start in range(0, len(pending), batch_size):
+            yield pending[start : start + batch_size]
+
+    def fake_write(engine, target, rows):
+        if state["fail_on"] is not None and rows[0][0] >= state["fail_on"]:
+            raise RuntimeError("connection lost")
+        state["written"].append([row_id for row_id, _ in rows])
+        return len(rows)
+
+    monkeypatch.setattr(embed_backfill, "ProcessPoolExecutor", _InlinePool)
+    monkeypatch.setattr(embed_backfill, "_WORKER_EMBEDDER", None)
+    monkeypatch.setattr(embed_backfill, "stream_batches", fake_stream)
+    monkeypatch.setattr(embed_backfill, "write_batch", fake_write)
+    return state
+
+
+def _run(checkpoint, **overrides):
+    options = {"backend": "hashed", "dim": 8, "batch_size": 4, "workers": 1, "limit": None}
+    options.update(overrides)
+    return embed_backfill.backfill(None, TARGET, checkpoint=checkpoint, **options)
+
+
+def test_limit_slices_the_last_batch_and_checkpoints_it(tmp_path, fake_db):
+    checkpoint = tmp_path / "ckpt.json"
+
+    summary = _run(checkpoint, limit=6)
+
+    assert fake_db["written"] == [[1, 2, 3, 4], [5, 6]]
+    assert summary["embedded"] == 6 and summary["batches"] == 2 and summary["last_id"] == 6
+    assert embed_backfill.load_checkpoint(checkpoint) == {"text_segment:hashed:8": 6}
+
+
+def test_resume_starts_after_the_checkpointed_id(tmp_path, fake_db):
+    checkpoint = tmp_path / "ckpt.json"
+    _run(checkpoint, limit=6)
+    fake_db["written"].clear()
+
+    summary = _run(checkpoint)
+
+    assert fake_db["afters"] == [0, 6]
+    assert fake_db["written"] == [[7, 8, 9, 10]]
+    assert summary["last_id"] == 10
+
+
+def test_checkpoint_is_keyed_by_backend_and_dimension(tmp_path, fake_db):
+    checkpoint = tmp_path / "ckpt.json"
+    _run(checkpoint, limit=6)
+
+    _run(checkpoint, dim=16, limit=2)
+
+    assert fake_db["afters"] == [0, 0]
+    assert embed_backfill.load_checkpoint(checkpoint) == {
+        "text_segment:hashed:8": 6,
+        "text_segment:hashed:16": 2,
+    }
+
+
+def test_failed_write_keeps_last_committed_checkpoint(tmp_path, fake_db):
+    checkpoint = tmp_path / "ckpt.json"
+    fake_db["fail_on"] = 5
+
+    with pytest.raises(RuntimeError):
+        _run(checkpoint)
+
+    assert fake_db["written"] == [[1, 2, 3, 4]]
+    assert embed_backfill.load_checkpoint(checkpoint) == {"text_segment:hashed:8": 4}
+
+
+def test_unreadable_checkpoint_starts_from_scratch(tmp_path):
+    checkpoint = tmp_path / "ckpt.json"
+    checkpoint.write_text("{not json", encoding="utf-8")
+    assert embed_backfill.load_checkpoint(checkpoint) == {}
+
+    embed_backfill.save_checkpoint(checkpoint, {"grammar_topic:hashed:8": 3})
+    assert embed_backfill.load_checkpoint(checkpoint) == {"grammar_topic:hashed:8": 3}
+    assert not checkpoint.with_suffix(".json.tmp").exists()
+
+
+class _FakeCopy:
+    def __init__(self, sink):
+        self.sink = sink
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def write_row(self, row):
+        self.sink.append(row)
+
+
+class _FakeCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.rowcount = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, sql):
+        self.conn.statements.append(sql)
+        if sql.startswith("UPDATE"):
+            if self.conn.fail_update:
+                raise RuntimeError("bad vector literal")
+            self.rowcount = len(self.conn.copied)
+
+    def copy(self, sql):
+        self.conn.statements.append(sql)
+        return _FakeCopy(self.conn.copied)
+
+
+class _FakeDriverConnection:
+    def __init__(self, fail_update=False):
+        self.fail_update = fail_update
+        self.statements: list[str] = []
+        self.copied: list[tuple[int, str]] = []
+        self.committed = self.rolled_back = False
+
+    def cursor(self):
+        return _FakeCursor(self)
+
+    def commit(self):
+        self.committed = True
+
+    def rollback(self):
+        self.rolled_back = True
+
+
+class _FakeEngine:
+    def __init__(self, driver):
+        self.driver = driver
+        self.closed = False
+
+    def raw_connection(self):
+        engine = self
+
+        class _Raw:
+            driver_connection = engine.driver
+
+            def close(self):
+                engine.closed = True
+
+        return _Raw()
+
+
+def test_write_batch_copies_into_staging_then_updates_once():
+    driver = _FakeDriverConnection()
+    engine = _FakeEngine(driver)
+    rows = [(1, "[0.1,0.2]"), (2, "[0.3,0.4]")]
+
+    assert embed_backfill.write_batch(engine, TARGET, rows) == 2
+
+    assert driver.copied == rows
+    assert [sql.split()[0] for sql in driver.statements] == ["CREATE", "COPY", "UPDATE"]
+    assert "UPDATE text_segment AS tgt" in driver.statements[-1]
+    assert driver.committed and not driver.rolled_back and engine.closed
+
+
+def test_write_batch_rolls_back_on_failure():
+    driver = _FakeDriverConnection(fail_update=True)
+    engine = _FakeEngine(driver)
+
+    with pytest.raises(RuntimeError):
+        embed_backfill.write_batch(engine, TARGET, [(1, "[0.1]")])
+
+    assert driver.rolled_back and not driver.committed and engine.closed
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import threading
+
+from app.ingestion.normalize import accent_fold
+from app.retrieval.embedder import BatchingEmbedder, HashedNgramEmbedder, to_pgvector
+
+
+class _CountingEmbedder(HashedNgramEmbedder):
+    def __init__(self, dim: int) -> None:
+        super().__init__(dim)
+        self.calls: list[list[str]] = []
+
+    def embed_many(self, texts):
+        self.calls.append(list(texts))
+        return super().embed_many(texts)
+
+
+def test_hashed_embedder_is_deterministic_and_accent_insensitive():
+    embedder = HashedNgramEmbedder(64)
+    first, second, plain = embedder.embed_many(["μῆνιν ἄειδε", "μῆνιν ἄειδε", "ΜΗΝΙΝ αειδε"])
+
+    assert first == second
+    assert first == plain
+    assert math.isclose(sum(x * x for x in first), 1.0, rel_tol=1e-9)
+
+
+def test_hashed_embedder_returns_zero_vector_for_blank_text():
+    (vector,) = HashedNgramEmbedder(8).embed_many(["   "])
+    assert vector == [0.0] * 8
+
+
+def test_pgvector_literal_format():
+    assert to_pgvector([1.0, 0.0, -0.5]) == "[1,0,-0.5]"
+
+
+async def test_batching_embedder_coalesces_and_caches():
+    backend = _CountingEmbedder(16)
+    batcher = BatchingEmbedder(backend, max_batch=8, max_wait=0.01)
+
+    results = await asyncio.gather(
+        batcher.embed("θεά"),
+        batcher.embed("θεὰ"),
+        batcher.embed("Ἀχιλλεύς"),
+    )
+
+    assert len(backend.calls) == 1
+    assert sorted(backend.calls[0]) == sorted({accent_fold("θεά"), accent_fold("Ἀχιλλεύς")})
+    assert results[0] == results[1]
+
+    await batcher.embed("θεα")
+    assert len(backend.calls) == 1
+
+
+class _GatedEmbedder(HashedNgramEmbedder):
+    def __init__(self, dim: int) -> None:
+        super().__init__(dim)
+        self.release = threading.Event()
+
+    def embed_many(self, texts):
+        self.release.wait(timeout=5)
+        return super().embed_many(texts)
+
+
+async def test_batching_embedder_holds_in_flight_flush_tasks():
+    backend = _GatedEmbedder(8)
+    batcher = BatchingEmbedder(backend, max_batch=1, max_wait=0.01)
+
+    pending = asyncio.ensure_future(batcher.embed("μῆνιν"))
+    await asyncio.sleep(0.01)
+    assert len(batcher._flush_tasks) == 1
+
+    backend.release.set()
+    assert await pending == backend.embed_many(["μηνιν"])[0]
+    await asyncio.sleep(0)
+    assert not batcher._flush_tasks
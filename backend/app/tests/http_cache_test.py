@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+from fastapi import Depends, FastAPI, Response
+
+from app.core import http_cache, shared_cache
+from app.core.http_cache import conditional_cache, etag_matches, mark_uncacheable
+
+
+def _app(calls: list[str]) -> FastAPI:
+    app = FastAPI()
+
+    @app.get("/items", dependencies=[Depends(conditional_cache(30))])
+    async def items(response: Response, degraded: bool = False):
+        calls.append("items")
+        if degraded:
+            mark_uncacheable(response)
+        return {"ok": True}
+
+    return app
+
+
+async def test_matching_etag_short_circuits_until_corpus_version_bumps(asgi_client):
+    calls: list[str] = []
+    async with asgi_client(app=_app(calls)) as client:
+        first = await client.get("/items")
+        etag = first.headers["etag"]
+        cached = await client.get("/items", headers={"If-None-Match": etag})
+        other_query = await client.get("/items?x=1", headers={"If-None-Match": etag})
+        await shared_cache.bump_corpus_version()
+        after_bump = await client.get("/items", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.headers["cache-control"] == "public, max-age=30"
+    assert cached.status_code == 304
+    assert cached.content == b""
+    assert other_query.status_code == 200
+    assert after_bump.status_code == 200
+    assert after_bump.headers["etag"] != etag
+    assert calls == ["items", "items", "items"]
+
+
+async def test_degraded_responses_drop_validators(asgi_client):
+    async with asgi_client(app=_app([])) as client:
+        response = await client.get("/items?degraded=true")
+
+    assert "etag" not in response.headers
+    assert response.headers["cache-control"] == "no-store"
+
+
+def test_etag_matches_handles_lists_weak_tags_and_wildcards():
+    assert etag_matches('"a", W/"b"', '"b"')
+    assert etag_matches("*", '"b"')
+    assert not etag_matches('"a"', '"b"')
+    assert not etag_matches(None, '"b"')
+
+
+def test_default_release_is_the_checkout_commit(tmp_path):
+    git_dir = tmp_path / ".git"
+    (git_dir / "refs" / "heads").mkdir(parents=True)
+    (git_dir / "HEAD").write_text("ref: refs/heads/main\n")
+    (git_dir / "packed-refs").write_text("# pack-refs\nabc123 refs/heads/main\n")
+    module = tmp_path / "app" / "core" / "http_cache.py"
+
+    assert http_cache._detect_release(module) == "abc123"
+    (git_dir / "refs" / "heads" / "main").write_text("def456\n")
+    assert http_cache._detect_release(module) == "def456"
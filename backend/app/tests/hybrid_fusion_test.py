@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import pytest
+
+from app.core.config import Settings
+from app.retrieval.fusion import get_fusion, min_max_mean, reciprocal_rank_fusion, weighted_linear
+from app.retrieval.hybrid import _blend_hits
+
+
+def _hit(seg_id: int, score: float, reason: str) -> dict:
+    return {
+        "segment_id": seg_id,
+        "work_ref": f"Il.1.{seg_id}",
+        "text_nfc": "",
+        "score": score,
+        "reasons": [reason],
+    }
+
+
+LEXICAL = [_hit(1, 0.9, "lexical"), _hit(2, 0.4, "lexical")]
+VECTOR = [_hit(2, 0.8, "vector"), _hit(3, 0.7, "vector")]
+
+
+def test_rrf_rewards_candidates_present_on_both_legs():
+    fused = reciprocal_rank_fusion(LEXICAL, VECTOR)
+    assert max(fused, key=fused.get) == 2
+    assert fused[1] > fused[3]
+
+
+def test_weighted_uses_raw_scores_so_single_hits_keep_their_magnitude():
+    fused = weighted_linear([_hit(1, 0.2, "lexical")], [], vector_weight=0.5)
+    assert fused == {1: pytest.approx(0.1)}
+    # min-max normalization inflates a lone weak hit to a perfect score
+    assert min_max_mean([_hit(1, 0.2, "lexical")], []) == {1: 1.0}
+
+
+def test_blend_merges_reasons_and_trims_to_limit():
+    blended = _blend_hits(LEXICAL, VECTOR, limit=2, fusion="rrf")
+    assert [hit["segment_id"] for hit in blended] == [2, 1]
+    assert blended[0]["reasons"] == ["lexical", "vector"]
+
+
+def test_unknown_fusion_is_rejected():
+    with pytest.raises(ValueError):
+        get_fusion("borda")
+
+
+def test_default_fusion_keeps_normalized_score_scale():
+    # /reader/analyze clients read retrieval scores as 0..1 relevance.
+    assert Settings.model_fields["HYBRID_FUSION"].default == "mean"
+    assert max(get_fusion("mean")(LEXICAL, VECTOR).values()) <= 1.0
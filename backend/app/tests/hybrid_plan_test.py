@@ -0,0 +1,95 @@
+"""Fused hybrid query: one round-trip, and the trigram index stays usable (EXPLAIN needs RUN_DB_TESTS=1)."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from app.retrieval import hybrid
+from app.tests.search_plan_test import _index_names
+
+
+async def test_fused_lexical_leg_uses_trigram_index(session):
+    # Sequential scans win on a small test corpus; disabling them shows which
+    # indexes the planner *can* use for this statement shape.
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    result = await session.execute(
+        text(f"EXPLAIN (FORMAT JSON) {hybrid._FUSED_LEXICAL_SQL.text}"),
+        {"query_fold": "μηνιν", "language": "grc-cls", "limit": 20, "threshold": 0.1},
+    )
+    assert "ix_text_segment_text_fold_trgm" in set(_index_names(result.scalar_one()))
+    await session.rollback()
+
+
+def _row(source: str, segment_id: int, score: float) -> dict:
+    return {
+        "source": source,
+        "segment_id": segment_id,
+        "segment_ref": f"1.{segment_id}",
+        "text_nfc": f"line {segment_id}",
+        "text_raw": None,
+        "work_author": "Homer",
+        "work_title": "Iliad",
+        "score": score,
+    }
+
+
+class _Result:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def mappings(self):
+        return self._rows
+
+
+class _RecordingSession:
+    def __init__(self, rows):
+        self.rows = rows
+        self.calls: list[tuple[object, dict]] = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    async def execute(self, statement, params=None):
+        self.calls.append((statement, params))
+        return _Result(self.rows)
+
+
+async def test_fused_search_ranks_both_legs_from_a_single_statement(monkeypatch):
+    session = _RecordingSession(
+        [
+            _row("lexical", 1, 0.9),
+            _row("lexical", 2, 0.5),
+            _row("lexical", 3, 0.1),
+            _row("vector", 2, 0.8),
+            _row("vector", 4, 0.2),
+        ]
+    )
+
+    async def ready(_session):
+        return True
+
+    async def embed(_query):
+        return "[0.1,0.2]"
+
+    monkeypatch.setattr(hybrid, "SessionLocal", lambda: session)
+    monkeypatch.setattr(hybrid, "_vector_support_ready", ready)
+    monkeypatch.setattr(hybrid, "_embed_query", embed)
+
+    hits = await hybrid.hybrid_search("μῆνιν", k=3, t=1.5, fused=True, fusion="mean")
+
+    # The trigram threshold rides along in the fused statement: one execute, no set_config call.
+    assert len(session.calls) == 1
+    statement, params = session.calls[0]
+    assert statement is hybrid._FUSED_HYBRID_SQL
+    assert params["threshold"] == 1.0
+    assert params["query_vector"] == "[0.1,0.2]"
+
+    # min-max mean: 1 -> 1.0 (lexical only), 2 -> (0.5 + 1.0) / 2, 3 -> 0.0, 4 -> 0.0
+    assert [hit["segment_id"] for hit in hits] == [1, 2, 3]
+    assert hits[0]["work_ref"] == "Il.1.1"
+    assert hits[1]["reasons"] == ["lexical", "vector"]
+    assert hits[1]["score"] == pytest.approx(0.75)
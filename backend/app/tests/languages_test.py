@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+from app.api import languages
+
+
+async def test_languages_response_is_memoized_with_etag(monkeypatch, asgi_client):
+    languages._LANGUAGES_CACHE.invalidate()
+    calls = 0
+
+    async def fake_load(session):
+        nonlocal calls
+        calls += 1
+        return [{"code": "grc", "work_count": 2}]
+
+    monkeypatch.setattr(languages, "_load_languages", fake_load)
+    async with asgi_client(languages.router) as client:
+        first = await client.get("/languages")
+        revalidated = await client.get("/languages", headers={"If-None-Match": first.headers["etag"]})
+
+    assert first.status_code == 200
+    assert first.json() == [{"code": "grc", "work_count": 2}]
+    assert first.headers["cache-control"].startswith("public")
+    assert revalidated.status_code == 304
+    assert calls == 1
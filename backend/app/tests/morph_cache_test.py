@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.ling import morph
+from app.ling.morph import _AnalysisCache
+
+
+def test_analysis_cache_serves_hits_and_negative_entries():
+    cache = _AnalysisCache(max_entries=8, ttl_seconds=60)
+    cache.put_many("grc", {"θεα": {"lemma": "θεά", "morph": "n-s---fn-", "confidence": 1.0}, "ξυζ": None})
+
+    found, missing = cache.get_many("grc", ["θεα", "ξυζ", "μηνιν"])
+
+    assert found["θεα"]["lemma"] == "θεά"
+    assert found["ξυζ"] is None
+    assert missing == ["μηνιν"]
+
+
+def test_analysis_cache_is_bounded_per_language_and_invalidates():
+    cache = _AnalysisCache(max_entries=2, ttl_seconds=60)
+    cache.put_many("grc", {"a": None, "b": None, "c": None})
+    cache.put_many("lat", {"a": None})
+
+    _, missing = cache.get_many("grc", ["a", "b", "c"])
+    assert missing == ["a"]
+
+    cache.invalidate("grc")
+    _, missing = cache.get_many("grc", ["b"])
+    assert missing == ["b"]
+    _, missing = cache.get_many("lat", ["a"])
+    assert missing == []
+
+
+def test_analysis_cache_expires_entries():
+    cache = _AnalysisCache(max_entries=2, ttl_seconds=-1)
+    cache.put_many("grc", {"a": None})
+    _, missing = cache.get_many("grc", ["a"])
+    assert missing == ["a"]
+
+
+class _RecordingLemmatizer:
+    def __init__(self) -> None:
+        self.calls: list[list[str]] = []
+
+    def lemmatize(self, values):
+        self.calls.append(list(values))
+        return [(value, value.upper()) for value in values]
+
+
+async def test_cltk_batcher_coalesces_concurrent_requests_and_memoizes(monkeypatch):
+    lemmatizer = _RecordingLemmatizer()
+    monkeypatch.setitem(morph._CLTK_LEMMATIZERS, "lat", lemmatizer)
+    batcher = morph._CltkBatcher("lat", max_wait=0.005, cache_size=16)
+
+    first, second = await asyncio.gather(
+        batcher.lemmatize({"arma": "arma", "virum": "virum"}),
+        batcher.lemmatize({"virum": "virum", "cano": "cano"}),
+    )
+
+    assert lemmatizer.calls == [["arma", "virum", "cano"]]
+    assert first == {"arma": "ARMA", "virum": "VIRUM"}
+    assert second == {"virum": "VIRUM", "cano": "CANO"}
+
+    assert await batcher.lemmatize({"cano": "cano"}) == {"cano": "CANO"}
+    assert len(lemmatizer.calls) == 1
+
+
+async def test_warmed_family_lemmatizer_serves_dialect_codes(monkeypatch):
+    monkeypatch.setattr(morph, "_CLTK_LEMMATIZERS", {})
+    monkeypatch.setattr(morph, "_CLTK_INIT_ERRORS", {})
+    built: list[str] = []
+
+    def fake_load(lang, language):
+        built.append(lang)
+        morph._CLTK_LEMMATIZERS[lang] = _RecordingLemmatizer()
+        return morph._CLTK_LEMMATIZERS[lang]
+
+    monkeypatch.setattr(morph, "_load_cltk_lemmatizer", fake_load)
+    await morph.warm_cltk_lemmatizers(["grc"])
+
+    assert morph._get_cltk_lemmatizer("grc-cls") is morph._CLTK_LEMMATIZERS["grc"]
+    assert built == ["grc"]
+
+
+async def test_cached_lookup_drops_analyses_when_corpus_version_changes(monkeypatch):
+    version = 1
+    queried: list[list[str]] = []
+
+    async def fake_version():
+        return version
+
+    class _Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    async def fake_query(session, folds, language):
+        queried.append(list(folds))
+        return {"μηνιν": {"lemma": "μῆνις", "morph": None, "confidence": 1.0}}
+
+    monkeypatch.setattr(morph, "_ANALYSIS_CACHE", _AnalysisCache(max_entries=8, ttl_seconds=3600))
+    monkeypatch.setattr(morph, "corpus_version", fake_version)
+    monkeypatch.setattr(morph, "SessionLocal", _Session)
+    monkeypatch.setattr(morph, "_perseus_query", fake_query)
+    monkeypatch.setattr(morph, "get_morph_dict", lambda language: None)
+
+    morph._ANALYSIS_CACHE.sync_version(1)
+    morph._ANALYSIS_CACHE.put_many("grc-cls", {"μηνιν": None})
+    assert await morph._cached_perseus_lookup(["μηνιν"], "grc-cls") == {}
+    assert queried == []
+
+    version = 2
+    found = await morph._cached_perseus_lookup(["μηνιν"], "grc-cls")
+    assert found["μηνιν"]["lemma"] == "μῆνις"
+    assert queried == [["μηνιν"]]
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from app.core.config import settings
+from app.ling import morph_dict as morph_dict_module
+from app.ling.morph_dict import MorphDict, get_morph_dict, reset_morph_dicts, write_morph_dict
+
+
+def test_morph_dict_round_trip(tmp_path):
+    path = tmp_path / "grc.mdict"
+    entries = [
+        ("μηνιν", "μῆνις", "n-s---fa-", 1.0),
+        ("θεα", "θεά", "n-s---fv-", 0.75),
+        ("αειδε", "ἀείδω", None, 0.5),
+        ("θεα", "ignored duplicate", None, 0.1),
+    ]
+
+    assert write_morph_dict(entries, path) == 3
+
+    morph_dict = MorphDict(path)
+    try:
+        assert morph_dict.lookup("θεα") == {"lemma": "θεά", "morph": "n-s---fv-", "confidence": 0.75}
+        assert morph_dict.lookup("αειδε")["morph"] is None
+        assert morph_dict.lookup("ουκ") is None
+        assert set(morph_dict.get_many(["μηνιν", "ουκ", "αειδε"])) == {"μηνιν", "αειδε"}
+    finally:
+        morph_dict.close()
+
+
+def test_morph_dict_handles_empty_file(tmp_path):
+    path = tmp_path / "lat.mdict"
+    write_morph_dict([], path)
+
+    morph_dict = MorphDict(path)
+    try:
+        assert morph_dict.lookup("arma") is None
+    finally:
+        morph_dict.close()
+
+
+def test_get_morph_dict_remaps_rebuilt_files(tmp_path, monkeypatch):
+    monkeypatch.setattr(settings, "MORPH_DICT_DIR", str(tmp_path))
+    monkeypatch.setattr(settings, "MORPH_DICT_ENABLED", True)
+    monkeypatch.setattr(morph_dict_module, "_LOADED", {})
+    path = tmp_path / "lat.mdict"
+    try:
+        assert get_morph_dict("lat") is None
+
+        write_morph_dict([("arma", "arma", None, 1.0)], path)
+        first = get_morph_dict("lat")
+        assert first.lookup("arma")["lemma"] == "arma"
+        assert get_morph_dict("lat") is first
+
+        write_morph_dict([("arma", "armum", None, 1.0), ("cano", "cano", None, 1.0)], path)
+        second = get_morph_dict("lat")
+        assert second is not first
+        assert second.lookup("arma")["lemma"] == "armum"
+    finally:
+        reset_morph_dicts()
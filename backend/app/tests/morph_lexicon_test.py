@@ -0,0 +1,63 @@
+"""morph_lexicon view and refresh helper against a real database (needs RUN_DB_TESTS=1)."""
+
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+
+from app.ling import morph
+
+_MIGRATION = Path(__file__).resolve().parents[2] / "migrations" / "versions" / "20251031_add_morph_lexicon.py"
+
+
+async def _ensure_view(session) -> None:
+    spec = importlib.util.spec_from_file_location("morph_lexicon_migration", _MIGRATION)
+    migration = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(migration)
+    await session.execute(text(migration.MORPH_LEXICON_SQL))
+    await session.execute(
+        text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ux_morph_lexicon_language_fold "
+            "ON morph_lexicon (language, surface_fold)"
+        )
+    )
+    await session.commit()
+
+
+async def test_view_lookup_matches_token_aggregate_after_refresh(session, ensure_iliad_sample, monkeypatch):
+    await _ensure_view(session)
+    fold = (
+        await session.execute(
+            text(
+                "SELECT tk.surface_fold FROM token AS tk "
+                "JOIN text_segment AS seg ON seg.id = tk.segment_id "
+                "JOIN text_work AS work ON work.id = seg.work_id "
+                "JOIN language AS lang ON lang.id = work.language_id "
+                "WHERE lang.code = 'grc-cls' AND tk.lemma IS NOT NULL "
+                "LIMIT 1"
+            )
+        )
+    ).scalar()
+    if fold is None:
+        pytest.skip("no lemmatized tokens ingested")
+
+    assert await morph.refresh_morph_lexicon(session) is True
+    from_view = await morph._perseus_query(session, [fold], "grc-cls")
+
+    monkeypatch.setattr(morph, "_LEXICON_READY", False)
+    from_tokens = await morph._perseus_query(session, [fold], "grc-cls")
+
+    assert from_view[fold]["lemma"] == from_tokens[fold]["lemma"]
+    assert from_view[fold]["confidence"] == pytest.approx(from_tokens[fold]["confidence"])
+
+
+async def test_refresh_clears_cached_analyses(session):
+    await _ensure_view(session)
+    morph._ANALYSIS_CACHE.put_many("grc-cls", {"μηνιν": None})
+
+    assert await morph.refresh_morph_lexicon(session) is True
+    _, missing = morph._ANALYSIS_CACHE.get_many("grc-cls", ["μηνιν"])
+    assert missing == ["μηνιν"]
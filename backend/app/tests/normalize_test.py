@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import unicodedata
+
+from app.ingestion import normalize
+from app.ingestion.normalize import accent_fold
+
+
+def test_fast_path_matches_generic_fold_for_every_served_code_point():
+    for lo, hi in normalize._FAST_RANGES:
+        for cp in range(lo, hi + 1):
+            ch = chr(cp)
+            assert normalize._accent_fold(ch) == normalize._fold_generic(ch), hex(cp)
+
+
+def test_fast_path_matches_generic_fold_on_decomposed_and_mixed_text():
+    samples = [
+        "Μῆνιν ἄειδε, θεὰ, Πηληϊάδεω Ἀχιλῆος",
+        unicodedata.normalize("NFD", "οὐλομένην, ἣ μυρί᾽ Ἀχαιοῖς ἄλγε᾽ ἔθηκε"),
+        "ᾼ ᾳ ΐ ς Σ",
+        "Arma virumque canō, Trōiae quī prīmus ab ōrīs",
+        "בְּרֵאשִׁית בָּרָא אֱלֹהִים",
+        "ⲁⲛⲟⲕ ⲡⲉ",
+        "Кириллица",  # outside the table: generic path
+    ]
+    for sample in samples:
+        assert normalize._accent_fold(sample) == normalize._fold_generic(sample)
+        assert accent_fold(sample) == normalize._fold_generic(sample)
+
+
+def test_accent_fold_strips_marks_and_casefolds():
+    assert accent_fold("Ἀχιλῆος") == "αχιληοσ"
+    assert accent_fold("ΘΕᾺ") == "θεα"
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import asyncio
+import json
+
+import pytest
+
+from app.api import reader
+
+
+async def _fake_analyze_tokens(tokens, language="grc"):
+    return [{"lemma": token.lower(), "morph": "x", "confidence": 1.0} for token in tokens]
+
+
+async def _fake_hybrid_search(query, *, language, fusion=None):
+    return [{"segment_id": 1, "work_ref": "Il.1.1", "text_nfc": query, "score": 1.0, "reasons": ["lexical"]}]
+
+
+@pytest.fixture
+def reader_client(monkeypatch, asgi_client):
+    monkeypatch.setattr(reader, "analyze_tokens", _fake_analyze_tokens)
+    monkeypatch.setattr(reader, "hybrid_search", _fake_hybrid_search)
+    return asgi_client(reader.router)
+
+
+async def test_analyze_streams_tokens_first_then_sections(reader_client):
+    async with reader_client as client:
+        response = await client.post("/reader/analyze?stream=true", json={"text": "Μῆνιν ἄειδε"})
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = [json.loads(line) for line in response.text.splitlines()]
+    sections = [line["section"] for line in lines]
+
+    assert sections[0] == "tokens"
+    assert sections[-1] == "done"
+    assert set(sections[1:-1]) == {"morphology", "retrieval"}
+    assert [token["lemma"] for token in lines[0]["data"]] == [None, None]
+    morphology = next(line for line in lines if line["section"] == "morphology")
+    assert [token["lemma"] for token in morphology["data"]] == ["μῆνιν", "ἄειδε"]
+
+
+async def test_analyze_without_stream_returns_single_document(reader_client):
+    async with reader_client as client:
+        response = await client.post("/reader/analyze", json={"text": "Μῆνιν"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["tokens"][0]["lemma"] == "μῆνιν"
+    assert body["retrieval"][0]["segment_id"] == 1
+    assert body["lexicon"] is None
+
+
+async def test_slow_branch_degrades_to_fallback_within_budget(monkeypatch, reader_client):
+    async def _slow_hybrid_search(query, *, language, fusion=None):
+        await asyncio.sleep(5)
+
+    async with reader_client as client:
+        monkeypatch.setattr(reader, "hybrid_search", _slow_hybrid_search)
+        monkeypatch.setattr(reader.settings, "READER_RETRIEVAL_BUDGET", 0.05)
+        response = await client.post("/reader/analyze", json={"text": "Μῆνιν"})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["retrieval"] == []
+    assert body["tokens"][0]["lemma"] == "μῆνιν"
+
+
+async def test_analyze_batch_runs_one_lookup_for_all_lines(monkeypatch, reader_client):
+    calls: list[list[str]] = []
+    lsj_calls: list[list[str | None]] = []
+
+    async def _counting_analyze_tokens(tokens, language="grc"):
+        calls.append(list(tokens))
+        return await _fake_analyze_tokens(tokens, language)
+
+    async def _fake_lookup_lsj(analyses, language):
+        lsj_calls.append([analysis["lemma"] for analysis in analyses])
+        return [reader.LexiconEntry(lemma="μῆνιν", gloss="wrath"), reader.LexiconEntry(lemma="θεά")]
+
+    async with reader_client as client:
+        monkeypatch.setattr(reader, "analyze_tokens", _counting_analyze_tokens)
+        monkeypatch.setattr(reader, "_lookup_lsj", _fake_lookup_lsj)
+        response = await client.post(
+            "/reader/analyze/batch",
+            params={"include": '{"lsj": true}'},
+            json={"lines": ["Μῆνιν ἄειδε θεά", "", "μῆνιν"]},
+        )
+
+    assert response.status_code == 200
+    lines = response.json()["lines"]
+    assert len(calls) == 1 and len(lsj_calls) == 1
+    assert [len(line["tokens"]) for line in lines] == [3, 0, 1]
+    assert [entry["lemma"] for entry in lines[0]["lexicon"]] == ["μῆνιν", "θεά"]
+    assert lines[1]["lexicon"] == []
+    assert lines[2]["lexicon"][0]["gloss"] == "wrath"
@@ -0,0 +1,143 @@
+from __future__ import annotations
+
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_mock_engine
+from sqlalchemy.dialects import postgresql
+
+from app.api import reader
+from app.db.models import Base, SourceDoc, TextSegment, TextWork
+from app.models.reader import SegmentWithMeta
+
+
+@pytest.mark.parametrize(
+    ("scheme", "ref", "upper", "expected"),
+    [
+        ("book.line", "Il.1.5", False, [1, 5]),
+        ("book.line", "Il.24.804", True, [24, 804]),
+        ("stephanus", "Apol.17a", False, [17, 1]),
+        ("stephanus", "Apol.20", True, [20, reader._MAX_SECTION]),
+        ("stephanus", "20", False, [20, 0]),
+        ("chapter.verse", "1.3", False, [1, 3]),
+        ("book.line", "Il.x.1", False, None),
+        ("book.line", "1", False, None),
+        ("section", "1", False, None),
+    ],
+)
+def test_ref_sort_key(scheme, ref, upper, expected):
+    assert reader._ref_sort_key(scheme, ref, upper=upper) == expected
+
+
+def test_cursor_round_trip():
+    assert reader._decode_cursor(reader._encode_cursor([1, 5], 42)) == ([1, 5], 42)
+    assert reader._decode_cursor(reader._encode_cursor("Apol.17a", 7)) == ("Apol.17a", 7)
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", reader._encode_cursor(["a"], 1), "WzEsMl0"])
+def test_malformed_cursor_is_rejected(cursor):
+    with pytest.raises(HTTPException) as excinfo:
+        reader._decode_cursor(cursor)
+    assert excinfo.value.status_code == 400
+
+
+async def test_work_pages_are_revalidated_without_reloading(monkeypatch, asgi_client):
+    reader._READER_CACHE.invalidate()
+    segments = [SegmentWithMeta(ref="Il.1.1", text="μῆνιν", meta={"book": 1, "line": 1})]
+    calls = 0
+
+    async def fake_page(db, text_id, limit, cursor):
+        nonlocal calls
+        calls += 1
+        return segments, {"title": "Iliad"}, None
+
+    monkeypatch.setattr(reader, "_load_work_page", fake_page)
+    async with asgi_client(reader.router) as client:
+        first = await client.get("/reader/texts/1/segments/all")
+        etag = first.headers["etag"]
+        revalidated = await client.get("/reader/texts/1/segments/all", headers={"If-None-Match": etag})
+
+    assert first.status_code == 200
+    assert first.json()["segments"][0]["ref"] == "Il.1.1"
+    assert first.json()["next_cursor"] is None
+    assert revalidated.status_code == 304
+    assert revalidated.headers["etag"] == etag
+    assert calls == 1
+
+
+class _RecordingDB:
+    def __init__(self, unkeyed: bool) -> None:
+        self.unkeyed = unkeyed
+        self.statements: list[str] = []
+
+    async def execute(self, statement):
+        sql = str(statement.compile(dialect=postgresql.dialect()))
+        self.statements.append(sql)
+        unkeyed = self.unkeyed
+
+        class _Result:
+            def scalar(self):
+                return unkeyed
+
+            def all(self):
+                return []
+
+        return _Result()
+
+
+@pytest.mark.parametrize(("unkeyed", "order_column"), [(False, "sort_key"), (True, "ref")])
+async def test_range_falls_back_to_ref_order_when_sort_keys_are_missing(monkeypatch, unkeyed, order_column):
+    work = TextWork(id=1, title="Iliad", author="Homer", ref_scheme="book.line")
+
+    async def fake_load_work(db, text_id):
+        return work, SourceDoc(title="Perseus", license={})
+
+    monkeypatch.setattr(reader, "_load_work", fake_load_work)
+    db = _RecordingDB(unkeyed)
+
+    await reader._load_segments(db, 1, "Il.1.1", "Il.1.10", 50, None)
+
+    assert f"ORDER BY text_segment.{order_column}, text_segment.id" in db.statements[-1]
+
+
+@pytest.mark.parametrize(("scheme", "ref_end"), [("book.line", "Il.1.x"), ("stephanus", "Apol.seventeen")])
+async def test_malformed_ref_under_keyed_scheme_returns_empty_page(monkeypatch, scheme, ref_end):
+    work = TextWork(id=1, title="Iliad", author="Homer", ref_scheme=scheme)
+
+    async def fake_load_work(db, text_id):
+        return work, SourceDoc(title="Perseus", license={})
+
+    monkeypatch.setattr(reader, "_load_work", fake_load_work)
+    db = _RecordingDB(unkeyed=True)
+
+    segments, text_info, next_cursor = await reader._load_segments(db, 1, "1", ref_end, 50, None)
+
+    assert segments == [] and next_cursor is None
+    assert text_info["title"] == "Iliad"
+    assert db.statements == []
+
+
+async def test_unkeyed_scheme_orders_by_ref(monkeypatch):
+    work = TextWork(id=1, title="Gospel", author="Mark", ref_scheme="section")
+
+    async def fake_load_work(db, text_id):
+        return work, SourceDoc(title="Perseus", license={})
+
+    monkeypatch.setattr(reader, "_load_work", fake_load_work)
+    db = _RecordingDB(unkeyed=False)
+
+    await reader._load_segments(db, 1, "1", "9", 50, None)
+
+    assert len(db.statements) == 1
+    assert "ORDER BY text_segment.ref, text_segment.id" in db.statements[0]
+
+
+def test_create_all_installs_text_segment_triggers():
+    emitted: list[str] = []
+    engine = create_mock_engine(
+        "postgresql+psycopg://",
+        lambda sql, *args, **kwargs: emitted.append(str(sql.compile(dialect=engine.dialect))),
+    )
+    Base.metadata.create_all(engine, tables=[TextSegment.__table__], checkfirst=False)
+
+    assert any("CREATE TRIGGER trg_text_segment_sort_key" in statement for statement in emitted)
+    assert any("CREATE TRIGGER trg_text_segment_language_id" in statement for statement in emitted)
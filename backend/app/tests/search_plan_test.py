@@ -0,0 +1,61 @@
+"""EXPLAIN-based checks that specialized search SQL can use its indexes (needs RUN_DB_TESTS=1)."""
+
+from __future__ import annotations
+
+from typing import Any, Iterator
+
+import pytest
+from sqlalchemy import text
+
+from app.api import search
+
+
+def _index_names(plan: Any) -> Iterator[str]:
+    if isinstance(plan, dict):
+        if "Index Name" in plan:
+            yield plan["Index Name"]
+        for value in plan.values():
+            yield from _index_names(value)
+    elif isinstance(plan, list):
+        for item in plan:
+            yield from _index_names(item)
+
+
+async def _explain(session, statement, params: dict[str, Any]) -> set[str]:
+    # Sequential scans win on a small test corpus; disabling them shows which
+    # indexes the planner *can* use for this statement shape.
+    await session.execute(text("SET LOCAL enable_seqscan = off"))
+    await session.execute(text("SELECT set_config('pg_trgm.similarity_threshold', '0.1', true)"))
+    result = await session.execute(text(f"EXPLAIN (FORMAT JSON) {statement.text}"), params)
+    return set(_index_names(result.scalar_one()))
+
+
+async def _language_id(session, code: str) -> int:
+    language_id = (
+        await session.execute(text("SELECT id FROM language WHERE code = :code"), {"code": code})
+    ).scalar()
+    if language_id is None:
+        pytest.skip(f"language {code} not seeded")
+    return language_id
+
+
+async def test_language_text_search_uses_trigram_or_language_index(session):
+    language_id = await _language_id(session, "grc-cls")
+    indexes = await _explain(
+        session,
+        search._text_sql(True, False),
+        {"query_fold": "μηνιν", "language_id": language_id, "limit": 20},
+    )
+    assert indexes & {"ix_text_segment_text_fold_trgm", "ix_text_segment_language_id"}
+    await session.rollback()
+
+
+async def test_language_lexicon_search_uses_trigram_or_language_index(session):
+    language_id = await _language_id(session, "grc-cls")
+    indexes = await _explain(
+        session,
+        search._lexicon_sql(True),
+        {"query_fold": "μηνις", "language": "grc-cls", "language_id": language_id, "limit": 20},
+    )
+    assert indexes & {"ix_lexeme_lemma_fold_trgm", "ix_lexeme_language_id", "ix_lexeme_lang_lemma"}
+    await session.rollback()
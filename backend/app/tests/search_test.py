@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+import time
+
+import pytest
+
+from app.api import search
+
+
+class _FakeSession:
+    def __init__(self, log: list[tuple[int, float]]) -> None:
+        self.log = log
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    def begin(self) -> "_FakeSession":
+        return self
+
+    async def execute(self, statement, params=None):
+        self.log.append((id(self), params["threshold"]))
+
+
+def _install_fakes(monkeypatch, *, text_delay: float) -> list[tuple[int, float]]:
+    log: list[tuple[int, float]] = []
+    monkeypatch.setattr(search, "SessionLocal", lambda: _FakeSession(log))
+    search._SEARCH_CACHE.invalidate()
+
+    async def lexicon(session, **kwargs):
+        await asyncio.sleep(0.1)
+        return [search.LexiconResult(id=1, lemma="λόγος", language="grc", relevance_score=0.9)], None, 1
+
+    async def grammar(session, **kwargs):
+        await asyncio.sleep(0.1)
+        return [], None, 0
+
+    async def texts(session, **kwargs):
+        await asyncio.sleep(text_delay)
+        return [], None, 0
+
+    monkeypatch.setattr(search, "_search_lexicon", lexicon)
+    monkeypatch.setattr(search, "_search_grammar", grammar)
+    monkeypatch.setattr(search, "_search_text_segments", texts)
+    return log
+
+
+async def test_types_run_concurrently_on_separate_sessions(monkeypatch, asgi_client):
+    log = _install_fakes(monkeypatch, text_delay=0.1)
+
+    started = time.perf_counter()
+    async with asgi_client(search.router) as client:
+        response = await client.get("/search", params={"q": "logos", "threshold": 0.2})
+    elapsed = time.perf_counter() - started
+
+    assert response.status_code == 200
+    assert response.json()["timed_out"] is False
+    assert response.json()["total_results"] == 1
+    assert elapsed < 0.25  # sequential execution would take 0.3s
+    assert len({session_id for session_id, _ in log}) == 3
+    assert {threshold for _, threshold in log} == {0.2}
+
+
+async def test_budget_returns_partial_results_without_caching(monkeypatch, asgi_client):
+    _install_fakes(monkeypatch, text_delay=5.0)
+    monkeypatch.setattr(search.settings, "SEARCH_TIME_BUDGET", 0.2)
+
+    async with asgi_client(search.router) as client:
+        response = await client.get("/search", params={"q": "logos"})
+
+    body = response.json()
+    assert response.status_code == 200
+    assert body["timed_out"] is True
+    assert [entry["lemma"] for entry in body["lexicon_results"]] == ["λόγος"]
+    assert body["text_results"] == []
+    assert response.headers["cache-control"] == "no-store"
+    assert len(search._SEARCH_CACHE) == 0
+
+
+@pytest.mark.parametrize(
+    "statement",
+    [
+        search._lexicon_sql(True),
+        search._lexicon_sql(False),
+        search._grammar_sql(True),
+        search._grammar_sql(False),
+        *(search._text_sql(lang, work) for lang in (True, False) for work in (True, False)),
+    ],
+)
+def test_specialized_sql_has_no_optional_filter_guards(statement):
+    assert "IS NULL" not in statement.text
+
+
+def test_language_filtered_sql_skips_the_language_join():
+    assert "JOIN language" not in search._lexicon_sql(True).text
+    assert "JOIN language" not in search._text_sql(True, True).text
+
+
+def test_text_sql_binds_only_the_filters_it_uses():
+    assert set(search._text_sql(True, False).compile().params) == {"query_fold", "language_id", "limit"}
+    assert set(search._text_sql(False, True).compile().params) == {"query_fold", "work_id", "limit"}
+
+
+class _RowsSession:
+    def __init__(self, rows: list[dict]) -> None:
+        self.rows = rows
+        self.params: list[dict] = []
+
+    async def execute(self, statement, params=None):
+        self.params.append(params)
+        rows = self.rows
+
+        class _Result:
+            def scalar_one(self):
+                return len(rows)
+
+            def mappings(self):
+                return self
+
+            def all(self):
+                return rows
+
+        return _Result()
+
+
+def _segment_row(row_id: int, ref: str, score: float) -> dict:
+    return {
+        "id": row_id,
+        "work_id": 1,
+        "ref": ref,
+        "text_nfc": "",
+        "work_title": "Iliad",
+        "author": "Homer",
+        "score": score,
+    }
+
+
+async def test_text_pages_break_score_ties_by_ref_and_resume_after_it():
+    # Rows as Postgres returns them: score DESC, then ref, then id.
+    session = _RowsSession(
+        [_segment_row(9, "1.1", 0.8), _segment_row(3, "1.2", 0.8), _segment_row(4, "1.3", 0.8)]
+    )
+
+    entries, next_cursor, estimate = await search._search_text_segments(
+        session, query_fold="μηνιν", language_id=None, limit=2, work_id=None
+    )
+
+    assert [entry.id for entry in entries] == [9, 3]
+    assert next_cursor == (0.8, "1.2", 3)
+    assert estimate == 3
+
+    await search._search_text_segments(
+        session, query_fold="μηνιν", language_id=None, limit=2, work_id=None, after=next_cursor
+    )
+    assert session.params[-1]["after_score"] == 0.8
+    assert session.params[-1]["after_key"] == "1.2"
+    assert session.params[-1]["after_id"] == 3
+
+
+@pytest.mark.parametrize(
+    ("statement", "order"),
+    [
+        (search._lexicon_sql(True, True), "ORDER BY score DESC, lex.lemma, lex.id"),
+        (search._grammar_sql(False, True), "ORDER BY score DESC, topic.title, topic.id"),
+        (search._text_sql(True, False, True), "ORDER BY score DESC, seg.ref, seg.id"),
+    ],
+)
+def test_paged_sql_keeps_the_secondary_order_in_the_keyset(statement, order):
+    assert order in statement.text
+    assert {"after_score", "after_key", "after_id"} <= set(statement.compile().params)
+
+
+def test_first_page_sql_has_no_cursor_filter():
+    assert "after_score" not in search._text_sql(True, False).text
+
+
+def test_count_sql_is_capped():
+    statement = search._lexicon_count_sql(True)
+    assert "LIMIT :cap" in statement.text
+    assert set(statement.compile().params) == {"query_fold", "language_id", "cap"}
+
+
+@pytest.mark.parametrize("cursor", ["not-base64!", search._encode_cursor(0.5, "1.1", 1)[:-2], "WyJ4IiwxXQ"])
+def test_malformed_search_cursor_is_rejected(cursor):
+    with pytest.raises(search.HTTPException) as excinfo:
+        search._decode_cursor(cursor)
+    assert excinfo.value.status_code == 400
+
+
+async def test_pages_follow_per_type_cursors(monkeypatch, asgi_client):
+    _install_fakes(monkeypatch, text_delay=0.0)
+    rows = [
+        search.TextResult(
+            id=row_id, work_id=1, work_title="Iliad", author="Homer", passage="", relevance_score=score
+        )
+        for row_id, score in [(9, 0.8), (7, 0.8), (3, 0.5), (2, 0.4)]
+    ]
+    seen_after: list[tuple[float, str, int] | None] = []
+
+    async def texts(session, *, limit, after=None, **kwargs):
+        seen_after.append(after)
+        start = 0 if after is None else next(i for i, row in enumerate(rows) if row.id == after[2]) + 1
+        page = rows[start : start + limit]
+        more = start + limit < len(rows)
+        next_cursor = (page[-1].relevance_score, f"1.{page[-1].id}", page[-1].id) if more else None
+        return page, next_cursor, (len(rows) if after is None else None)
+
+    monkeypatch.setattr(search, "_search_text_segments", texts)
+
+    async with asgi_client(search.router) as client:
+        first = (await client.get("/search", params={"q": "menin", "types": "text", "limit": 2})).json()
+        cursor = first["next_cursors"]["text"]
+        second = (
+            await client.get(
+                "/search", params={"q": "menin", "types": "text", "limit": 2, "text_after": cursor}
+            )
+        ).json()
+
+    assert [entry["id"] for entry in first["text_results"]] == [9, 7]
+    assert first["estimated_totals"] == {"text": 4}
+    assert seen_after == [None, (0.8, "1.7", 7)]
+    assert [entry["id"] for entry in second["text_results"]] == [3, 2]
+    assert second["next_cursors"] == {}
+    assert second["estimated_totals"] == {}
@@ -0,0 +1,44 @@
+from __future__ import annotations
+
+import io
+import json
+
+from pipeline import search_trgm
+from sqlalchemy import create_engine
+
+
+def test_plan_is_reflected_once(monkeypatch):
+    calls = 0
+
+    def fake_build(engine):
+        nonlocal calls
+        calls += 1
+        return "SELECT 1", False, False
+
+    monkeypatch.setattr(search_trgm, "_build_query", fake_build)
+    with search_trgm.Searcher(engine=create_engine("sqlite://")) as searcher:
+        first = searcher.plan()
+        assert searcher.plan() is first
+    assert calls == 1
+
+
+def test_missing_table_is_rechecked(monkeypatch):
+    plans = iter([None, ("SELECT 1", False, False)])
+    monkeypatch.setattr(search_trgm, "_build_query", lambda engine: next(plans))
+    searcher = search_trgm.Searcher(engine=create_engine("sqlite://"))
+    assert searcher.plan() is None
+    assert searcher.plan() is not None
+
+
+def test_batch_emits_one_ndjson_line_per_query():
+    class FakeSearcher:
+        def search(self, query, *, language, limit, threshold):
+            return [{"ref": query, "lang": language, "limit": limit}]
+
+    stream = io.StringIO('μῆνιν\n\n{"id": 7, "query": "logos", "language": "lat", "limit": 2}\n')
+    out = io.StringIO()
+
+    assert search_trgm.run_batch(FakeSearcher(), stream, out, limit=5) == 2
+    lines = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert lines[0] == {"query": "μῆνιν", "results": [{"ref": "μῆνιν", "lang": "grc-cls", "limit": 5}]}
+    assert lines[1] == {"id": 7, "query": "logos", "results": [{"ref": "logos", "lang": "lat", "limit": 2}]}
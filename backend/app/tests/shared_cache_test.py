@@ -0,0 +1,60 @@
+from __future__ import annotations
+
+from typing import List
+
+from pydantic import BaseModel, TypeAdapter
+
+from app.core import shared_cache
+from app.core.cache import AsyncTTLCache
+
+
+class _Item(BaseModel):
+    name: str
+
+
+class _FakeRedisTier:
+    def __init__(self) -> None:
+        self.store: dict[str, bytes] = {}
+        self.counter = 0
+
+    async def get(self, key: str) -> bytes | None:
+        return self.store.get(key)
+
+    async def set(self, key: str, payload: bytes) -> None:
+        self.store[key] = payload
+
+    async def version(self) -> int:
+        return self.counter
+
+    async def bump_version(self) -> int:
+        self.counter += 1
+        return self.counter
+
+
+async def test_read_through_shares_entries_across_workers_and_honours_bumps(monkeypatch):
+    tier = _FakeRedisTier()
+    monkeypatch.setattr(shared_cache, "get_shared_cache", lambda: tier)
+    monkeypatch.setattr(shared_cache, "_version_memo", (0.0, 0))
+    adapter = TypeAdapter(List[_Item])
+    calls = 0
+
+    async def loader() -> List[_Item]:
+        nonlocal calls
+        calls += 1
+        return [_Item(name=f"load-{calls}")]
+
+    worker_a: AsyncTTLCache = AsyncTTLCache(ttl=60, max_bytes=1 << 20)
+    worker_b: AsyncTTLCache = AsyncTTLCache(ttl=60, max_bytes=1 << 20)
+
+    first = await shared_cache.read_through(worker_a, "test", ("k",), loader, adapter)
+    second = await shared_cache.read_through(worker_b, "test", ("k",), loader, adapter)
+
+    assert calls == 1
+    assert second == first == [_Item(name="load-1")]
+
+    await shared_cache.bump_corpus_version()
+    third = await shared_cache.read_through(worker_a, "test", ("k",), loader, adapter)
+
+    assert calls == 2
+    assert third == [_Item(name="load-2")]
+    assert shared_cache.read_stale(worker_a, "test", ("k",)) == third
@@ -0,0 +1,98 @@
+"""Per-work index rebuilds against a real database (needs RUN_DB_TESTS=1)."""
+
+from __future__ import annotations
+
+import pytest
+from sqlalchemy import text
+
+from app.api import reader
+from app.ingestion.structure_index import rebuild_work_indexes
+
+
+async def _iliad(session) -> tuple[int, int, str]:
+    row = (
+        await session.execute(
+            text(
+                "SELECT w.id, w.language_id, l.code FROM text_work AS w "
+                "JOIN language AS l ON l.id = w.language_id "
+                "WHERE w.title = 'Iliad' ORDER BY w.id LIMIT 1"
+            )
+        )
+    ).first()
+    if row is None:
+        pytest.skip("Iliad sample not ingested")
+    return row[0], row[1], row[2]
+
+
+async def _scalar(session, sql: str, **params):
+    return (await session.execute(text(sql), params)).scalar()
+
+
+async def test_rebuild_writes_summary_and_language_totals(session, ensure_iliad_sample):
+    work_id, language_id, _ = await _iliad(session)
+
+    await rebuild_work_indexes(session, work_id)
+
+    segments = await _scalar(session, "SELECT COUNT(*) FROM text_segment WHERE work_id = :w", w=work_id)
+    summary = (
+        await session.execute(
+            text("SELECT segment_count, preview FROM text_work_summary WHERE work_id = :w"), {"w": work_id}
+        )
+    ).one()
+    assert summary.segment_count == segments
+    assert summary.preview
+
+    stats = (
+        await session.execute(
+            text("SELECT work_count, segment_count FROM language_stats WHERE language_id = :l"),
+            {"l": language_id},
+        )
+    ).one()
+    assert stats.work_count == await _scalar(
+        session, "SELECT COUNT(*) FROM text_work WHERE language_id = :l", l=language_id
+    )
+    assert stats.segment_count == await _scalar(
+        session,
+        "SELECT COUNT(*) FROM text_segment AS s JOIN text_work AS w ON w.id = s.work_id "
+        "WHERE w.language_id = :l",
+        l=language_id,
+    )
+    assert (
+        await _scalar(
+            session,
+            "SELECT COUNT(*) FROM text_segment WHERE work_id = :w AND language_id IS DISTINCT FROM :l",
+            w=work_id,
+            l=language_id,
+        )
+        == 0
+    )
+
+
+async def test_catalog_computes_missing_summary_without_writing(session, ensure_iliad_sample):
+    work_id, _, language = await _iliad(session)
+    await rebuild_work_indexes(session, work_id)
+    expected = await _scalar(
+        session, "SELECT segment_count FROM text_work_summary WHERE work_id = :w", w=work_id
+    )
+    await session.execute(text("DELETE FROM text_work_summary WHERE work_id = :w"), {"w": work_id})
+
+    texts = await reader._load_texts(session, language)
+
+    assert next(t for t in texts if t.id == work_id).segment_count == expected
+    assert await _scalar(session, "SELECT COUNT(*) FROM text_work_summary WHERE work_id = :w", w=work_id) == 0
+    await session.rollback()
+    await rebuild_work_indexes(session, work_id)
+
+
+async def test_structure_computes_missing_index_without_writing(session, ensure_iliad_sample):
+    work_id, _, _ = await _iliad(session)
+    await session.execute(text("DELETE FROM text_work_structure WHERE work_id = :w"), {"w": work_id})
+
+    structure = await reader._load_structure(session, work_id)
+
+    assert structure.books and structure.books[0].book == 1
+    assert (
+        await _scalar(session, "SELECT COUNT(*) FROM text_work_structure WHERE work_id = :w", w=work_id) == 0
+    )
+    await session.rollback()
+    await rebuild_work_indexes(session, work_id)
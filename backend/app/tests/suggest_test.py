@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import asyncio
+
+from app.api import search
+from app.core import shared_cache
+from app.retrieval import suggest
+
+_ROWS = [
+    ("grc-cls", "λογος", "λόγος", 3),
+    ("grc-cls", "λογιζομαι", "λογίζομαι", 4),
+    ("grc-cls", "λυω", "λύω", 5),
+    ("lat", "laudo", "laudo", 6),
+    ("lat", "lego", "lego", 7),
+]
+
+
+def test_prefix_lookup_within_a_language():
+    index = suggest.LemmaPrefixIndex(_ROWS)
+
+    assert [entry.lemma for entry in index.lookup("λογ", language="grc-cls")] == ["λογίζομαι", "λόγος"]
+    assert [entry.lemma for entry in index.lookup("λ", language="grc-cls", limit=2)] == ["λογίζομαι", "λόγος"]
+    assert index.lookup("λογ", language="lat") == []
+    assert index.lookup("x", language="unknown") == []
+
+
+def test_prefix_lookup_merges_languages_in_folded_order():
+    index = suggest.LemmaPrefixIndex(_ROWS)
+
+    assert [entry.lemma for entry in index.lookup("l")] == ["laudo", "lego"]
+    assert len(index.lookup("", limit=10)) == 0
+    assert len(index) == len(_ROWS)
+
+
+class _FakeResult:
+    def __init__(self, rows) -> None:
+        self._rows = rows
+
+    def all(self):
+        return list(self._rows)
+
+
+class _FakeSession:
+    def __init__(self, loads: list[int], rows) -> None:
+        self.loads = loads
+        self.rows = rows
+
+    async def __aenter__(self) -> "_FakeSession":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        return None
+
+    async def execute(self, statement, params=None):
+        self.loads.append(1)
+        return _FakeResult(self.rows)
+
+
+async def test_suggest_reloads_only_after_a_corpus_bump(monkeypatch, asgi_client):
+    suggest.invalidate_lemma_index()
+    loads: list[int] = []
+    rows = list(_ROWS)
+    monkeypatch.setattr(suggest, "SessionLocal", lambda: _FakeSession(loads, rows))
+
+    async with asgi_client(search.router) as client:
+        first = await client.get("/search/suggest", params={"q": "Λόγ", "language": "grc-cls"})
+        await client.get("/search/suggest", params={"q": "λυ"})
+        assert len(loads) == 1
+
+        rows.append(("grc-cls", "λογοποιος", "λογοποιός", 8))
+        await shared_cache.bump_corpus_version()
+        stale = await client.get("/search/suggest", params={"q": "λογο", "language": "grc-cls"})
+        await asyncio.sleep(0)
+        fresh = await client.get("/search/suggest", params={"q": "λογο", "language": "grc-cls"})
+
+    assert first.status_code == 200
+    assert [entry["lemma"] for entry in first.json()["suggestions"]] == ["λογίζομαι", "λόγος"]
+    assert [entry["lemma"] for entry in stale.json()["suggestions"]] == ["λόγος"]
+    assert [entry["lemma"] for entry in fresh.json()["suggestions"]] == ["λογοποιός", "λόγος"]
+    assert len(loads) == 2
+    suggest.invalidate_lemma_index()
@@ -0,0 +1,73 @@
+"""Materialize the surface-form -> best lemma distribution used by the reader.
+
+Revision ID: 20251031_add_morph_lexicon
+Revises: 20251030_add_hnsw_vector_indexes
+Create Date: 2025-10-31 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+from sqlalchemy import text
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20251031_add_morph_lexicon"
+down_revision: Union[str, Sequence[str], None] = "20251030_add_hnsw_vector_indexes"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# One row per (language, surface_fold): the most frequent analysis and its share
+# of all analyses of that surface form. Refreshed after token ingestion.
+MORPH_LEXICON_SQL = """
+CREATE MATERIALIZED VIEW IF NOT EXISTS morph_lexicon AS
+SELECT DISTINCT ON (language, surface_fold)
+    language,
+    surface_fold,
+    lemma,
+    lemma_fold,
+    msd,
+    COALESCE(msd->>'perseus_tag', msd->>'ana') AS morph,
+    freq,
+    total,
+    freq::double precision / NULLIF(total, 0) AS confidence
+FROM (
+    SELECT
+        lang.code AS language,
+        tk.surface_fold AS surface_fold,
+        tk.lemma AS lemma,
+        tk.lemma_fold AS lemma_fold,
+        tk.msd AS msd,
+        COUNT(*) AS freq,
+        SUM(COUNT(*)) OVER (PARTITION BY lang.code, tk.surface_fold) AS total
+    FROM token AS tk
+    JOIN text_segment AS seg ON seg.id = tk.segment_id
+    JOIN text_work AS work ON work.id = seg.work_id
+    JOIN language AS lang ON lang.id = work.language_id
+    WHERE tk.lemma IS NOT NULL
+      AND tk.surface_fold IS NOT NULL
+    GROUP BY lang.code, tk.surface_fold, tk.lemma, tk.lemma_fold, tk.msd
+) AS grouped
+ORDER BY language, surface_fold, freq DESC, lemma
+WITH DATA
+"""
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    bind.execute(text(MORPH_LEXICON_SQL))
+    # Unique index doubles as the lookup index and enables REFRESH ... CONCURRENTLY.
+    bind.execute(
+        text(
+            "CREATE UNIQUE INDEX IF NOT EXISTS ux_morph_lexicon_language_fold "
+            "ON morph_lexicon (language, surface_fold)"
+        )
+    )
+    bind.execute(text("ANALYZE morph_lexicon"))
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    bind.execute(text("DROP MATERIALIZED VIEW IF EXISTS morph_lexicon"))
@@ -0,0 +1,49 @@
+"""Add the precomputed per-work structure index.
+
+Revision ID: 20251101_add_text_work_structure
+Revises: 20251031_add_morph_lexicon
+Create Date: 2025-11-01 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+from app.ingestion.structure_index import REBUILD_STRUCTURE_SQL
+
+# revision identifiers, used by Alembic.
+revision: str = "20251101_add_text_work_structure"
+down_revision: Union[str, Sequence[str], None] = "20251031_add_morph_lexicon"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "text_work_structure",
+        sa.Column(
+            "work_id",
+            sa.Integer(),
+            sa.ForeignKey("text_work.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("ref_scheme", sa.String(length=64), nullable=False),
+        sa.Column("segment_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column(
+            "structure",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    # Backfill every existing work; ingestion and the seed scripts keep rows current afterwards.
+    op.execute(sa.text(REBUILD_STRUCTURE_SQL).bindparams(work_id=None))
+
+
+def downgrade() -> None:
+    op.drop_table("text_work_structure")
@@ -0,0 +1,74 @@
+"""Add a typed sort key to text_segment for ordered range scans.
+
+Revision ID: 20251102_add_text_segment_sort_key
+Revises: 20251101_add_text_work_structure
+Create Date: 2025-11-02 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20251102_add_text_segment_sort_key"
+down_revision: Union[str, Sequence[str], None] = "20251101_add_text_work_structure"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Stephanus pages ("17a") become [17, 1]; otherwise the numeric book/chapter/verse/line
+# fields present in meta, in that order (e.g. {"book": 1, "line": 5} -> [1, 5]).
+# Must stay in sync with app.api.reader._ref_sort_key.
+SORT_KEY_FUNCTION_SQL = r"""
+CREATE OR REPLACE FUNCTION text_segment_sort_key(meta jsonb) RETURNS integer[]
+LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$
+    SELECT CASE
+        WHEN meta->>'page' ~ '^\d{1,9}[a-z]?$' THEN ARRAY[
+            substring(meta->>'page' from '^\d+')::int,
+            COALESCE(ascii(substring(meta->>'page' from '[a-z]$')) - 96, 0)
+        ]
+        ELSE (
+            SELECT array_agg((meta->>u.field)::int ORDER BY u.ord)
+            FROM unnest(ARRAY['book', 'chapter', 'verse', 'line']) WITH ORDINALITY AS u(field, ord)
+            WHERE meta->>u.field ~ '^\d{1,9}$'
+        )
+    END
+$$
+"""
+
+# Keeps sort_key current for every ingestion path without touching the writers.
+SORT_KEY_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION text_segment_set_sort_key() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.sort_key := text_segment_sort_key(NEW.meta);
+    RETURN NEW;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    op.add_column("text_segment", sa.Column("sort_key", postgresql.ARRAY(sa.Integer()), nullable=True))
+    op.execute(SORT_KEY_FUNCTION_SQL)
+    op.execute(SORT_KEY_TRIGGER_SQL)
+    op.execute(
+        "CREATE TRIGGER trg_text_segment_sort_key "
+        "BEFORE INSERT OR UPDATE OF meta ON text_segment "
+        "FOR EACH ROW EXECUTE FUNCTION text_segment_set_sort_key()"
+    )
+    op.execute("UPDATE text_segment SET sort_key = text_segment_sort_key(meta) WHERE meta IS NOT NULL")
+    op.create_index("ix_text_segment_work_sort_key", "text_segment", ["work_id", "sort_key", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_text_segment_work_sort_key", table_name="text_segment")
+    op.execute("DROP TRIGGER IF EXISTS trg_text_segment_sort_key ON text_segment")
+    op.execute("DROP FUNCTION IF EXISTS text_segment_set_sort_key()")
+    op.execute("DROP FUNCTION IF EXISTS text_segment_sort_key(jsonb)")
+    op.drop_column("text_segment", "sort_key")
@@ -0,0 +1,53 @@
+"""Add the denormalized per-work catalog summary.
+
+Revision ID: 20251103_add_text_work_summary
+Revises: 20251102_add_text_segment_sort_key
+Create Date: 2025-11-03 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+from app.ingestion.structure_index import REBUILD_SUMMARY_SQL
+
+# revision identifiers, used by Alembic.
+revision: str = "20251103_add_text_work_summary"
+down_revision: Union[str, Sequence[str], None] = "20251102_add_text_segment_sort_key"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "text_work_summary",
+        sa.Column(
+            "work_id",
+            sa.Integer(),
+            sa.ForeignKey("text_work.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("language_id", sa.Integer(), sa.ForeignKey("language.id"), nullable=False),
+        sa.Column("segment_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("preview", sa.Text(), nullable=True),
+        sa.Column("source_title", sa.String(length=256), nullable=False),
+        sa.Column(
+            "license",
+            postgresql.JSONB(astext_type=sa.Text()),
+            nullable=False,
+            server_default=sa.text("'{}'::jsonb"),
+        ),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.create_index("ix_text_work_summary_language_id", "text_work_summary", ["language_id"])
+    # Backfill every existing work; ingestion and the seed scripts keep rows current afterwards.
+    op.execute(sa.text(REBUILD_SUMMARY_SQL).bindparams(work_id=None))
+
+
+def downgrade() -> None:
+    op.drop_index("ix_text_work_summary_language_id", table_name="text_work_summary")
+    op.drop_table("text_work_summary")
@@ -0,0 +1,49 @@
+"""Add precomputed per-language catalog statistics.
+
+Revision ID: 20251104_add_language_stats
+Revises: 20251103_add_text_work_summary
+Create Date: 2025-11-04 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20251104_add_language_stats"
+down_revision: Union[str, Sequence[str], None] = "20251103_add_text_work_summary"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "language_stats",
+        sa.Column(
+            "language_id",
+            sa.Integer(),
+            sa.ForeignKey("language.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("work_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("segment_count", sa.Integer(), nullable=False, server_default="0"),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=False),
+    )
+    op.execute(
+        """
+        INSERT INTO language_stats (language_id, work_count, segment_count)
+        SELECT l.id, COUNT(DISTINCT w.id), COUNT(s.id)
+        FROM language AS l
+        LEFT JOIN text_work AS w ON w.language_id = l.id
+        LEFT JOIN text_segment AS s ON s.work_id = w.id
+        GROUP BY l.id
+        """
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("language_stats")
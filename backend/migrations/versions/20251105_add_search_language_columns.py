@@ -0,0 +1,61 @@
+"""Denormalize language_id onto text_segment and index lexeme lemmas for trigram search.
+
+Revision ID: 20251105_add_search_language_columns
+Revises: 20251104_add_language_stats
+Create Date: 2025-11-05 09:00:00.000000
+"""
+
+from __future__ import annotations
+
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "20251105_add_search_language_columns"
+down_revision: Union[str, Sequence[str], None] = "20251104_add_language_stats"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Copies the work's language so search can filter segments without joining
+# text_work and language; covers every ingestion path.
+LANGUAGE_TRIGGER_SQL = """
+CREATE OR REPLACE FUNCTION text_segment_set_language_id() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    NEW.language_id := (SELECT language_id FROM text_work WHERE id = NEW.work_id);
+    RETURN NEW;
+END
+$$
+"""
+
+
+def upgrade() -> None:
+    op.add_column(
+        "text_segment",
+        sa.Column("language_id", sa.Integer(), sa.ForeignKey("language.id"), nullable=True),
+    )
+    op.execute(LANGUAGE_TRIGGER_SQL)
+    op.execute(
+        "CREATE TRIGGER trg_text_segment_language_id "
+        "BEFORE INSERT OR UPDATE OF work_id ON text_segment "
+        "FOR EACH ROW EXECUTE FUNCTION text_segment_set_language_id()"
+    )
+    op.execute(
+        "UPDATE text_segment AS s SET language_id = w.language_id FROM text_work AS w WHERE w.id = s.work_id"
+    )
+    op.create_index("ix_text_segment_language_id", "text_segment", ["language_id"])
+    op.execute(
+        "CREATE INDEX IF NOT EXISTS ix_lexeme_lemma_fold_trgm ON lexeme USING gin (lemma_fold gin_trgm_ops)"
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP INDEX IF EXISTS ix_lexeme_lemma_fold_trgm")
+    op.drop_index("ix_text_segment_language_id", table_name="text_segment")
+    op.execute("DROP TRIGGER IF EXISTS trg_text_segment_language_id ON text_segment")
+    op.execute("DROP FUNCTION IF EXISTS text_segment_set_language_id()")
+    op.drop_column("text_segment", "language_id")
@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import os
 from pathlib import Path
 from typing import Iterable, Sequence
@@ -10,7 +11,9 @@ from sqlalchemy import bindparam, create_engine, text
 from sqlalchemy.dialects.postgresql import JSONB
 
 try:
+    from app.core.shared_cache import bump_corpus_version
     from app.ingestion.normalize import accent_fold, nfc
+    from app.ingestion.structure_index import WORK_INDEX_SQL
 except ModuleNotFoundError as exc:  # pragma: no cover - only hit outside repo
     raise SystemExit("Run from the backend package (PYTHONPATH=backend)") from exc
 
@@ -191,7 +194,10 @@ def main(argv: Sequence[str] | None = None) -> int:
         source_id = ensure_source(conn, args.source, args.source_title, {"url": "https://perseus.tufts.edu"})
         work_id = ensure_work(conn, language_id, source_id, author, title, args.ref_scheme)
         inserted = upsert_segments(conn, work_id, lines, args.source)
+        for statement in WORK_INDEX_SQL:
+            conn.execute(text(statement), {"work_id": work_id})
         sample_ref, sample_text = fetch_sample(conn, work_id)
+    asyncio.run(bump_corpus_version())
 
     print(f"Inserted={inserted} Work={author} - {title} FirstLine={sample_ref}:{sample_text}")
     return 0
@@ -3,9 +3,10 @@ from __future__ import annotations
 import argparse
 import json
 import os
-from typing import Any, Iterable, Sequence
+import sys
+from typing import IO, Any, Iterable, Iterator, Sequence
 
-from sqlalchemy import create_engine, inspect, text
+from sqlalchemy import TextClause, create_engine, inspect, text
 from sqlalchemy.engine import Engine
 from sqlalchemy.exc import NoSuchTableError
 
@@ -121,6 +122,78 @@ def _coerce_result(row: Any, include_work: bool) -> dict[str, Any]:
     return result
 
 
+class Searcher:
+    """Trigram searcher that keeps one engine (and its pool) across queries.
+
+    The query plan depends on which columns exist, so it is reflected once and
+    reused; a missing ``text_segment`` is re-checked on the next call.
+    """
+
+    def __init__(self, database_url: str | None = None, *, engine: Engine | None = None) -> None:
+        self.engine = engine or _ensure_engine(database_url)
+        self._plan: tuple[TextClause, bool, bool] | None = None
+
+    def __enter__(self) -> "Searcher":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self.engine.dispose()
+
+    def plan(self) -> tuple[TextClause, bool, bool] | None:
+        if self._plan is None:
+            built = _build_query(self.engine)
+            if built is not None:
+                sql, include_work, requires_lang_filter = built
+                self._plan = text(sql), include_work, requires_lang_filter
+        return self._plan
+
+    def search(
+        self,
+        query: str,
+        *,
+        language: str = "grc-cls",
+        limit: int = 5,
+        threshold: float = 0.1,
+    ) -> list[dict[str, Any]]:
+        """Execute a trigram search over text segments."""
+
+        if not query:
+            return []
+
+        plan = self.plan()
+        if plan is None:
+            return []
+
+        statement, include_work, requires_lang_filter = plan
+        params: dict[str, Any] = {
+            "q_fold": accent_fold(query),
+            "threshold": threshold,
+            "limit": max(1, limit),
+        }
+        if requires_lang_filter:
+            params["lang"] = language
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(statement, params).fetchall()
+
+        return [_coerce_result(row, include_work) for row in rows]
+
+
+# One searcher per database URL, so repeated search() calls share a pool and plan.
+_SEARCHERS: dict[str, Searcher] = {}
+
+
+def get_searcher(database_url: str | None = None) -> Searcher:
+    url = _resolve_url(database_url)
+    searcher = _SEARCHERS.get(url)
+    if searcher is None:
+        searcher = _SEARCHERS[url] = Searcher(url)
+    return searcher
+
+
 def search(
     query: str,
     *,
@@ -131,27 +204,51 @@ def search(
 ) -> list[dict[str, Any]]:
     """Execute a trigram search over text segments."""
 
-    if not query:
-        return []
+    return get_searcher(database_url).search(query, language=language, limit=limit, threshold=threshold)
 
-    engine = _ensure_engine(database_url)
-    plan = _build_query(engine)
-    if plan is None:
-        return []
 
-    sql, include_work, requires_lang_filter = plan
-    params: dict[str, Any] = {
-        "q_fold": accent_fold(query),
-        "threshold": threshold,
-        "limit": max(1, limit),
-    }
-    if requires_lang_filter:
-        params["lang"] = language
+def _read_batch(stream: IO[str]) -> Iterator[dict[str, Any]]:
+    """Yield one request per non-blank line: a bare query or a JSON object with
+    ``query`` and optional ``language``/``limit``/``threshold``/``id``."""
 
-    with engine.connect() as conn:
-        rows = conn.execute(text(sql), params).fetchall()
+    for line in stream:
+        stripped = line.strip()
+        if not stripped:
+            continue
+        if stripped.startswith("{"):
+            request = json.loads(stripped)
+            if not isinstance(request, dict) or not isinstance(request.get("query"), str):
+                raise ValueError(f"Batch line needs a string 'query': {stripped}")
+            yield request
+        else:
+            yield {"query": stripped}
 
-    return [_coerce_result(row, include_work) for row in rows]
+
+def run_batch(
+    searcher: Searcher,
+    stream: IO[str],
+    out: IO[str],
+    *,
+    language: str = "grc-cls",
+    limit: int = 5,
+    threshold: float = 0.1,
+) -> int:
+    """Search every query in ``stream`` and write one NDJSON line per query."""
+
+    count = 0
+    for request in _read_batch(stream):
+        results = searcher.search(
+            request["query"],
+            language=request.get("language", language),
+            limit=int(request.get("limit", limit)),
+            threshold=float(request.get("threshold", threshold)),
+        )
+        record: dict[str, Any] = {"query": request["query"], "results": results}
+        if "id" in request:
+            record = {"id": request["id"], **record}
+        out.write(json.dumps(record, ensure_ascii=False, default=str) + "\n")
+        count += 1
+    return count
 
 
 def _print(results: Iterable[dict[str, Any]]) -> None:
@@ -161,7 +258,7 @@ def _print(results: Iterable[dict[str, Any]]) -> None:
 
 def main(argv: Sequence[str] | None = None) -> int:
     parser = argparse.ArgumentParser(description="Run trigram search over text_segment")
-    parser.add_argument("query", help="Search query string")
+    parser.add_argument("query", nargs="?", help="Search query string (omit with --batch)")
     parser.add_argument("-l", "--language", default="grc-cls", help="Language code (default: grc-cls)")
     parser.add_argument("-k", "--limit", type=int, default=5, help="Maximum rows to return")
     parser.add_argument(
@@ -172,16 +269,33 @@ def main(argv: Sequence[str] | None = None) -> int:
         help="Minimum trigram similarity (default: 0.1)",
     )
     parser.add_argument("--database-url", default=None, help="Override database URL")
+    parser.add_argument(
+        "--batch",
+        metavar="FILE",
+        default=None,
+        help="Read one query per line from FILE ('-' for stdin) and emit NDJSON, one line per query",
+    )
     args = parser.parse_args(argv)
 
-    results = search(
-        args.query,
-        language=args.language,
-        limit=args.limit,
-        threshold=args.threshold,
-        database_url=args.database_url,
-    )
-    _print(results)
+    if args.batch is None and args.query is None:
+        parser.error("a query or --batch is required")
+    if args.batch is not None and args.query is not None:
+        parser.error("pass either a query or --batch, not both")
+
+    with Searcher(args.database_url) as searcher:
+        if args.batch is None:
+            _print(
+                searcher.search(
+                    args.query, language=args.language, limit=args.limit, threshold=args.threshold
+                )
+            )
+            return 0
+        options = {"language": args.language, "limit": args.limit, "threshold": args.threshold}
+        if args.batch == "-":
+            run_batch(searcher, sys.stdin, sys.stdout, **options)
+        else:
+            with open(args.batch, encoding="utf-8") as stream:
+                run_batch(searcher, stream, sys.stdout, **options)
     return 0
 
 
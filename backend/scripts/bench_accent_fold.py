@@ -0,0 +1,80 @@
+#!/usr/bin/env python
+"""Micro-benchmark for app.ingestion.normalize.accent_fold.
+
+Compares the generic NFD/strip/casefold/NFC fold against the translation-table
+fast path (uncached and with the short-string LRU) over every line and token
+of a TEI text, and checks that all paths agree.
+
+Usage:
+    python backend/scripts/bench_accent_fold.py
+    python backend/scripts/bench_accent_fold.py --tei backend/data/iliad_grc.xml --repeat 5
+"""
+
+from __future__ import annotations
+
+import argparse
+import sys
+import time
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Callable, Sequence
+
+CURRENT_DIR = Path(__file__).resolve()
+BACKEND_ROOT = CURRENT_DIR.parent.parent
+if str(BACKEND_ROOT) not in sys.path:
+    sys.path.insert(0, str(BACKEND_ROOT))
+
+from app.ingestion import normalize  # noqa: E402
+
+DEFAULT_TEI = BACKEND_ROOT / "data" / "iliad_grc.xml"
+FALLBACK_TEI = BACKEND_ROOT.parent / "tests" / "fixtures" / "perseus_sample_annotated_greek.xml"
+TEI_LINE = "{http://www.tei-c.org/ns/1.0}l"
+
+
+def load_lines(tei_path: Path) -> list[str]:
+    root = ET.parse(tei_path).getroot()
+    lines = ["".join(node.itertext()).strip() for node in root.iter(TEI_LINE)]
+    return [normalize.nfc(line) for line in lines if line]
+
+
+def _time(fn: Callable[[str], str], values: Sequence[str], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for value in values:
+            fn(value)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Benchmark accent_fold fast path vs generic fold")
+    parser.add_argument("--tei", type=Path, default=None, help="TEI file (default: Iliad, else test fixture)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timing repetitions (best is reported)")
+    args = parser.parse_args(argv)
+
+    tei_path = args.tei or (DEFAULT_TEI if DEFAULT_TEI.exists() else FALLBACK_TEI)
+    lines = load_lines(tei_path)
+    if not lines:
+        raise SystemExit(f"No TEI <l> lines found in {tei_path}")
+    tokens = [token for line in lines for token in line.split()]
+
+    mismatches = sum(
+        1 for value in (*lines, *tokens) if normalize.accent_fold(value) != normalize._fold_generic(value)
+    )
+
+    print(f"corpus={tei_path.name} lines={len(lines)} tokens={len(tokens)} mismatches={mismatches}")
+    for label, values in (("lines", lines), ("tokens", tokens)):
+        generic = _time(normalize._fold_generic, values, args.repeat)
+        table = _time(normalize._accent_fold, values, args.repeat)
+        normalize._accent_fold_cached.cache_clear()
+        cached = _time(normalize.accent_fold, values, args.repeat)
+        print(
+            f"{label:<7} generic={generic * 1e3:8.2f}ms table={table * 1e3:8.2f}ms "
+            f"({generic / table:5.1f}x) cached={cached * 1e3:8.2f}ms ({generic / cached:5.1f}x)"
+        )
+    return 1 if mismatches else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
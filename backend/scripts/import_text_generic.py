@@ -42,8 +42,10 @@ from sqlalchemy.orm import sessionmaker
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.config import settings
+from app.core.shared_cache import bump_corpus_version
 from app.db.engine import create_asyncpg_engine
 from app.db.models import Language, SourceDoc, TextSegment, TextWork
+from app.ingestion.structure_index import rebuild_work_indexes
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 logger = logging.getLogger(__name__)
@@ -296,6 +298,8 @@ async def import_texts(
         # Update work segment count
         work.num_segments = inserted_count + skipped_count
         await session.commit()
+        await rebuild_work_indexes(session, work.id)
+        await bump_corpus_version()
 
         logger.info("\nImport complete!")
         logger.info(f"  Inserted: {inserted_count} segments")
@@ -32,6 +32,7 @@ if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
 from app.core.config import settings
+from app.core.shared_cache import bump_corpus_version
 from app.db.engine import create_asyncpg_engine
 from app.db.models import Language, SourceDoc, TextSegment, TextWork, Token
 from app.ingestion.sources.perseus import (
@@ -40,6 +41,8 @@ from app.ingestion.sources.perseus import (
     extract_stephanus_segments,
     read_tei,
 )
+from app.ingestion.structure_index import rebuild_work_indexes
+from app.ling.morph import refresh_morph_lexicon
 
 logging.basicConfig(level=logging.INFO, format="%(message)s")
 logger = logging.getLogger(__name__)
@@ -329,6 +332,7 @@ async def ingest_text(
                     tokens_count += 1
 
             await session.commit()
+            await rebuild_work_indexes(session, work.id)
 
             return {
                 "author": author,
@@ -422,6 +426,10 @@ async def main(args: argparse.Namespace) -> None:
                     logger.error(f"[{idx}/{len(texts)}] ❌ {tei_path.name}: {e}")
                     total_failed += 1
 
+        if total_ingested and not args.dry_run:
+            await refresh_morph_lexicon(session)
+            await bump_corpus_version()
+
         logger.info(f"\n{'='*60}")
         logger.info(f"Ingestion complete!")
         logger.info(f"  Ingested: {total_ingested}")
@@ -29,6 +29,7 @@ BACKEND_ROOT = CURRENT_DIR.parent.parent
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
+from app.core.shared_cache import bump_corpus_version  # noqa: E402
 from app.db.models import Language, SourceDoc, TextSegment, TextWork, Token  # noqa: E402
 from app.db.session import SessionLocal  # noqa: E402
 from app.ingestion.sources.perseus import (  # noqa: E402
@@ -37,6 +38,7 @@ from app.ingestion.sources.perseus import (  # noqa: E402
     extract_stephanus_segments,
     read_tei,
 )
+from app.ling.morph import refresh_morph_lexicon  # noqa: E402
 
 DATA_DIR = BACKEND_ROOT / "data"
 
@@ -113,7 +115,10 @@ class IngestionError(RuntimeError):
 
 
 async def ingest_work(session: AsyncSession, config: WorkConfig, *, dry_run: bool = False) -> dict:
-    """Ingest morphology tokens for a single work."""
+    """Ingest morphology tokens for a single work.
+
+    Callers refresh ``morph_lexicon`` and bump the corpus version once after the run.
+    """
 
     if not config.tei_path.exists():
         raise IngestionError(f"TEI file not found: {config.tei_path}")
@@ -281,12 +286,14 @@ async def _run(args: argparse.Namespace) -> None:
         configs = [WORKS[name] for name in selected]
 
     async with SessionLocal() as session:
+        ingested = 0
         for config in configs:
             try:
                 summary = await ingest_work(session, config, dry_run=args.dry_run)
             except IngestionError as exc:
                 print(f"[{config.key}] ❌ {exc}")
                 continue
+            ingested += 1
 
             unmatched = summary["unmatched"]
             status_icon = "🔍" if args.dry_run else "✅"
@@ -300,6 +307,11 @@ async def _run(args: argparse.Namespace) -> None:
                 suffix = "…" if len(unmatched) > 5 else ""
                 print(f"    ⚠️  Unmatched segments ({len(unmatched)}): {sample}{suffix}")
 
+        # One view refresh and cache bump for the whole run, not one per work
+        if ingested and not args.dry_run:
+            await refresh_morph_lexicon(session)
+            await bump_corpus_version()
+
 
 def main() -> None:
     args = _parse_args()
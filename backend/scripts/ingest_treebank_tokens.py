@@ -27,9 +27,11 @@ BACKEND_ROOT = CURRENT_DIR.parent.parent
 if str(BACKEND_ROOT) not in sys.path:
     sys.path.insert(0, str(BACKEND_ROOT))
 
+from app.core.shared_cache import bump_corpus_version  # noqa: E402
 from app.db.models import Language, SourceDoc, TextSegment, TextWork, Token  # noqa: E402
 from app.db.session import SessionLocal  # noqa: E402
 from app.ingestion.normalize import accent_fold, nfc  # noqa: E402
+from app.ling.morph import refresh_morph_lexicon  # noqa: E402
 
 DATA_DIR = BACKEND_ROOT / "data"
 
@@ -170,6 +172,8 @@ async def ingest_perseus_ud(session: AsyncSession) -> dict:
             await session.commit()
 
     await session.commit()
+    await refresh_morph_lexicon(session)
+    await bump_corpus_version()
     return {"source": "perseus-ud", "sentences": len(sentences), "tokens": tokens_inserted}
 
 
@@ -254,6 +258,8 @@ async def ingest_proiel(session: AsyncSession) -> dict:
         await session.commit()
         results.append({"source": slug, "sentences": len(sentences), "tokens": tokens_inserted})
 
+    await refresh_morph_lexicon(session)
+    await bump_corpus_version()
     return results
 
 
@@ -19,8 +19,10 @@ from sqlalchemy.orm import sessionmaker
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.config import settings
+from app.core.shared_cache import bump_corpus_version
 from app.db.engine import create_asyncpg_engine
 from app.db.models import Base, Language, SourceDoc, TextSegment, TextWork
+from app.ingestion.structure_index import rebuild_work_indexes
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -229,6 +231,11 @@ async def main():
         else:
             logger.error(f"[X] File not found: {json_path}")
 
+    # Rebuild the catalog/structure indexes and invalidate cached corpus responses
+    async with async_session() as session:
+        await rebuild_work_indexes(session)
+    await bump_corpus_version()
+
     await engine.dispose()
 
     logger.info("=" * 60)